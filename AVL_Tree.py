@@ -4,62 +4,83 @@ Theory:
     AVL trees is that the height difference of the left and right sub-tree at
     any node in the BST is at most 1. If the property is violated becasue of
     any changes (insertion/deletion) to the tree, the tree rebalances itself.
+
+next_node, previous_node and nearest_neighbours return None at the ends of
+the tree instead of printing, which is logged at DEBUG level.
 '''
 
-class Queue:
+if __package__:  # Imported as a submodule of the package
+    from . import Shared_utilities
+    from .Queue_array_implementation import Queue
+else:
+    import Shared_utilities
+    from Queue_array_implementation import Queue
+
+
+log_debug = Shared_utilities.debug_logger(__name__)
+
+
+class Node:
 
     '''
-    Helper class to implement level traversal
+    A node of the BST
     '''
 
-    def __init__(self):
-        self.queue = []
+    __slots__ = ('data', 'left', 'right', 'parent')
 
-    def enqueue(self, value):
+    def __init__(self, data):
+        self.data = data
+        self.left = None
+        self.right = None
+        self.parent = None
 
-        '''
-        Push the input value at the end of the queue
-        '''
 
-        self.queue.append(value)
+class NodePool(Shared_utilities.NodePool):
 
-    def dequeue(self):
+    '''
+    Pool of the Nodes above, see Shared_utilities.NodePool
+    '''
 
-        '''
-        Remove and output the element at the start of the queue
-        '''
-        return self.queue.pop(0)
+    node_class = Node
 
-    def is_empty(self):
+
+class AVLTree:
+
+    def __init__(self, pool=None):
 
         '''
-        Output boolean value for whether the queue is empty or not
+        Input:
+            pool (NodePool): Optional, pool to take nodes from and release
+                             deleted nodes to
         '''
 
-        if self.queue == []:
-            return True
+        self.root = None
+        self.size = 0
+        self.pool = pool
+        self.make_node = Node if pool is None else pool.new_node
 
-        else:
-            return False
+    def __len__(self):
+        return self.size
 
+    def __iter__(self):
 
-class Node:
+        '''
+        Generate the values in order, lazily
+        '''
 
-    '''
-    A node of the BST
-    '''
+        return self.iter_in_order()
 
-    def __init__(self, data):
-        self.data = data
-        self.left = None
-        self.right = None
-        self.parent = None
+    def __reversed__(self):
 
+        '''
+        Generate the values in reverse order, lazily
+        '''
 
-class AVLTree:
+        return self.iter_in_order(reverse=True)
 
-    def __init__(self):
-        self.root = None
+    def __contains__(self, key):
+        return (self.root is not None) and \
+            (self.find(key, self.root).data == key)
 
     def root_node(self):
 
@@ -310,7 +331,8 @@ class AVLTree:
             data (int/float): The data we want to insert
         '''
 
-        new_node = Node(data)
+        new_node = self.make_node(data)
+        self.size += 1
 
         if self.root is None:
             self.root = new_node
@@ -428,10 +450,118 @@ class AVLTree:
 
                 self.rebalance(parent_node)
 
+        self.size -= 1
         node.left = None
         node.right = None
         node.parent = None
         node.data = None
+        if self.pool is not None:
+            self.pool.release(node)
+
+    def iter_in_order(self, curr_node=None, reverse=False):
+
+        '''
+        Function:
+            Generator version of in_order_traversal. Yields the values of the
+            subtree in order (in reverse order if reverse is True), keeping
+            only the path to the current node on a stack
+        Input:
+            curr_node (Node): Root of the subtree. Optional, the root of the
+                                tree by default
+            reverse (bool): Whether to yield the values in reverse order
+        '''
+
+        node = self.root if curr_node is None else curr_node
+        stack = []
+
+        while stack or (node is not None):
+            if node is not None:
+                stack.append(node)
+                node = node.right if reverse else node.left
+
+            else:
+                node = stack.pop()
+                yield node.data
+                node = node.left if reverse else node.right
+
+    def iter_pre_order(self, curr_node=None):
+
+        '''
+        Function:
+            Generator version of pre_order_traversal
+        Input:
+            curr_node (Node): Root of the subtree. Optional, the root of the
+                                tree by default
+        '''
+
+        node = self.root if curr_node is None else curr_node
+        stack = [] if node is None else [node]
+
+        while stack:
+            node = stack.pop()
+            yield node.data
+
+            if node.right is not None:
+                stack.append(node.right)
+
+            if node.left is not None:
+                stack.append(node.left)
+
+    def iter_post_order(self, curr_node=None):
+
+        '''
+        Function:
+            Generator version of post_order_traversal
+        Input:
+            curr_node (Node): Root of the subtree. Optional, the root of the
+                                tree by default
+        '''
+
+        node = self.root if curr_node is None else curr_node
+        stack = []
+        last_node = None  # Last node yielded
+
+        while stack or (node is not None):
+            if node is not None:
+                stack.append(node)
+                node = node.left
+
+            else:
+                top_node = stack[-1]
+                if (top_node.right is not None) and \
+                        (top_node.right is not last_node):
+                    node = top_node.right
+
+                else:
+                    yield top_node.data
+                    last_node = stack.pop()
+
+    def iter_level_order(self, root_node=None):
+
+        '''
+        Function:
+            Generator version of level_traversal
+        Input:
+            root_node (Node): Root of the subtree. Optional, the root of the
+                                tree by default
+        '''
+
+        root_node = self.root if root_node is None else root_node
+        if root_node is None:
+            return
+
+        queue = Queue()
+        queue.enqueue(root_node)
+
+        while queue.is_empty() is False:
+            curr_node = queue.dequeue()
+            yield curr_node.data
+
+            if curr_node.left is not None:
+                queue.enqueue(curr_node.left)
+
+            if curr_node.right is not None:
+                queue.enqueue(curr_node.right)
 
     def in_order_traversal(self, curr_node):
 
@@ -448,13 +578,8 @@ class AVLTree:
         if curr_node is None:
             return
 
-        if curr_node.left is not None:
-            self.in_order_traversal(curr_node.left)
-
-        print(curr_node.data)
-
-        if curr_node.right is not None:
-            self.in_order_traversal(curr_node.right)
+        for data in self.iter_in_order(curr_node):
+            print(data)
 
     def pre_order_traversal(self, curr_node):
 
@@ -471,13 +596,8 @@ class AVLTree:
         if curr_node is None:
             return
 
-        print(curr_node.data)
-
-        if curr_node.left is not None:
-            self.pre_order_traversal(curr_node.left)
-
-        if curr_node.right is not None:
-            self.pre_order_traversal(curr_node.right)
+        for data in self.iter_pre_order(curr_node):
+            print(data)
 
     def post_order_traversal(self, curr_node):
 
@@ -494,13 +614,8 @@ class AVLTree:
         if curr_node is None:
             return
 
-        if curr_node.left is not None:
-            self.post_order_traversal(curr_node.left)
-
-        if curr_node.right is not None:
-            self.post_order_traversal(curr_node.right)
-
-        print(curr_node.data)
+        for data in self.iter_post_order(curr_node):
+            print(data)
 
     def level_traversal(self, root_node):
 
@@ -515,19 +630,8 @@ class AVLTree:
         if root_node is None:
             return
 
-        queue = Queue()
-        queue.enqueue(root_node)
-
-        while queue.is_empty() is False:
-
-            curr_node = queue.dequeue()
-            print(curr_node.data)
-
-            if curr_node.left is not None:
-                queue.enqueue(curr_node.left)
-
-            if curr_node.right is not None:
-                queue.enqueue(curr_node.right)
+        for data in self.iter_level_order(root_node):
+            print(data)
 
     def left_descendent(self, node):
 
@@ -573,15 +677,17 @@ class AVLTree:
         Input:
             node (Node): The node whose immediate next value we want find
         Output:
-            Returns the node corresponding to the immediate next value
+            Returns the node corresponding to the immediate next value. None
+            if the input is the largest element
         '''
 
         if node.right is not None:
             return self.left_descendent(node.right)
         else:
             if node.data == self.largest_element().data:
-                print('The input is the largest element of the tree!')
-                return
+                log_debug('%s is the largest element of the tree',
+                          node.data)
+                return None
             else:
                 return self.right_ancestor(node)
 
@@ -628,15 +734,17 @@ class AVLTree:
         Input:
             node (Node): The node whose immediate previous value we want find
         Output:
-            Returns the node corresponding to the immediate previous value
+            Returns the node corresponding to the immediate previous value.
+            None if the input is the smallest element
         '''
 
         if node.left is not None:
             return self.right_descendent(node.left)
         else:
             if node.data == self.smallest_element().data:
-                print('The input is the smallest element in the tree!')
-                return
+                log_debug('%s is the smallest element of the tree',
+                          node.data)
+                return None
             else:
                 return self.left_ancestor(node)
 
@@ -658,7 +766,7 @@ class AVLTree:
 
         curr_node = self.find(lower_limit, curr_node)
 
-        while curr_node.data <= upper_limit:
+        while curr_node is not None and curr_node.data <= upper_limit:
             if curr_node.data >= lower_limit:
                 range_list.append(curr_node.data)
 
@@ -674,159 +782,163 @@ class AVLTree:
         Input:
             node (Node): The node whose nearest neighbors we want to return
         Output:
-            List of the immediate previous and immediate next values
+            List of the immediate previous and immediate next values. None if
+            the input is the smallest or the largest element
         '''
 
-        if self.previous_node(node) is None:
-            print('The input is the smallest element in the tree!')
-            return
-        elif self.next_node(node) is None:
-            print('The input is the largest element in the tree!')
-            return
+        previous_node = self.previous_node(node)
+        next_node = self.next_node(node)
+
+        if previous_node is None or next_node is None:
+            return None
         else:
-            return [self.previous_node(node).data, self.next_node(node).data]
-
-tree = AVLTree()
-# Testing AVL Insert
-tree.insert('les')  # Creating a left heavy tree
-tree.insert('cathy')
-tree.insert('alex')
-root_node = tree.root_node()
-# Expected output of level traversal: cathy, alex, les
-tree.level_traversal(root_node)
-
-# Creating a left heavy tree of special case
-tree = AVLTree()
-tree.insert('les')  # Creating a left heavy tree
-tree.insert('cathy')
-tree.insert('frank')
-root_node = tree.root_node()
-# Expected output of level traversal: frank, cathy, les
-tree.level_traversal(root_node)
-
-# Creating a right heavy tree
-tree = AVLTree()
-tree.insert('les')  # Creating a left heavy tree
-tree.insert('sam')
-tree.insert('violet')
-root_node = tree.root_node()
-# Expected output of level traversal: sam, les, violet
-tree.level_traversal(root_node)
-
-# Creating a right heavy tree of special case
-tree = AVLTree()
-tree.insert('les')  # Creating a left heavy tree
-tree.insert('sam')
-tree.insert('nancy')
-root_node = tree.root_node()
-# Expected output of level traversal: nancy, les, sam
-tree.level_traversal(root_node)
-
-# Testing AVL delete
-tree = AVLTree()
-tree.insert('les')
-tree.insert('cathy')
-tree.insert('sam')
-tree.insert('frank')
-tree.insert('nancy')
-tree.insert('violet')
-tree.insert('tony')
-tree.insert('wendy')
-tree.insert('alex')
-root_node = tree.root_node()
-fl_AVL = tree.is_AVL_Tree()
-
-# Deleting 'cathy', expected output of level traversal:
-#   les, frank, sam, alex, nancy, violet, tony, wendy
-node_cathy = tree.find('cathy', root_node)
-tree.delete(node_cathy)
-root_node = tree.root_node()
-tree.level_traversal(root_node)
-# now if we delete 'frank' as well, the tree become unbalanced. After AVL
-#   rebalancing, the expected output of level traversal would be:
-#   sam, les, violet, alex, nancy, tony, wendy
-# Since the root_node could've changed
-node_frank = tree.find('frank', root_node)
-tree.delete(node_frank)
-root_node = tree.root_node()
-tree.level_traversal(root_node)
-
-# now if we delete violet, the output of level travesal would be:
-#   sam, les, wendy, alex, nancy, tom
-node_violet = tree.find('violet', root_node)
-tree.delete(node_violet)
-root_node = tree.root_node()
-tree.level_traversal(root_node)
-
-# now if we delete sam, the parent node gets removed. the output would be:
-#   tony, les, wendy, alex, nancy
-node_sam = tree.find('sam', root_node)
-tree.delete(node_sam)
-root_node = tree.root_node()
-tree.level_traversal(root_node)
-
-# Testing other functions
-tree = AVLTree()
-tree.insert('les')
-tree.insert('cathy')
-tree.insert('sam')
-tree.insert('frank')
-tree.insert('nancy')
-tree.insert('violet')
-tree.insert('tony')
-tree.insert('wendy')
-tree.insert('alex')
-root_node = tree.root_node()
-
-height_tree = tree.height(root_node)
-print(root_node.data)
-largest_element_node = tree.largest_element()
-print(largest_element_node.data)
-tree.in_order_traversal(root_node)
-tree.pre_order_traversal(root_node)
-tree.post_order_traversal(root_node)
-tree.level_traversal(root_node)
-# Testing next node function. Expected outputs: sam -> tony, les-> nancy,
-#   frank -> les, wendy -> print message (largest element)
-node_sam = tree.find('sam', root_node)
-print(node_sam.data)
-node_sam_next = tree.next_node(node_sam)
-print(node_sam_next.data)
-node_les = tree.find('les', root_node)
-print(node_les.data)
-node_les_next = tree.next_node(node_les)
-print(node_les_next.data)
-node_frank = tree.find('frank', root_node)
-print(node_frank.data)
-node_frank_next = tree.next_node(node_frank)
-print(node_frank_next.data)
-node_wendy = tree.find('wendy', root_node)
-print(node_wendy.data)
-node_wendy_next = tree.next_node(node_wendy)
-
-range_list = tree.range_search('e', 'u', root_node)
-print(range_list)
-
-# Testing previous node function. Expected outputs: cathy -> alex,
-#    wendy-> violet, frank -> cathy, alex -> print message (smallest element)
-node_cathy = tree.find('cathy', root_node)
-print(node_cathy.data)
-node_cathy_prev = tree.previous_node(node_cathy)
-print(node_cathy_prev.data)
-
-node_wendy = tree.find('wendy', root_node)
-print(node_wendy.data)
-node_wendy_prev = tree.previous_node(node_wendy)
-print(node_wendy_prev.data)
-
-node_frank = tree.find('frank', root_node)
-print(node_frank.data)
-node_frank_prev = tree.previous_node(node_frank)
-print(node_frank_prev.data)
-
-node_alex = tree.find('alex', root_node)
-print(node_alex.data)
-node_alex_prev = tree.previous_node(node_alex)
-
-nearest_neighbors = tree.nearest_neighbours(node_frank)
-print(nearest_neighbors)
+            return [previous_node.data, next_node.data]
+
+
+if __name__ == '__main__':
+    tree = AVLTree()
+    # Testing AVL Insert
+    tree.insert('les')  # Creating a left heavy tree
+    tree.insert('cathy')
+    tree.insert('alex')
+    root_node = tree.root_node()
+    # Expected output of level traversal: cathy, alex, les
+    tree.level_traversal(root_node)
+
+    # Creating a left heavy tree of special case
+    tree = AVLTree()
+    tree.insert('les')  # Creating a left heavy tree
+    tree.insert('cathy')
+    tree.insert('frank')
+    root_node = tree.root_node()
+    # Expected output of level traversal: frank, cathy, les
+    tree.level_traversal(root_node)
+
+    # Creating a right heavy tree
+    tree = AVLTree()
+    tree.insert('les')  # Creating a left heavy tree
+    tree.insert('sam')
+    tree.insert('violet')
+    root_node = tree.root_node()
+    # Expected output of level traversal: sam, les, violet
+    tree.level_traversal(root_node)
+
+    # Creating a right heavy tree of special case
+    tree = AVLTree()
+    tree.insert('les')  # Creating a left heavy tree
+    tree.insert('sam')
+    tree.insert('nancy')
+    root_node = tree.root_node()
+    # Expected output of level traversal: nancy, les, sam
+    tree.level_traversal(root_node)
+
+    # Testing AVL delete
+    tree = AVLTree()
+    tree.insert('les')
+    tree.insert('cathy')
+    tree.insert('sam')
+    tree.insert('frank')
+    tree.insert('nancy')
+    tree.insert('violet')
+    tree.insert('tony')
+    tree.insert('wendy')
+    tree.insert('alex')
+    root_node = tree.root_node()
+    fl_AVL = tree.is_AVL_Tree()
+
+    # Deleting 'cathy', expected output of level traversal:
+    #   les, frank, sam, alex, nancy, violet, tony, wendy
+    node_cathy = tree.find('cathy', root_node)
+    tree.delete(node_cathy)
+    root_node = tree.root_node()
+    tree.level_traversal(root_node)
+    # now if we delete 'frank' as well, the tree become unbalanced. After AVL
+    #   rebalancing, the expected output of level traversal would be:
+    #   sam, les, violet, alex, nancy, tony, wendy
+    # Since the root_node could've changed
+    node_frank = tree.find('frank', root_node)
+    tree.delete(node_frank)
+    root_node = tree.root_node()
+    tree.level_traversal(root_node)
+
+    # now if we delete violet, the output of level travesal would be:
+    #   sam, les, wendy, alex, nancy, tom
+    node_violet = tree.find('violet', root_node)
+    tree.delete(node_violet)
+    root_node = tree.root_node()
+    tree.level_traversal(root_node)
+
+    # now if we delete sam, the parent node gets removed. the output would be:
+    #   tony, les, wendy, alex, nancy
+    node_sam = tree.find('sam', root_node)
+    tree.delete(node_sam)
+    root_node = tree.root_node()
+    tree.level_traversal(root_node)
+
+    # Testing other functions
+    tree = AVLTree()
+    tree.insert('les')
+    tree.insert('cathy')
+    tree.insert('sam')
+    tree.insert('frank')
+    tree.insert('nancy')
+    tree.insert('violet')
+    tree.insert('tony')
+    tree.insert('wendy')
+    tree.insert('alex')
+    root_node = tree.root_node()
+
+    height_tree = tree.height(root_node)
+    print(root_node.data)
+    largest_element_node = tree.largest_element()
+    print(largest_element_node.data)
+    tree.in_order_traversal(root_node)
+    tree.pre_order_traversal(root_node)
+    tree.post_order_traversal(root_node)
+    tree.level_traversal(root_node)
+    # Testing next node function. Expected outputs: sam -> tony, les-> nancy,
+    #   frank -> les, wendy -> None (largest element)
+    node_sam = tree.find('sam', root_node)
+    print(node_sam.data)
+    node_sam_next = tree.next_node(node_sam)
+    print(node_sam_next.data)
+    node_les = tree.find('les', root_node)
+    print(node_les.data)
+    node_les_next = tree.next_node(node_les)
+    print(node_les_next.data)
+    node_frank = tree.find('frank', root_node)
+    print(node_frank.data)
+    node_frank_next = tree.next_node(node_frank)
+    print(node_frank_next.data)
+    node_wendy = tree.find('wendy', root_node)
+    print(node_wendy.data)
+    node_wendy_next = tree.next_node(node_wendy)
+    print(node_wendy_next)
+
+    range_list = tree.range_search('e', 'u', root_node)
+    print(range_list)
+
+    # Testing previous node function. Expected outputs: cathy -> alex,
+    #    wendy-> violet, frank -> cathy, alex -> None (smallest element)
+    node_cathy = tree.find('cathy', root_node)
+    print(node_cathy.data)
+    node_cathy_prev = tree.previous_node(node_cathy)
+    print(node_cathy_prev.data)
+
+    node_wendy = tree.find('wendy', root_node)
+    print(node_wendy.data)
+    node_wendy_prev = tree.previous_node(node_wendy)
+    print(node_wendy_prev.data)
+
+    node_frank = tree.find('frank', root_node)
+    print(node_frank.data)
+    node_frank_prev = tree.previous_node(node_frank)
+    print(node_frank_prev.data)
+
+    node_alex = tree.find('alex', root_node)
+    print(node_alex.data)
+    node_alex_prev = tree.previous_node(node_alex)
+    print(node_alex_prev)
+
+    nearest_neighbors = tree.nearest_neighbours(node_frank)
+    print(nearest_neighbors)
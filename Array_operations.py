@@ -17,9 +17,43 @@ Space and time complexities (n = number of elements):
     11. Set the value at an index: O(1)
     12. Get length of the list: O(1)
 
-    List is the in-built implementation of arrays in Python
+    List is the in-built implementation of arrays in Python. A list only
+    stores pointers to the values, each of which is a separate Python object.
+    If a typecode (see the array module) is given, the values are instead
+    stored unboxed in a contiguous array.array buffer i.e. 8 bytes per value
+    for typecode 'q' or 'd'. The buffer can be handed to other code (eg.
+    numpy.frombuffer) without copying through the buffer protocol
+
+For workloads which insert and delete at the start or in the middle, two
+alternative backends keep the same methods as Array:
+    1. GapBufferArray: the values sit on both sides of a gap of free slots
+        placed at the last edited position (the cursor). Inserting or
+        deleting at the cursor is O(1) amortized, moving the cursor by d
+        positions costs O(d)
+    2. ChunkedArray: the values are split into chunks of at most
+        2*chunk_size values. A Fenwick tree over the chunk lengths finds the
+        chunk holding an index in O(log(n)). Inserting or deleting anywhere
+        costs O(log(n) + chunk_size), except when a chunk is split, merged or
+        removed: the tree is then rebuilt in O(n/chunk_size). That's the
+        worst case O(chunk_size + n/chunk_size), lowest for chunk_size around
+        sqrt(n). Splits only happen every chunk_size or so inserts into a
+        chunk, so the rebuilds cost O(n/chunk_size**2) amortized per insert
+
+The methods don't print anything except print_all_elements. Diagnostic
+messages go to the module's logger, silent unless enabled with eg.
+logging.basicConfig(level=logging.DEBUG).
 '''
 
+from array import array as typed_array
+
+if __package__:  # Imported as a submodule of the package
+    from . import Shared_utilities
+else:
+    import Shared_utilities
+
+
+log_debug = Shared_utilities.debug_logger(__name__)
+
 
 class Array:
 
@@ -27,8 +61,29 @@ class Array:
     Array operations when input type is int
     '''
 
-    def __init__(self):
-        self.array = []
+    def __init__(self, typecode=None):
+        self.typecode = typecode
+
+        if typecode is None:
+            self.array = []
+        else:
+            self.array = typed_array(typecode)
+
+    def __len__(self):
+        return len(self.array)
+
+    def __buffer__(self, flags):  # Python 3.12+, see buffer for older ones
+        return self.buffer()
+
+    def buffer(self):
+
+        '''
+        Function:
+            Return a zero-copy memoryview of the underlying buffer. Only
+            available for typed arrays
+        '''
+
+        return memoryview(self.array)
 
     def get_length(self):
 
@@ -37,13 +92,7 @@ class Array:
             Returns the length of the array
         '''
 
-        if self.array == []:
-            print('The array is empty!')
-            return
-
-        else:
-            print('The length of the array is: ' + str(len(self.array)))
-            return len(self.array)
+        return len(self)
 
     def insert_element_at_end(self, value):
 
@@ -83,32 +132,107 @@ class Array:
 
         self.array.insert(index, value)
 
-    def search_key(self, key):
+    def delete_element_at_index(self, index):
 
         '''
         Function:
-            Search if a key is present. If yes, print its count.
+            Delete the value at the input index, shifting the ones after it
+        Input:
+            index (int): The index whose value we want to delete
+        '''
+
+        del self.array[index]
+
+    def extend(self, values):
+
+        '''
+        Function:
+            Insert all the input values at the end of the array
+        Input:
+            values (iterable): The values we want to insert. An array.array of
+                                the same typecode is copied over in one go
+        '''
+
+        self.array.extend(values)
+
+    def count(self, key):
+
+        '''
+        Function:
+            Return the number of times the input key occurs in the array. The
+            scan is done by the list/array.array count, without a Python loop
+        Input:
+            key (int): The value we want to count
+        '''
+
+        return self.array.count(key)
+
+    def find_all(self, key):
+
+        '''
+        Function:
+            Return the indexes at which the input key occurs in the array.
+            The scan between two occurrences is done by list/array.array index
         Input:
             key (int): The value we want to search for
+        Output:
+            list_indexes (list): The indexes in increasing order
         '''
 
-        if self.array == []:
-            print('The array is empty!')
-            return
+        list_indexes = []
+        idx = 0
 
-        count = 0
-        fl_found = 0
+        try:
+            while True:
+                idx = self.array.index(key, idx)
+                list_indexes.append(idx)
+                idx += 1
 
-        for element in self.array:
-            if element == key:
-                fl_found = 1
-                count += 1
+        except ValueError:
+            return list_indexes
 
-        if fl_found == 1:
-            print(str(key) + ' occurs ' + str(count) + ' times in the array!')
+    def delete_all(self, key):
 
-        else:
-            print(str(key) + ' not found in the array!')
+        '''
+        Function:
+            Delete all instances of an input key from the array. The values in
+            between two instances are copied over as slices
+        Input:
+            key (int): The value we want to delete from the array
+        Output:
+            The number of values deleted
+        '''
+
+        list_indexes = self.find_all(key)
+
+        if list_indexes == []:
+            return 0
+
+        kept = self.array[: list_indexes[0]]
+
+        for idx, next_idx in zip(list_indexes, list_indexes[1:]):
+            kept.extend(self.array[idx + 1: next_idx])
+
+        kept.extend(self.array[list_indexes[-1] + 1:])
+        self.array = kept
+
+        return len(list_indexes)
+
+    def search_key(self, key):
+
+        '''
+        Function:
+            Count the occurrences of a key
+        Input:
+            key (int): The value we want to search for
+        Output:
+            count (int): Number of times the key occurs
+        '''
+
+        count = self.count(key)
+        log_debug('%s occurs %d times in the array', key, count)
+
+        return count
 
     def delete_key_if_present(self, key):
 
@@ -119,18 +243,18 @@ class Array:
             key (int): The value we want to delete from the array
         '''
 
-        self.array = list(filter(lambda value: value != key, self.array))
+        self.delete_all(key)
 
     def fetch_value_at_index(self, idx):
 
         '''
         Function:
-            Print the value present at the input index
+            Return the value present at the input index
         Input:
-            idx (int): The index whose value we want to print
+            idx (int): The index whose value we want
         '''
 
-        print('The value at index ' + str(idx) + ' is ' + str(self.array[idx]))
+        return self.array[idx]
 
     def set_value_at_index(self, idx, value):
 
@@ -149,28 +273,614 @@ class Array:
         for element in self.array:
             print(element, end=' ')
 
-# Running the commands
-array = Array()
-# Check if the array is empty. If not empty return the length of the array
-array.get_length()
-# Lets populate the array with a few integers.
-array.insert_element_at_end(56)
-array.insert_element_at_end(21)
-array.insert_element_at_end(19)
-array.insert_element_at_end(79)
-array.insert_element_at_end(67)
-array.print_all_elements()
-array.insert_element_at_start(33)
-array.print_all_elements()
-array.insert_element_at_given_index(2, 777)
-array.print_all_elements()
-array.search_key(41)
-array.search_key(777)
-array.delete_key_if_present(22)
-array.print_all_elements()
-array.delete_key_if_present(19)
-array.print_all_elements()
-array.fetch_value_at_index(4)
-array.set_value_at_index(5, -90)
-array.print_all_elements()
-array.get_length()
+
+class GapBufferArray(Array):
+
+    '''
+    Array stored as a gap buffer. self.storage holds the values at
+    [0, gap_start) and [gap_end, capacity), the slots in between are free
+    '''
+
+    def __init__(self, typecode=None, capacity=16):
+        self.typecode = typecode
+        self.storage = self.new_storage(max(capacity, 1))
+        self.gap_start = 0
+        self.gap_end = len(self.storage)
+
+    def new_storage(self, capacity):
+
+        '''
+        Return a list (or array.array for typed arrays) of capacity free slots
+        '''
+
+        if self.typecode is None:
+            return [None]*capacity
+
+        return typed_array(self.typecode, [0])*capacity
+
+    def __len__(self):
+        return len(self.storage) - (self.gap_end - self.gap_start)
+
+    def move_gap(self, index):
+
+        '''
+        Function:
+            Move the gap so that it starts at the input index. The values in
+            between are moved over to the other side of the gap as a slice
+        Input:
+            index (int): The new cursor position
+        '''
+
+        if index < self.gap_start:
+            shift = self.gap_start - index
+            self.storage[self.gap_end - shift: self.gap_end] = \
+                self.storage[index: self.gap_start]
+            self.gap_start = index
+            self.gap_end -= shift
+
+        elif index > self.gap_start:
+            shift = index - self.gap_start
+            self.storage[self.gap_start: index] = \
+                self.storage[self.gap_end: self.gap_end + shift]
+            self.gap_start = index
+            self.gap_end += shift
+
+    def grow(self):
+
+        '''
+        Function:
+            Double the capacity. The new free slots are added to the gap
+        '''
+
+        capacity = len(self.storage)
+        after_gap = self.storage[self.gap_end:]
+        self.storage = self.storage[: self.gap_start] + \
+            self.new_storage(capacity) + after_gap
+        self.gap_end = len(self.storage) - len(after_gap)
+
+    def check_index(self, index):
+
+        '''
+        Raise an IndexError if the index is out of range. Negative indexes
+        count from the end like for lists
+        '''
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError('array index out of range')
+
+        return index
+
+    def insert_element_at_end(self, value):
+        self.insert_element_at_given_index(len(self), value)
+
+    def insert_element_at_start(self, value):
+        self.insert_element_at_given_index(0, value)
+
+    def insert_element_at_given_index(self, index, value):
+
+        '''
+        Function:
+            Insert a new value at the input index. The cursor moves past it
+        Input:
+            index (int): The index at which we want to insert the new value
+            value (int): The new value we want to insert
+        '''
+
+        index = min(max(index + len(self) if index < 0 else index, 0),
+                    len(self))
+
+        if self.gap_start == self.gap_end:
+            self.grow()
+
+        self.move_gap(index)
+        self.storage[self.gap_start] = value
+        self.gap_start += 1
+
+    def delete_element_at_index(self, index):
+
+        '''
+        Function:
+            Delete the value at the input index. The cursor moves to it
+        Input:
+            index (int): The index whose value we want to delete
+        '''
+
+        self.move_gap(self.check_index(index))
+
+        if self.typecode is None:
+            self.storage[self.gap_end] = None  # Let go of the value
+
+        self.gap_end += 1
+
+    def extend(self, values):
+        for value in values:
+            self.insert_element_at_end(value)
+
+    def count(self, key):
+        return self.storage[: self.gap_start].count(key) + \
+            self.storage[self.gap_end:].count(key)
+
+    def find_all(self, key):
+
+        list_indexes = []
+        gap_size = self.gap_end - self.gap_start
+
+        for low, high in ((0, self.gap_start),
+                          (self.gap_end, len(self.storage))):
+            idx = low
+
+            try:
+                while True:
+                    idx = self.storage.index(key, idx, high)
+                    list_indexes.append(idx if idx < self.gap_start
+                                        else idx - gap_size)
+                    idx += 1
+
+            except ValueError:
+                pass
+
+        return list_indexes
+
+    def delete_all(self, key):
+
+        num_values = len(self)
+        self.move_gap(num_values)  # All the values are now before the gap
+        values = self.storage[: num_values]
+        array = Array(self.typecode)
+        array.array = values
+        count = array.delete_all(key)
+
+        kept = array.array
+        self.storage = kept + self.new_storage(len(self.storage) - len(kept))
+        self.gap_start = len(kept)
+        self.gap_end = len(self.storage)
+
+        return count
+
+    def fetch_value_at_index(self, idx):
+
+        idx = self.check_index(idx)
+        value = self.storage[idx if idx < self.gap_start else
+                             idx + self.gap_end - self.gap_start]
+        return value
+
+    def set_value_at_index(self, idx, value):
+
+        idx = self.check_index(idx)
+        self.storage[idx if idx < self.gap_start else
+                     idx + self.gap_end - self.gap_start] = value
+
+    def buffer(self):
+
+        '''
+        Function:
+            Move the gap to the end and return a zero-copy memoryview of the
+            values. Only available for typed arrays
+        '''
+
+        self.move_gap(len(self))
+
+        return memoryview(self.storage)[: self.gap_start]
+
+    def print_all_elements(self):
+
+        for element in self.storage[: self.gap_start]:
+            print(element, end=' ')
+
+        for element in self.storage[self.gap_end:]:
+            print(element, end=' ')
+
+
+class ChunkedArray(Array):
+
+    '''
+    Array stored as a list of chunks, with a Fenwick tree (binary indexed
+    tree) over the chunk lengths. This is a simplification of the usual
+    O(log(n)) chunk index (an order-statistic tree or a rope), which also
+    keeps splits and merges O(log(n)). A Fenwick tree is a flat list, cheaper
+    to walk in Python, but it can't follow the chunk numbers shifting when a
+    chunk is split, merged or removed, so it's rebuilt (lazily, on the next
+    lookup) in O(n/chunk_size) after those. The real costs are:
+        1. Fetch/set a value: O(log(n/chunk_size))
+        2. Insert/delete without a split or merge: O(log(n) + chunk_size)
+        3. Insert/delete with a split or merge: O(chunk_size + n/chunk_size)
+        4. Insert at the same place, amortized: O(log(n) + chunk_size +
+            n/chunk_size**2), since a chunk splits every chunk_size inserts
+    See benchmark_chunked_array for the rebuild cost against n
+    '''
+
+    def __init__(self, typecode=None, chunk_size=512):
+        self.typecode = typecode
+        self.chunk_size = chunk_size
+        self.chunks = []
+        self.size = 0
+        self.tree = None
+
+    def new_chunk(self, values=()):
+
+        '''
+        Return a list (or array.array for typed arrays) with the input values
+        '''
+
+        if self.typecode is None:
+            return list(values)
+
+        return typed_array(self.typecode, values)
+
+    def __len__(self):
+        return self.size
+
+    def build_tree(self):
+
+        '''
+        Function:
+            Build the Fenwick tree over the chunk lengths in O(#chunks). The
+            slot i (1-based) holds the total length of the chunks
+            (i - (i & -i), i]
+        '''
+
+        num_chunks = len(self.chunks)
+        self.tree = [0] + [len(chunk) for chunk in self.chunks]
+
+        for i in range(1, num_chunks + 1):
+            parent = i + (i & -i)
+            if parent <= num_chunks:
+                self.tree[parent] += self.tree[i]
+
+    def update_tree(self, chunk_idx, delta):
+
+        '''
+        Add delta to the length of the chunk number chunk_idx in the tree
+        '''
+
+        if self.tree is None:
+            return
+
+        i = chunk_idx + 1
+
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def locate(self, index):
+
+        '''
+        Function:
+            Find the chunk which holds the input index, in O(log(#chunks))
+        Input:
+            index (int): 0 <= index <= len(self). len(self) maps to the end of
+                            the last chunk
+        Output:
+            (chunk_idx, offset) (tuple): Position of the index
+        '''
+
+        if index == self.size:
+            return len(self.chunks) - 1, len(self.chunks[-1])
+
+        if self.tree is None:
+            self.build_tree()
+
+        chunk_idx = 0
+        bit = 1 << (len(self.chunks).bit_length() - 1)
+
+        while bit > 0:
+            next_idx = chunk_idx + bit
+            if (next_idx < len(self.tree)) and (self.tree[next_idx] <= index):
+                chunk_idx = next_idx
+                index -= self.tree[next_idx]
+
+            bit >>= 1
+
+        return chunk_idx, index
+
+    def check_index(self, index):
+
+        if index < 0:
+            index += self.size
+
+        if not 0 <= index < self.size:
+            raise IndexError('array index out of range')
+
+        return index
+
+    def insert_element_at_end(self, value):
+        self.insert_element_at_given_index(self.size, value)
+
+    def insert_element_at_start(self, value):
+        self.insert_element_at_given_index(0, value)
+
+    def insert_element_at_given_index(self, index, value):
+
+        '''
+        Function:
+            Insert a new value at the input index. A chunk that gets longer
+            than 2*chunk_size is split in two
+        Input:
+            index (int): The index at which we want to insert the new value
+            value (int): The new value we want to insert
+        '''
+
+        index = min(max(index + self.size if index < 0 else index, 0),
+                    self.size)
+
+        if self.chunks == []:
+            self.chunks.append(self.new_chunk([value]))
+            self.size = 1
+            self.tree = None
+            return
+
+        chunk_idx, offset = self.locate(index)
+        chunk = self.chunks[chunk_idx]
+        chunk.insert(offset, value)
+        self.size += 1
+
+        if len(chunk) > 2*self.chunk_size:
+            self.chunks[chunk_idx: chunk_idx + 1] = [chunk[: self.chunk_size],
+                                                     chunk[self.chunk_size:]]
+            self.tree = None
+
+        else:
+            self.update_tree(chunk_idx, 1)
+
+    def delete_element_at_index(self, index):
+
+        '''
+        Function:
+            Delete the value at the input index. A chunk that gets shorter
+            than chunk_size/2 is merged with the next one
+        Input:
+            index (int): The index whose value we want to delete
+        '''
+
+        chunk_idx, offset = self.locate(self.check_index(index))
+        chunk = self.chunks[chunk_idx]
+        del chunk[offset]
+        self.size -= 1
+
+        if len(chunk) == 0:
+            del self.chunks[chunk_idx]
+            self.tree = None
+
+        elif (len(chunk) < self.chunk_size//2) and \
+                (chunk_idx + 1 < len(self.chunks)):
+            chunk.extend(self.chunks.pop(chunk_idx + 1))
+            if len(chunk) > 2*self.chunk_size:
+                self.chunks[chunk_idx: chunk_idx + 1] = \
+                    [chunk[: self.chunk_size], chunk[self.chunk_size:]]
+
+            self.tree = None
+
+        else:
+            self.update_tree(chunk_idx, -1)
+
+    def extend(self, values):
+
+        '''
+        Function:
+            Insert all the input values at the end, in new chunks of
+            chunk_size values once the last chunk is full
+        '''
+
+        for value in values:
+            if (self.chunks == []) or \
+                    (len(self.chunks[-1]) >= self.chunk_size):
+                self.chunks.append(self.new_chunk())
+                self.tree = None
+
+            self.chunks[-1].append(value)
+            self.size += 1
+            self.update_tree(len(self.chunks) - 1, 1)
+
+    def count(self, key):
+        return sum(chunk.count(key) for chunk in self.chunks)
+
+    def find_all(self, key):
+
+        list_indexes = []
+        start = 0
+
+        for chunk in self.chunks:
+            idx = 0
+
+            try:
+                while True:
+                    idx = chunk.index(key, idx)
+                    list_indexes.append(start + idx)
+                    idx += 1
+
+            except ValueError:
+                start += len(chunk)
+
+        return list_indexes
+
+    def delete_all(self, key):
+
+        count = 0
+        kept_chunks = []
+
+        for chunk in self.chunks:
+            if chunk.count(key) > 0:
+                kept = self.new_chunk(value for value in chunk if value != key)
+                count += len(chunk) - len(kept)
+                chunk = kept
+
+            if len(chunk) > 0:
+                kept_chunks.append(chunk)
+
+        self.chunks = kept_chunks
+        self.size -= count
+        self.tree = None
+
+        return count
+
+    def fetch_value_at_index(self, idx):
+
+        idx = self.check_index(idx)
+        chunk_idx, offset = self.locate(idx)
+        value = self.chunks[chunk_idx][offset]
+        return value
+
+    def set_value_at_index(self, idx, value):
+
+        chunk_idx, offset = self.locate(self.check_index(idx))
+        self.chunks[chunk_idx][offset] = value
+
+    def buffer(self):
+
+        '''
+        Function:
+            Return a memoryview of all the values. The chunks are copied into
+            one contiguous array first. Only available for typed arrays
+        '''
+
+        values = self.new_chunk()
+        for chunk in self.chunks:
+            values.extend(chunk)
+
+        return memoryview(values)
+
+    def print_all_elements(self):
+
+        for chunk in self.chunks:
+            for element in chunk:
+                print(element, end=' ')
+
+
+def benchmark_get_length(n=1000000):
+
+    '''
+    Function:
+        Measure the number of get_length calls per second, against the former
+        version which printed the length. Its output goes to os.devnull here,
+        printing to a terminal is much slower still
+    Output:
+        dict_throughput (dict): Calls per second for each version
+    '''
+
+    from contextlib import redirect_stdout
+    from os import devnull
+    from timeit import timeit
+
+    array = Array()
+    array.extend(range(100))
+
+    def printing_get_length():
+        print('The length of the array is: ' + str(len(array)))
+        return len(array)
+
+    dict_throughput = {}
+
+    with open(devnull, 'w') as null_file, redirect_stdout(null_file):
+        for name, get_length in (('printing', printing_get_length),
+                                 ('current', array.get_length)):
+            dict_throughput[name] = n/timeit(get_length, number=n)
+
+    for name, throughput in dict_throughput.items():
+        print('get_length, ' + name + ': ' + str(int(throughput)) +
+              ' calls/s')
+
+    return dict_throughput
+
+
+def benchmark_chunked_array(sizes=(10**4, 10**5, 10**6), num_inserts=10000,
+                            chunk_size=512):
+
+    '''
+    Function:
+        Compare Array and ChunkedArray on num_inserts inserts at random
+        indexes and at the middle of arrays of the input sizes. Inserting at
+        the middle splits a chunk every chunk_size inserts, so it includes
+        the Fenwick tree rebuilds, which are also timed on their own
+    Input:
+        sizes (iterable): Array sizes to try
+        num_inserts (int): Number of inserts per size and workload
+        chunk_size (int): chunk_size of the ChunkedArray
+    Output:
+        dict_timings (dict): Seconds per insert (resp. per rebuild) for each
+                                (size, workload)
+    '''
+
+    from random import randint
+    from timeit import timeit
+
+    dict_timings = {}
+
+    for size in sizes:
+        indexes = [randint(0, size) for i in range(num_inserts)]
+        middle = [size//2]*num_inserts
+        dict_arrays = {'Array': Array,
+                       'ChunkedArray': lambda: ChunkedArray(
+                           chunk_size=chunk_size)}
+
+        for name, new_array in dict_arrays.items():
+            for workload, list_index in (('random', indexes),
+                                         ('middle', middle)):
+                array = new_array()
+                array.extend(range(size))
+                array.fetch_value_at_index(0)  # Build the tree beforehand
+                insert = array.insert_element_at_given_index
+                timing = timeit(lambda: [insert(index, 0)
+                                         for index in list_index],
+                                number=1)/num_inserts
+                dict_timings[(size, name + ', ' + workload)] = timing
+
+        # array is the ChunkedArray of the last workload here
+        dict_timings[(size, 'ChunkedArray, rebuild')] = \
+            timeit(array.build_tree, number=10)/10
+
+        for (timing_size, name), timing in dict_timings.items():
+            if timing_size == size:
+                print(str(size) + ', ' + name + ': ' +
+                      str(round(timing*1e6, 3)) + 'us')
+
+    return dict_timings
+
+
+if __name__ == '__main__':
+    # Running the commands
+    array = Array()
+    # Check if the array is empty. If not empty return the length of the array
+    print(array.get_length())
+    # Lets populate the array with a few integers.
+    array.insert_element_at_end(56)
+    array.insert_element_at_end(21)
+    array.insert_element_at_end(19)
+    array.insert_element_at_end(79)
+    array.insert_element_at_end(67)
+    array.print_all_elements()
+    array.insert_element_at_start(33)
+    array.print_all_elements()
+    array.insert_element_at_given_index(2, 777)
+    array.print_all_elements()
+    print(array.search_key(41))
+    print(array.search_key(777))
+    array.delete_key_if_present(22)
+    array.print_all_elements()
+    array.delete_key_if_present(19)
+    array.print_all_elements()
+    print(array.fetch_value_at_index(4))
+    array.set_value_at_index(5, -90)
+    array.print_all_elements()
+    print(array.get_length())
+
+    # Typed array, storing the values unboxed
+    array = Array(typecode='q')
+    array.extend([56, 21, 19, 56, 79, 56])
+    # Expected output: 3, [0, 3, 5], 3, [21, 19, 79]
+    print(array.count(56), array.find_all(56), array.delete_all(56),
+          array.buffer().tolist())
+
+    # Same operations on the alternative backends
+    for array in [GapBufferArray(), ChunkedArray(chunk_size=2)]:
+        array.extend([56, 21, 19, 79, 67])
+        array.insert_element_at_start(33)
+        array.insert_element_at_given_index(2, 777)
+        array.delete_element_at_index(3)
+        # Expected output: 33 56 777 19 79 67
+        array.print_all_elements()
+
+    benchmark_get_length(n=100000)
+    benchmark_chunked_array(sizes=(10**4, 10**5), num_inserts=2000)
@@ -159,11 +159,11 @@ class BinaryMinHeap:
             isn't violdated
         Input:
             dict_key (dict): Element mapped to its priority value. Eg. {'A': 5}
+            Raises IndexError if the heap is already at max capacity
         '''
 
         if self.size == self.max_size:
-            print('Heap already at max capacity!')
-            return
+            raise IndexError('Heap already at max capacity!')
 
         self.size += 1
         self.heap.append(list(dict_key.values())[0])
@@ -254,30 +254,32 @@ class BinaryMinHeap:
     def print_heap(self):
         print(self.heap)
 
-# Building a heap
-heap = BinaryMinHeap(max_size=15)
-dict_mapping = {'A': 76, 'B': 90, 'C': 113, 'D': 15, 'E': -7, 'F': 36,
-                'G': 64, 'H': 20}
-array = list(dict_mapping.values())
-heap.build_heap(dict_mapping)
-# Expected output: -7, 15, 36, 20, 90, 113, 64, 76
-heap.print_heap()
-
-# Inserting 17. Expected Output: -7, 15, 36, 17, 90, 113, 64, 76, 20
-heap.insert({'P': 17})
-heap.print_heap()
-# Removing the root: -7. Expected output: 15, 17, 36, 20, 90, 133, 64, 76
-heap.remove(0)  # Input is the index of the element to be removed
-heap.print_heap()
-
-heap.get_min()  # 15
-# Changing 17 to 186, Expected output: 15, 20, 36, 76, 90, 113, 64, 186
-heap.change_priority(idx=1, new_key=186)
-heap.print_heap()
-# Changing 15 to 39, Expected output: 20, 39, 36, 76, 90, 113, 64, 186
-heap.change_priority(idx=0, new_key=39)
-heap.print_heap()
-
-# Expected dict_mapping: {'A' : 76, 'B' : 90, 'C' : 113, 'D' : 39, 'F' : 36,
-#                'G' : 64, 'H' : 20, 'P' : 186}
-print(heap.dict_mapping)
+
+if __name__ == '__main__':
+    # Building a heap
+    heap = BinaryMinHeap(max_size=15)
+    dict_mapping = {'A': 76, 'B': 90, 'C': 113, 'D': 15, 'E': -7, 'F': 36,
+                    'G': 64, 'H': 20}
+    array = list(dict_mapping.values())
+    heap.build_heap(dict_mapping)
+    # Expected output: -7, 15, 36, 20, 90, 113, 64, 76
+    heap.print_heap()
+
+    # Inserting 17. Expected Output: -7, 15, 36, 17, 90, 113, 64, 76, 20
+    heap.insert({'P': 17})
+    heap.print_heap()
+    # Removing the root: -7. Expected output: 15, 17, 36, 20, 90, 133, 64, 76
+    heap.remove(0)  # Input is the index of the element to be removed
+    heap.print_heap()
+
+    heap.get_min()  # 15
+    # Changing 17 to 186, Expected output: 15, 20, 36, 76, 90, 113, 64, 186
+    heap.change_priority(idx=1, new_key=186)
+    heap.print_heap()
+    # Changing 15 to 39, Expected output: 20, 39, 36, 76, 90, 113, 64, 186
+    heap.change_priority(idx=0, new_key=39)
+    heap.print_heap()
+
+    # Expected dict_mapping: {'A' : 76, 'B' : 90, 'C' : 113, 'D' : 39,
+    #                'F' : 36, 'G' : 64, 'H' : 20, 'P' : 186}
+    print(heap.dict_mapping)
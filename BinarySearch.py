@@ -1,13 +1,57 @@
 '''
 For a sorted array, an element can be searched for in logarithmic time
 complexity using Binary Search.
+
+Besides the BinarySearch class, bisect-style functions are provided:
+    1. lower_bound: First index at which the value could be inserted while
+        keeping the array sorted i.e. the index of the first element >= value
+    2. upper_bound: Last such index i.e. the index of the first element > value
+    3. equal_range: (lower_bound, upper_bound). The elements equal to the value
+        are the ones in array[lower:upper]
+    4. search_many: lower/upper bounds for a whole batch of queries at once.
+        The queries are sorted and swept through the array in a single pass
+All of them accept a key function which is applied to the array elements.
+
+For large read-only arrays, SearchIndex stores the sorted values in a compact
+typed array, laid out so that the values compared during a search are close
+to each other in memory:
+    1. Eytzinger layout: the values of an implicit binary search tree in
+        breadth-first order. The children of slot k are at 2k and 2k + 1, so
+        the first levels of the tree share a few cache lines
+    2. B-tree layout: blocks of block_size sorted values. Every block is
+        searched as a whole before moving to one of its block_size + 1
+        children, so each level costs one or two cache misses
+
+For sorted files on disk, MappedSortedFile searches the file through mmap
+instead of loading it. Only the pages holding the records compared during a
+search are read from disk:
+    1. Fixed-width records are addressed directly by record number
+    2. Newline-delimited records go through a sparse fence index: the first
+        key of every fence_step bytes of the file is kept in memory. A search
+        picks the fence with binary search and scans only its block
 '''
 
+from array import array as typed_array
+from math import log2
+from os import path as os_path
+
 
 class BinarySearch:
 
     '''
-    Search algorithm for sorted arrays
+    Search algorithm for sorted arrays. Besides the classic binary search,
+    two other modes are available:
+        1. Interpolation search: for nearly uniformly distributed numbers,
+            the next probe is placed where the key would be if the values
+            were evenly spread between the current bounds. O(log(log(n)))
+            probes on average. Any probe which fails to halve the range is
+            followed by a binary step, so the worst case stays O(log(n))
+        2. Exponential search: probes at distances 1, 2, 4, ... from a hint
+            position (the start or the end of the array by default) until
+            the key is bracketed, then binary searches the bracket.
+            O(log(d)) probes where d is the distance from the hint to the key
+    The number of array values read by the last search is kept in
+    self.probes
     '''
 
     def __init__(self, array, key):
@@ -15,53 +59,765 @@ class BinarySearch:
         self.key = key
         self.low = 0
         self.high = len(self.array) - 1
+        self.probes = 0
 
     def binary_search(self):
 
         '''
         Function:
             Search if the key is present in the input array and return its
-            index if it's present. None if it's not present
+            index if it's present. None if it's not present. If the key is
+            present more than once, the first index is returned
         '''
 
-        if self.array == []:
-            return
+        self.probes = 0
 
-        middle = int((self.low + self.high)/2)
+        return self.index_if_found(self.search_range(self.low, self.high + 1))
 
-        if self.key == self.array[middle]:
-            return middle
+    def interpolation_search(self, hint=None):
 
-        elif self.low >= self.high:
-            return
+        '''
+        Function:
+            Same output as binary_search, using interpolation search
+        Input:
+            hint (int): Optional, a position close to where the key is
+                        expected. The key is first bracketed by an
+                        exponential search around it
+        '''
 
-        elif self.key > self.array[middle]:
-            self.low = middle + 1
-            return self.binary_search()
+        self.probes = 0
 
+        if hint is None:
+            low, high = self.low, self.high + 1
         else:
-            self.high = middle - 1
-            return self.binary_search()
+            low, high = self.gallop_bracket(hint)
+
+        array = self.array
+        key = self.key
+
+        # Invariant: the first index whose value isn't lesser than the key is
+        # in [low, high]
+        while low < high:
+            self.probes += 2
+            first = array[low]
+            last = array[high - 1]
+
+            if not first < key:
+                break
+
+            if last < key:
+                low = high
+                break
+
+            range_size = high - low
+
+            try:
+                idx = low + int((key - first)*(high - 1 - low) /
+                                (last - first))
+                idx = min(max(idx, low), high - 1)
+            except (TypeError, ZeroDivisionError):  # Non-numeric values
+                idx = (low + high)//2
+
+            self.probes += 1
+            if array[idx] < key:
+                low = idx + 1
+            else:
+                high = idx
+
+            if (high - low > range_size//2) and (low < high):
+                idx = (low + high)//2
+                self.probes += 1
+                if array[idx] < key:
+                    low = idx + 1
+                else:
+                    high = idx
+
+        return self.index_if_found(low)
+
+    def exponential_search(self, hint=None, from_end=False):
+
+        '''
+        Function:
+            Same output as binary_search, using exponential search
+        Input:
+            hint (int): Optional, the position to start probing from
+            from_end (bool): If no hint is given, start from the end of the
+                                array instead of the start. Useful when the
+                                queries mostly target recent (last) values
+        '''
+
+        self.probes = 0
+
+        if hint is None:
+            hint = self.high if from_end else self.low
+
+        low, high = self.gallop_bracket(hint)
+
+        return self.index_if_found(self.search_range(low, high))
+
+    def gallop_bracket(self, hint):
+
+        '''
+        Function:
+            Probe at distances 1, 2, 4, ... from the hint position until the
+            first index whose value isn't lesser than the key is bracketed
+        Output:
+            (low, high) (tuple): The index is in [low, high]
+        '''
+
+        low = self.low
+        high = self.high + 1
+
+        if low >= high:
+            return low, high
+
+        hint = min(max(hint, low), high - 1)
+        step = 1
+        self.probes += 1
+
+        if self.array[hint] < self.key:
+            previous = hint
+
+            while hint + step < high:
+                self.probes += 1
+                if not self.array[hint + step] < self.key:
+                    return previous + 1, hint + step
+
+                previous = hint + step
+                step *= 2
+
+            return previous + 1, high
+
+        previous = hint
+
+        while hint - step >= low:
+            self.probes += 1
+            if self.array[hint - step] < self.key:
+                return hint - step + 1, previous
+
+            previous = hint - step
+            step *= 2
+
+        return low, previous
+
+    def search_range(self, low, high):
+
+        '''
+        Function:
+            Binary search for the first index in [low, high) whose value isn't
+            lesser than the key. high if there's none
+        '''
+
+        while low < high:
+            middle = (low + high)//2
+            self.probes += 1
+
+            if self.array[middle] < self.key:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+    def index_if_found(self, idx):
+
+        '''
+        Return idx if the key is at that index, None otherwise
+        '''
+
+        if (idx <= self.high) and (self.array[idx] == self.key):
+            return idx
+
+        return
+
+
+def lower_bound(array, value, low=0, high=None, key=None):
+
+    '''
+    Function:
+        Return the index of the first element of the sorted array[low:high]
+        which isn't lesser than the input value. high if there's none
+    Input:
+        array (sequence): The sorted array
+        value: The value we want to search for
+        low, high (int): Optional, boundaries of the search
+        key (function): Optional, applied to the array elements before they're
+                        compared to the value
+    '''
+
+    if high is None:
+        high = len(array)
+
+    while low < high:
+        middle = (low + high)//2
+        element = array[middle] if key is None else key(array[middle])
+
+        if element < value:
+            low = middle + 1
+        else:
+            high = middle
+
+    return low
+
+
+def upper_bound(array, value, low=0, high=None, key=None):
+
+    '''
+    Function:
+        Return the index of the first element of the sorted array[low:high]
+        which is greater than the input value. high if there's none
+    Input:
+        Same as lower_bound
+    '''
+
+    if high is None:
+        high = len(array)
+
+    while low < high:
+        middle = (low + high)//2
+        element = array[middle] if key is None else key(array[middle])
+
+        if value < element:
+            high = middle
+        else:
+            low = middle + 1
+
+    return low
+
+
+def equal_range(array, value, low=0, high=None, key=None):
+
+    '''
+    Function:
+        Return the boundaries of the elements equal to the input value
+    Input:
+        Same as lower_bound
+    Output:
+        (lower, upper) (tuple): array[lower:upper] are the elements equal to
+                                the value. lower == upper if there's none
+    '''
+
+    lower = lower_bound(array, value, low, high, key)
+
+    return lower, upper_bound(array, value, lower, high, key)
+
+
+def search_many(sorted_array, queries, key=None, side='left', exact=False):
+
+    '''
+    Function:
+        Search a batch of queries in one call. The queries are sorted first,
+        so each one only needs to be searched for to the right of the previous
+        one. If there are many queries compared to the size of the array, the
+        array is swept linearly instead, in O(n + m). If the array has a
+        searchsorted method (NumPy) and no key is given, that is used instead
+    Input:
+        sorted_array (sequence): The sorted array
+        queries (iterable): The values we want to search for
+        key (function): Optional, applied to the array elements before they're
+                        compared to the queries
+        side (str): 'left' for lower_bound, 'right' for upper_bound
+        exact (bool): If True, return the index of the first element equal to
+                        each query (None if absent), like binary_search
+    Output:
+        A list with the index for each query, in the order of the queries
+    '''
+
+    queries = list(queries)
+    n = len(sorted_array)
+    m = len(queries)
+
+    if (key is None) and (not exact) and hasattr(sorted_array,
+                                                 'searchsorted'):
+        return sorted_array.searchsorted(queries, side=side).tolist()
+
+    if exact:
+        side = 'left'
+
+    order = sorted(range(m), key=queries.__getitem__)
+    result = [None]*m
+    idx = 0
+
+    if m*log2(n + 1) > n + m:  # Linear sweep is cheaper
+        for query_idx in order:
+            value = queries[query_idx]
+
+            while idx < n:
+                element = sorted_array[idx] if key is None else \
+                    key(sorted_array[idx])
+
+                if (element < value) if side == 'left' else \
+                        not (value < element):
+                    idx += 1
+                else:
+                    break
+
+            result[query_idx] = idx
+
+    else:
+        bound = lower_bound if side == 'left' else upper_bound
+
+        for query_idx in order:
+            idx = bound(sorted_array, queries[query_idx], idx, n, key)
+            result[query_idx] = idx
+
+    if exact:
+        for query_idx, idx in enumerate(result):
+            if idx < n:
+                element = sorted_array[idx] if key is None else \
+                    key(sorted_array[idx])
+
+                if element == queries[query_idx]:
+                    continue
+
+            result[query_idx] = None
+
+    return result
+
+
+class SearchIndex:
+
+    '''
+    Static search index over a sorted array. Answers the same queries as
+    lower_bound and BinarySearch.binary_search, with indexes referring to
+    positions in the original sorted array
+    '''
+
+    def __init__(self, sorted_array, layout='eytzinger', block_size=16,
+                 typecode=None):
+
+        '''
+        Input:
+            sorted_array (sequence): The sorted values. Not referenced once
+                                        the index is built
+            layout (str): 'eytzinger' or 'btree'
+            block_size (int): Number of values per block of the B-tree layout
+            typecode (str): array.array typecode the values are stored as.
+                            If None, 'q' for ints and 'd' for other numbers.
+                            Non-numeric values are kept in a list
+        '''
+
+        if layout not in ('eytzinger', 'btree'):
+            raise ValueError('layout must be eytzinger or btree!')
+
+        self.layout = layout
+        self.block_size = block_size
+        self.size = len(sorted_array)
+
+        if typecode is None:
+            if all(isinstance(value, int) for value in sorted_array):
+                typecode = 'q'
+            elif all(isinstance(value, (int, float)) for value in
+                     sorted_array):
+                typecode = 'd'
+
+        if layout == 'eytzinger':
+            num_slots = self.size + 1  # Slot 0 is unused
+        else:
+            self.num_blocks = -(-self.size//block_size)
+            num_slots = self.num_blocks*block_size
+
+        filler = sorted_array[-1] if self.size > 0 else 0
+        if typecode is None:
+            self.keys = [filler]*num_slots
+        else:
+            self.keys = typed_array(typecode, [filler])*num_slots
+
+        index_typecode = 'i' if self.size < 2**31 else 'q'
+        self.positions = typed_array(index_typecode, [self.size])*num_slots
+
+        self.next_position = 0
+        if layout == 'eytzinger':
+            self.build_eytzinger(sorted_array, 1)
+        else:
+            self.build_btree(sorted_array, 0)
+
+    def build_eytzinger(self, sorted_array, k):
+
+        '''
+        Fill the subtree rooted at slot k with the next values of the array,
+        in-order (left subtree, slot k, right subtree)
+        '''
+
+        if k <= self.size:
+            self.build_eytzinger(sorted_array, 2*k)
+            self.keys[k] = sorted_array[self.next_position]
+            self.positions[k] = self.next_position
+            self.next_position += 1
+            self.build_eytzinger(sorted_array, 2*k + 1)
+
+    def build_btree(self, sorted_array, k):
+
+        '''
+        Fill the subtree rooted at block k in-order. Slots past the end of the
+        array keep the largest value, which never changes any search result
+        '''
+
+        if k < self.num_blocks:
+            for i in range(self.block_size):
+                self.build_btree(sorted_array, k*(self.block_size + 1) + i + 1)
+
+                if self.next_position < self.size:
+                    slot = k*self.block_size + i
+                    self.keys[slot] = sorted_array[self.next_position]
+                    self.positions[slot] = self.next_position
+                    self.next_position += 1
+
+            self.build_btree(sorted_array, (k + 1)*(self.block_size + 1))
+
+    def lower_bound_slot(self, value):
+
+        '''
+        Function:
+            Find the slot holding the first value which isn't lesser than the
+            input value
+        Output:
+            The slot. None if all the values are lesser
+        '''
+
+        keys = self.keys
+
+        if self.layout == 'eytzinger':
+            k = 1
+            while k <= self.size:
+                k = 2*k + (keys[k] < value)
+
+            # Going right past the answer sets the trailing bits of k to 1.
+            # Dropping them and the last left turn gives back the answer
+            k >>= ((~k) & (k + 1)).bit_length()
+
+            return k if k > 0 else None
+
+        block_size = self.block_size
+        k = 0
+        slot = None
+
+        while k < self.num_blocks:
+            start = k*block_size
+            i = lower_bound(keys, value, start, start + block_size) - start
+
+            if i < block_size:
+                slot = start + i
+
+            k = k*(block_size + 1) + i + 1
+
+        return slot
+
+    def lower_bound(self, value):
+
+        '''
+        Same as lower_bound(sorted_array, value)
+        '''
+
+        slot = self.lower_bound_slot(value)
+
+        return self.size if slot is None else self.positions[slot]
+
+    def binary_search(self, value):
+
+        '''
+        Same as BinarySearch(sorted_array, value).binary_search()
+        '''
+
+        slot = self.lower_bound_slot(value)
+
+        if (slot is not None) and (self.keys[slot] == value):
+            return self.positions[slot]
+
+        return
+
+
+def benchmark_layouts(sizes=(10**3, 10**4, 10**5, 10**6), num_queries=10000):
+
+    '''
+    Function:
+        Compare the time per query of lower_bound over a flat list, over a
+        flat typed array and of SearchIndex with both layouts, for arrays
+        ranging from cache-resident to out-of-cache sizes
+    Input:
+        sizes (iterable): Array sizes to try
+        num_queries (int): Number of random queries per size
+    Output:
+        dict_timings (dict): Seconds per query for each (size, layout)
+    '''
+
+    from random import randint
+    from timeit import timeit
+
+    dict_timings = {}
+
+    for size in sizes:
+        array = list(range(0, 2*size, 2))
+        queries = [randint(-1, 2*size) for i in range(num_queries)]
+        flat_array = typed_array('q', array)
+        dict_searches = {
+            'flat list': lambda value: lower_bound(array, value),
+            'flat typed array': lambda value: lower_bound(flat_array, value),
+            'eytzinger': SearchIndex(array, 'eytzinger').lower_bound,
+            'btree': SearchIndex(array, 'btree').lower_bound}
+
+        for name, search in dict_searches.items():
+            timing = timeit(lambda: [search(query) for query in queries],
+                            number=1)/num_queries
+            dict_timings[(size, name)] = timing
+            print(str(size) + ', ' + name + ': ' +
+                  str(round(timing*1e6, 3)) + 'us per query')
+
+    return dict_timings
+
+
+class MappedSortedFile:
+
+    '''
+    Binary search over a sorted file of records, without reading it in
+    '''
+
+    def __init__(self, file_path, record_size=None, key=None,
+                 fence_step=1 << 16):
+
+        '''
+        Input:
+            file_path (str): The sorted file
+            record_size (int): Size in bytes of fixed-width records. If None,
+                                the records are newline-delimited lines
+            key (function): Optional, maps a record (bytes, without the
+                            newline) to the value it's sorted by
+            fence_step (int): Bytes per fence for newline-delimited records
+        '''
+
+        import mmap
+
+        self.file = open(file_path, 'rb')
+        self.record_size = record_size
+        self.key = key
+        self.file_size = self.file.seek(0, 2)
+
+        if self.file_size > 0:
+            self.mapping = mmap.mmap(self.file.fileno(), 0,
+                                     access=mmap.ACCESS_READ)
+        else:  # Empty files can't be mapped
+            self.mapping = b''
+
+        if record_size is not None:
+            if self.file_size % record_size != 0:
+                self.close()
+                raise ValueError('The file size is not a multiple of the '
+                                 'record size!')
+
+            self.size = self.file_size//record_size
+            return
+
+        self.fence_offsets = typed_array('q')
+        self.fence_keys = []
+        offset = 0
+
+        while offset < self.file_size:
+            self.fence_offsets.append(offset)
+            self.fence_keys.append(self.record_key(offset))
+
+            offset = self.mapping.find(b'\n', offset + fence_step - 1)
+            if offset == -1:
+                break
+            offset += 1
+
+        self.fence_offsets.append(self.file_size)
+
+    def __len__(self):
+
+        '''
+        Number of fixed-width records. Newline-delimited records can't be
+        counted without reading the whole file, so they have no length
+        '''
+
+        if self.record_size is None:
+            raise TypeError('Newline-delimited records have no len()!')
+
+        return self.size
+
+    def __getitem__(self, idx):
+
+        '''
+        Key of the fixed-width record number idx. Lets lower_bound and
+        upper_bound run over the file as over an array
+        '''
+
+        if self.record_size is None:
+            raise TypeError('Newline-delimited records are indexed by byte '
+                            'offset, use record_key!')
+
+        return self.record_key(idx*self.record_size)
+
+    def record_at(self, offset):
+
+        '''
+        Function:
+            Return the raw record (bytes, without the newline) starting at the
+            input byte offset
+        '''
+
+        if self.record_size is not None:
+            return self.mapping[offset: offset + self.record_size]
+
+        end = self.mapping.find(b'\n', offset)
+        if end == -1:
+            end = self.file_size
+
+        return self.mapping[offset: end]
+
+    def record_key(self, offset):
+
+        '''
+        Key of the record starting at the input byte offset
+        '''
+
+        record = self.record_at(offset)
+
+        return record if self.key is None else self.key(record)
+
+    def lower_bound(self, value):
+
+        '''
+        Function:
+            Find the first record whose key isn't lesser than the input value
+        Output:
+            For fixed-width records, the record number (the number of records
+            if there's none). For newline-delimited records, the byte offset
+            of the record (the file size if there's none)
+        '''
+
+        if self.record_size is not None:
+            return lower_bound(self, value)
+
+        # The answer is in the block of the last fence before the first fence
+        # whose key isn't lesser than the value. Or at that fence itself
+        fence_idx = lower_bound(self.fence_keys, value)
+
+        if fence_idx == 0:
+            return 0
+
+        offset = self.fence_offsets[fence_idx - 1]
+        end = self.fence_offsets[fence_idx]
+
+        while offset < end:
+            if not self.record_key(offset) < value:
+                return offset
+
+            offset = self.mapping.find(b'\n', offset)
+            if offset == -1:
+                return self.file_size
+            offset += 1
+
+        return end
+
+    def binary_search(self, value):
+
+        '''
+        Function:
+            Same as BinarySearch(records, value).binary_search(), over the
+            records of the file. Offsets are returned for newline-delimited
+            records
+        '''
+
+        position = self.lower_bound(value)
+
+        if self.record_size is not None:
+            if (position < self.size) and (self[position] == value):
+                return position
+
+        elif (position < self.file_size) and \
+                (self.record_key(position) == value):
+            return position
+
+        return
+
+    def close(self):
+
+        '''
+        Unmap and close the file
+        '''
+
+        if not isinstance(self.mapping, bytes):
+            self.mapping.close()
+
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+if __name__ == '__main__':
+    # Testing
+    from tempfile import TemporaryDirectory
+
+    array = [2, 9, 16, 19, 23, 24, 29]
+    key = 24  # Expected output: 5
+    print(BinarySearch(array, key).binary_search())
+
+    key = 25  # Expected output: None
+    print(BinarySearch(array, key).binary_search())
+
+    key = 2  # Expected output: 0
+    print(BinarySearch(array, key).binary_search())
+
+    array = []
+    key = 54  # Expected output: None
+    print(BinarySearch(array, key).binary_search())
+
+    array = [4]
+    key = 4  # Expected output: 0
+    print(BinarySearch(array, key).binary_search())
+
+    array = [2, 5]
+    key = 0  # Expected output: None
+    print(BinarySearch(array, key).binary_search())
 
-# Testing
-array = [2, 9, 16, 19, 23, 24, 29]
-key = 24  # Expected output: 5
-print(BinarySearch(array, key).binary_search())
+    # Interpolation and exponential search. Expected output: 5, 5, 5
+    array = [2, 9, 16, 19, 23, 24, 29]
+    print(BinarySearch(array, 24).interpolation_search(),
+          BinarySearch(array, 24).exponential_search(from_end=True),
+          BinarySearch(array, 24).exponential_search(hint=4))
 
-key = 25  # Expected output: None
-print(BinarySearch(array, key).binary_search())
+    # Probes per search for a uniform array, with keys near its end
+    array = list(range(0, 3*10**5, 3))
+    dict_probes = {'binary': 0, 'interpolation': 0, 'exponential from end': 0}
+    for key in range(3*10**5 - 300, 3*10**5, 3):
+        search = BinarySearch(array, key)
+        search.binary_search()
+        dict_probes['binary'] += search.probes
+        search.interpolation_search()
+        dict_probes['interpolation'] += search.probes
+        search.exponential_search(from_end=True)
+        dict_probes['exponential from end'] += search.probes
+    print(dict_probes)
 
-key = 2  # Expected output: 0
-print(BinarySearch(array, key).binary_search())
+    array = [2, 9, 9, 9, 23, 24, 29]
+    # Expected output: 1, 4, (1, 4)
+    print(lower_bound(array, 9), upper_bound(array, 9), equal_range(array, 9))
+    # Expected output: [5, None, 1, 0]
+    print(search_many(array, [24, 25, 9, 2], exact=True))
+    # Searching by a key. Expected output: (0, 2)
+    print(equal_range(['les', 'sam', 'alex', 'cathy'], 3, key=len))
 
-array = []
-key = 54  # Expected output: None
-print(BinarySearch(array, key).binary_search())
+    array = [2, 9, 16, 19, 23, 24, 29]
+    index = SearchIndex(array, layout='eytzinger')
+    # Expected output: 5, None, 2
+    print(index.binary_search(24), index.binary_search(25),
+          index.lower_bound(10))
+    index = SearchIndex(array, layout='btree', block_size=2)
+    print(index.binary_search(24), index.binary_search(25),
+          index.lower_bound(10))
+    benchmark_layouts(sizes=(10**3, 10**4), num_queries=1000)
 
-array = [4]
-key = 4  # Expected output: 0
-print(BinarySearch(array, key).binary_search())
+    # Searching a sorted file without reading it in
+    with TemporaryDirectory() as example_dir:
+        example_path = os_path.join(example_dir, 'example.txt')
+        with open(example_path, 'wb') as example_file:
+            example_file.write(b'alex\ncathy\nfrank\nles\nsam\n')
 
-array = [2, 5]
-key = 0  # Expected output: None
-print(BinarySearch(array, key).binary_search())
+        # Expected output: 11, None
+        with MappedSortedFile(example_path, fence_step=8) as sorted_file:
+            print(sorted_file.binary_search(b'frank'),
+                  sorted_file.binary_search(b'tony'))
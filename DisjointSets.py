@@ -78,24 +78,26 @@ class DisjointSet:
 
         print(set_info)
 
-# Testing
-dis_set = DisjointSet()
-dis_set.make_set(1)
-dis_set.make_set(2)
-dis_set.make_set(3)
-dis_set.make_set(4)
-dis_set.make_set(5)
-dis_set.make_set(6)
-
-dis_set.print_all_sets()
-
-dis_set.union(2, 4)
-dis_set.print_all_sets()
-
-dis_set.union(5, 2)
-dis_set.union(3, 1)
-dis_set.print_all_sets()
-
-dis_set.union(2, 3)
-dis_set.union(2, 6)
-dis_set.print_all_sets()
+
+if __name__ == '__main__':
+    # Testing
+    dis_set = DisjointSet()
+    dis_set.make_set(1)
+    dis_set.make_set(2)
+    dis_set.make_set(3)
+    dis_set.make_set(4)
+    dis_set.make_set(5)
+    dis_set.make_set(6)
+
+    dis_set.print_all_sets()
+
+    dis_set.union(2, 4)
+    dis_set.print_all_sets()
+
+    dis_set.union(5, 2)
+    dis_set.union(3, 1)
+    dis_set.print_all_sets()
+
+    dis_set.union(2, 3)
+    dis_set.union(2, 6)
+    dis_set.print_all_sets()
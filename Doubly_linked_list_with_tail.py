@@ -16,37 +16,206 @@ Space and Time complexities for a Doubly linked list WITH tail:
     11. Check whether the linked list is empty: O(1)
     12. Check whether an element is present: O(n)
 
+Searching for a value is what makes 8., 10. and 12. O(n). With index=True
+(see Shared_utilities.LinkedListMixin) they are all O(1). Callers which
+already hold a node (find_node finds one) can skip the search with
+insert_after_node, insert_before_node and delete_node, all O(1).
+
+LinkedDeque is a doubly linked list closed into a ring through a sentinel
+node, with the collections.deque API: append, appendleft, pop, popleft,
+extend and extendleft in O(1) per value, and rotate(k) in O(min(k, n - k)).
+Thanks to the sentinel, every node always has a previous and a next node,
+so none of the methods has to special-case an empty list, the head or the
+tail.
+
+An unrolled linked list (UnrolledLinkedList) stores up to chunk_size values
+per node instead of one. Chunks are split in two when an insert overflows
+them and merged with (or refilled from) a neighbour when a delete leaves
+them less than half full, so every chunk but the last is at least half
+full. Compared to one node per value this cuts the memory per value
+several-fold (one list slot, or one machine value if a typecode is given,
+instead of a whole node) and scans run over contiguous chunks, mostly inside
+C loops.
+
+Space and Time complexities for an unrolled linked list (b = chunk_size):
+    1. Space complexity: O(n)
+    2. Get element at start/end: O(1)
+    3. Inserting/deleting an element at start/end: O(b)
+    4. Inserting/deleting an element in middle: O(n) to find it, O(b) to
+       update its chunk
+    5. Check whether an element is present: O(n) but with n/b pointer chases
+    6. Extending by k values: O(k)
+    7. Splicing a list in or splitting at a position: O(n/b + b) (O(b) at
+       the end, which makes concat O(b) per list)
+
+As in the singly linked lists, queries return their result instead of
+printing it, deletes on an empty list raise IndexError, and values that
+can't be found are logged at DEBUG level (see the logging module).
 '''
 
+from array import array as typed_array
+from collections import deque
+
+if __package__:  # Imported as a submodule of the package
+    from . import Shared_utilities
+else:
+    import Shared_utilities
+
+
+log_debug = Shared_utilities.debug_logger(__name__)
+
 
 class Node:
 
+    __slots__ = ('data', 'next', 'previous')
+
     def __init__(self, data):
         self.data = data
         self.next = None
         self.previous = None
 
 
-class DLinkedListWithTail:
+class NodePool(Shared_utilities.NodePool):
 
-    def __init__(self):
-        self.head = None
+    '''
+    Pool of the Nodes above, see Shared_utilities.NodePool
+    '''
+
+    node_class = Node
+
+
+class DLinkedListWithTail(Shared_utilities.LinkedListMixin):
+
+    node_class = Node
+    has_tail = True
+    doubly_linked = True
+
+    def __init__(self, pool=None, index=False):
+
+        '''
+        Input:
+            Same as Shared_utilities.LinkedListMixin
+        '''
+
+        super().__init__(pool, index)
         self.tail = None
 
-    def is_empty(self):
+    def insert_after_node(self, node, value):
 
         '''
         Function:
-            Return a boolean var for whether or not the linked list is empty
+            Insert the input value right after the input node. O(1)
+
+        Input:
+            node (Node): A node of the linked list
+            value (int): The value we want to insert in the linked list
+
+        Output:
+            The new node
         '''
 
-        if self.head is None:
-            print('The linked list is empty!')
-            return True
+        new_node = self.make_node(value)
+        next_node = node.next
+        new_node.previous = node
+        new_node.next = next_node
+        node.next = new_node
 
+        if next_node is None:
+            self.tail = new_node
         else:
-            print('The linked list is not empty!')
-            return False
+            next_node.previous = new_node
+
+        if self.size is not None:
+            self.size += 1
+
+        return new_node
+
+    def insert_before_node(self, node, value):
+
+        '''
+        Function:
+            Insert the input value right before the input node. O(1)
+
+        Input:
+            node (Node): A node of the linked list
+            value (int): The value we want to insert in the linked list
+
+        Output:
+            The new node
+        '''
+
+        new_node = self.make_node(value)
+        previous_node = node.previous
+        new_node.next = node
+        new_node.previous = previous_node
+        node.previous = new_node
+
+        if previous_node is None:
+            self.head = new_node
+        else:
+            previous_node.next = new_node
+
+        if self.size is not None:
+            self.size += 1
+
+        return new_node
+
+    def delete_node(self, node):
+
+        '''
+        Function:
+            Remove the input node from the linked list. O(1)
+
+        Input:
+            node (Node): A node of the linked list
+        '''
+
+        previous_node = node.previous
+        next_node = node.next
+
+        if previous_node is None:
+            self.head = next_node
+        else:
+            previous_node.next = next_node
+
+        if next_node is None:
+            self.tail = previous_node
+        else:
+            next_node.previous = previous_node
+
+        self.release_node(node)
+
+    def last_node(self):
+
+        '''
+        Function:
+            Output the last node, None if the list is empty. O(1)
+        '''
+
+        return self.tail
+
+    def __reversed__(self):
+
+        '''
+        Function:
+            Generate the values from the tail to the head, following the
+            previous pointers
+        '''
+
+        curr_node = self.tail
+
+        while curr_node:
+            yield curr_node.data
+            curr_node = curr_node.previous
+
+    def is_empty(self):
+
+        '''
+        Function:
+            Return a boolean var for whether or not the linked list is empty
+        '''
+
+        return self.head is None
 
     def populate_an_empty_list(self, list_input):
 
@@ -57,27 +226,14 @@ class DLinkedListWithTail:
             pointer to the last value of the array
 
         Input:
-            list_input (list): Array of elements we want to populate
+            list_input (iterable): Elements we want to populate
         '''
 
         if self.head is not None:
-            print('The linked list is already populated! Please use one of the\
-                   following: insert_element_at_start, insert_element_at_end, \
-                      insert_element_after_a_node, insert_element_after_a_node\
-                          ')
-
-        else:
-            self.head = Node(list_input[0])
-            curr_node = self.head
-            curr_node.previous = None
-
-            for i in range(1, len(list_input)):
-                new_node = Node(list_input[i])
-                curr_node.next = new_node
-                new_node.previous = curr_node
-                curr_node = new_node
+            raise ValueError('The linked list is already populated! '
+                             'Please use extend')
 
-            self.tail = curr_node
+        self.extend(list_input)
 
     def show_element_at_start(self):
 
@@ -92,10 +248,9 @@ class DLinkedListWithTail:
         '''
 
         if self.head is None:
-            print('The linked list is empty')
+            return None
 
-        else:
-            print('The element at start is ' + str(self.head.data))
+        return self.head.data
 
     def show_element_at_end(self):
 
@@ -110,10 +265,9 @@ class DLinkedListWithTail:
         '''
 
         if self.head is None:
-            print('The linked list is empty')
+            return None
 
-        else:
-            print('The element at end is ' + str(self.tail.data))
+        return self.tail.data
 
     def print_all_elements(self):
 
@@ -141,25 +295,7 @@ class DLinkedListWithTail:
             Boolean var for whether or not the input value is present
         '''
 
-        if self.head is None:
-            print('The linked list is empty')
-
-        else:
-            curr_node = self.head
-            fl_found = 0
-
-            while curr_node:
-                if curr_node.data == value:
-                    fl_found = 1
-                    break
-
-                curr_node = curr_node.next
-
-            if fl_found == 1:
-                print('The value ' + str(value) + ' is present in the list')
-
-            else:
-                print('The value ' + str(value) + ' is missing from the list')
+        return self.find_node(value) is not None
 
     def insert_element_at_start(self, value):
 
@@ -171,14 +307,26 @@ class DLinkedListWithTail:
 
         Input:
             value (int): The value we want to insert in the linked list
+
+        Output:
+            The new node
         '''
 
-        new_node = Node(value)
+        new_node = self.make_node(value)
         head_node = self.head
         self.head = new_node
         new_node.next = head_node
         new_node.previous = None
-        head_node.previous = new_node
+
+        if head_node is None:
+            self.tail = new_node
+        else:
+            head_node.previous = new_node
+
+        if self.size is not None:
+            self.size += 1
+
+        return new_node
 
     def insert_element_at_end(self, value):
 
@@ -190,17 +338,15 @@ class DLinkedListWithTail:
 
         Input:
             value (int): The value we want to insert in the linked list
+
+        Output:
+            The new node
         '''
 
         if self.head is None:
-            print('The list is empty! Please use insert_element_at_start')
+            return self.insert_element_at_start(value)
 
-        else:
-            new_node = Node(value)
-            end_node = self.tail
-            end_node.next = new_node
-            new_node.previous = end_node
-            self.tail = new_node
+        return self.insert_after_node(self.tail, value)
 
     def insert_element_after_a_node(self, value, curr_value):
 
@@ -212,26 +358,18 @@ class DLinkedListWithTail:
             value (int): The value we want to insert in the linked list
             curr_value (int): The value of the node after which we want to
                                 insert the new value
-        '''
-
-        if self.head is None:
-            print('The list is empty! Please use insert_element_at_start')
 
-        else:
-            new_node = Node(value)
-            tmp_node = self.head
-            # The solution becomes O(1) only if the node is supplied as input.
+        Output:
+            The new node. None if curr_value is missing
+        '''
 
-            while tmp_node:
-                if tmp_node.data == curr_value:
-                    next_node = tmp_node.next
-                    tmp_node.next = new_node
-                    new_node.next = next_node
-                    next_node.previous = new_node
-                    new_node.previous = tmp_node
-                    break
+        # Only the search is O(n), and O(1) too with an index
+        node = self.find_node(curr_value)
+        if node is None:
+            log_debug('%s is missing from the linked list', curr_value)
+            return None
 
-                tmp_node = tmp_node.next
+        return self.insert_after_node(node, value)
 
     def insert_element_before_a_node(self, value, curr_value):
 
@@ -244,30 +382,17 @@ class DLinkedListWithTail:
             value (int): The value we want to insert in the linked list
             curr_value (int): The value of the node before which we want to
                                 insert the new value
-        '''
 
-        if self.head is None:
-            print('The list is empty! Please use insert_element_at_start')
-
-        else:
-            new_node = Node(value)
-            tmp_node = self.head
-
-            while tmp_node:
-                if tmp_node.next is not None:
-                    if tmp_node.next.data == curr_value:
-                        curr_next_node = tmp_node.next
-                        tmp_node.next = new_node
-                        new_node.next = curr_next_node
-                        curr_next_node.previous = new_node
-                        new_node.previous = tmp_node
-                        break
+        Output:
+            The new node. None if curr_value is missing
+        '''
 
-                    tmp_node = tmp_node.next
+        node = self.find_node(curr_value)
+        if node is None:
+            log_debug('%s is missing from the linked list', curr_value)
+            return None
 
-                else:
-                    print('Reached the end of the Linked List!')
-                    break
+        return self.insert_before_node(node, value)
 
     def delete_top_node(self):
 
@@ -276,16 +401,13 @@ class DLinkedListWithTail:
             Remove the current head node of the linked list. The head pointer
             will now point at the node to which the previous head node was
             pointing at
+            Raises IndexError if the linked list is empty
         '''
 
         if self.head is None:
-            print('The list is empty!')
+            raise IndexError('delete from an empty linked list')
 
-        else:
-            next_node = self.head.next
-            self.head = next_node
-            if next_node is not None:
-                next_node.previous = None
+        self.delete_node(self.head)
 
     def delete_last_node(self):
 
@@ -293,20 +415,13 @@ class DLinkedListWithTail:
         Function:
             Remove the current tail node of the linked list. The tail pointer
             will now point at the node right before the previous tail node
+            Raises IndexError if the linked list is empty
         '''
 
         if self.head is None:
-            print('The list is empty!')
+            raise IndexError('delete from an empty linked list')
 
-        else:
-            end_node = self.tail
-            previous_node = end_node.previous
-            print(previous_node.data)
-            if previous_node is not None:
-                previous_node.next = None
-            else:
-                self.head = None
-            self.tail = previous_node
+        self.delete_node(self.tail)
 
     def delete_node_from_middle(self, node_value):
 
@@ -316,46 +431,947 @@ class DLinkedListWithTail:
 
         Input:
             node_value (int): Value of the node we want to remove
+
+        Output:
+            Boolean var for whether or not the value was found and removed
         '''
 
-        if self.head is None:
-            print('The list is empty!')
+        node = self.find_node(node_value)
+        if node is None:
+            log_debug('%s is missing from the linked list', node_value)
+            return False
+
+        self.delete_node(node)
+        return True
+
+
+class LinkedDeque:
+
+    '''
+    Doubly linked deque with a sentinel node: sentinel.next is the first node
+    and sentinel.previous the last one (the sentinel itself when empty)
+    '''
+
+    def __init__(self, iterable=(), pool=None):
+
+        '''
+        Input:
+            iterable: Optional, values to start with
+            pool (NodePool): Optional, pool to take nodes from and release
+                             removed nodes to
+        '''
+
+        self.sentinel = Node(None)
+        self.sentinel.next = self.sentinel.previous = self.sentinel
+        self.size = 0
+        self.pool = pool
+        self.make_node = Node if pool is None else pool.new_node
+        self.extend(iterable)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+
+        '''
+        Generate the values from start to end, lazily
+        '''
+
+        curr_node = self.sentinel.next
+
+        while curr_node is not self.sentinel:
+            yield curr_node.data
+            curr_node = curr_node.next
+
+    def __reversed__(self):
+
+        '''
+        Generate the values from end to start, lazily
+        '''
+
+        curr_node = self.sentinel.previous
+
+        while curr_node is not self.sentinel:
+            yield curr_node.data
+            curr_node = curr_node.previous
+
+    def __contains__(self, value):
+        return any(data == value for data in self)
+
+    def link(self, previous_node, value):
+
+        '''
+        Function:
+            Insert the input value right after previous_node
+        '''
+
+        new_node = self.make_node(value)
+        next_node = previous_node.next
+        new_node.previous = previous_node
+        new_node.next = next_node
+        previous_node.next = new_node
+        next_node.previous = new_node
+        self.size += 1
+
+    def unlink(self, node):
+
+        '''
+        Function:
+            Remove the input node and output its value
+        '''
+
+        if node is self.sentinel:
+            raise IndexError('pop from an empty deque')
+
+        node.previous.next = node.next
+        node.next.previous = node.previous
+        self.size -= 1
+        value = node.data
+
+        if self.pool is not None:
+            self.pool.release(node)
+
+        return value
+
+    def append(self, value):
+
+        '''
+        Add the input value at the end
+        '''
+
+        self.link(self.sentinel.previous, value)
+
+    def appendleft(self, value):
+
+        '''
+        Add the input value at the start
+        '''
+
+        self.link(self.sentinel, value)
+
+    def pop(self):
+
+        '''
+        Remove and output the value at the end. IndexError if empty
+        '''
+
+        return self.unlink(self.sentinel.previous)
+
+    def popleft(self):
+
+        '''
+        Remove and output the value at the start. IndexError if empty
+        '''
+
+        return self.unlink(self.sentinel.next)
+
+    def extend(self, iterable):
+
+        '''
+        Add the values of the input iterable at the end, consuming it lazily
+        '''
+
+        for value in iterable:
+            self.link(self.sentinel.previous, value)
+
+    def extendleft(self, iterable):
+
+        '''
+        Add the values of the input iterable at the start, one by one, so
+        that they end up in reverse order (as with collections.deque)
+        '''
+
+        for value in iterable:
+            self.link(self.sentinel, value)
+
+    def rotate(self, k=1):
+
+        '''
+        Function:
+            Rotate the deque k steps to the right (to the left if k is
+            negative), ie. move the last k values to the start. Only the
+            sentinel is moved, walking min(k, n - k) nodes
+        Input:
+            k (int): Number of steps
+        '''
+
+        if self.size <= 1:
+            return
+
+        k %= self.size
+        if k == 0:
+            return
+
+        # The node which ends up first is the one at index n - k
+        pivot = self.sentinel
+        if k <= self.size//2:
+            for i in range(k):
+                pivot = pivot.previous
 
         else:
-            curr_node = self.head
-
-            while curr_node:
-                if curr_node.next is not None:
-                    if curr_node.next.data == node_value:
-                        curr_node.next = curr_node.next.next
-                        curr_node.next.next.previous = curr_node
-                        break
-
-                    curr_node = curr_node.next
-
-                else:
-                    print('Reached the end of the Linked List!')
-
-llist = DLinkedListWithTail()
-llist.is_empty()
-llist.populate_an_empty_list([41, 37, 25, -7, 925])
-llist.is_empty()
-llist.print_all_elements()
-llist.show_element_at_start()
-llist.show_element_at_end()
-llist.is_element_present(-96)
-llist.is_element_present(37)
-llist.insert_element_at_start(120)
-llist.print_all_elements()
-llist.insert_element_at_end(219)
-llist.print_all_elements()
-llist.insert_element_after_a_node(value=520, curr_value=120)
-llist.print_all_elements()
-llist.insert_element_before_a_node(value=0, curr_value=925)
-llist.print_all_elements()
-llist.delete_top_node()
-llist.print_all_elements()
-llist.delete_last_node()
-llist.print_all_elements()
-llist.delete_node_from_middle(25)
-llist.print_all_elements()
+            for i in range(self.size - k + 1):
+                pivot = pivot.next
+
+        sentinel = self.sentinel
+        sentinel.previous.next = sentinel.next
+        sentinel.next.previous = sentinel.previous
+        sentinel.previous = pivot.previous
+        sentinel.next = pivot
+        pivot.previous.next = sentinel
+        pivot.previous = sentinel
+
+    def peek(self):
+
+        '''
+        Output the value at the end. IndexError if empty
+        '''
+
+        if self.size == 0:
+            raise IndexError('peek at an empty deque')
+
+        return self.sentinel.previous.data
+
+    def peekleft(self):
+
+        '''
+        Output the value at the start. IndexError if empty
+        '''
+
+        if self.size == 0:
+            raise IndexError('peek at an empty deque')
+
+        return self.sentinel.next.data
+
+    def to_list(self):
+
+        '''
+        Output the values as a list, from start to end
+        '''
+
+        return list(self)
+
+
+def benchmark_linked_deque(n=1000000):
+
+    '''
+    Function:
+        Time a mixed workload of n random appends/pops at both ends (after
+        warming up with n//10 values) on LinkedDeque, with and without a
+        NodePool, and on collections.deque
+    Output:
+        dict_times (dict): Seconds per operation for each deque
+    '''
+
+    from random import random
+    from timeit import timeit
+
+    ops = [int(random()*4) for i in range(n)]
+    dict_deques = {'LinkedDeque': LinkedDeque,
+                   'LinkedDeque, pool': lambda: LinkedDeque(pool=NodePool()),
+                   'collections.deque': deque}
+    dict_times = {}
+
+    for name, new_deque in dict_deques.items():
+        values = new_deque()
+        values.extend(range(n//10))
+
+        def run():
+            for op in ops:
+                if op == 0:
+                    values.append(op)
+                elif op == 1:
+                    values.appendleft(op)
+                elif values:
+                    if op == 2:
+                        values.pop()
+                    else:
+                        values.popleft()
+
+        dict_times[name] = timeit(run, number=1)/n
+        print(name + ': ' + str(round(dict_times[name]*1e9)) + ' ns/op')
+
+    return dict_times
+
+
+class ChunkNode:
+
+    '''
+    Node of an unrolled linked list, holding a chunk of values
+    '''
+
+    __slots__ = ('values', 'next', 'previous')
+
+    def __init__(self, values):
+        self.values = values
+        self.next = None
+        self.previous = None
+
+
+class UnrolledLinkedList:
+
+    '''
+    Unrolled doubly linked list with tail. Same value-based methods as
+    DLinkedListWithTail, with splice and split_at taking a position instead
+    of a node. There are no node-based methods (find_node, insert_after_node,
+    insert_before_node, delete_node, last_node): values don't have a node of
+    their own, and they move between chunks whenever chunks are split or
+    merged, so a handle on one wouldn't stay valid
+    '''
+
+    def __init__(self, chunk_size=64, typecode=None):
+
+        '''
+        Input:
+            chunk_size (int): Maximum number of values per node
+            typecode (str): Optional, store each chunk as an array.array of
+                            this typecode (eg. 'q' for ints) instead of a list
+        '''
+
+        self.chunk_size = max(chunk_size, 2)
+        self.typecode = typecode
+        self.head = None
+        self.tail = None
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+
+        '''
+        Function:
+            Generate the values from the head to the tail, lazily
+        '''
+
+        curr_node = self.head
+
+        while curr_node:
+            yield from curr_node.values
+            curr_node = curr_node.next
+
+    def __reversed__(self):
+
+        '''
+        Function:
+            Generate the values from the tail to the head, lazily
+        '''
+
+        curr_node = self.tail
+
+        while curr_node:
+            yield from reversed(curr_node.values)
+            curr_node = curr_node.previous
+
+    def __contains__(self, value):
+        return self.find(value)[0] is not None
+
+    def new_chunk(self, values=()):
+
+        '''
+        Function:
+            Output an unlinked ChunkNode holding the input values
+        '''
+
+        if self.typecode is None:
+            return ChunkNode(list(values))
+
+        return ChunkNode(typed_array(self.typecode, values))
+
+    def link_after(self, node, new_node):
+
+        '''
+        Function:
+            Link new_node right after node. After the tail if node is None
+            and the list is not empty, as the only node otherwise
+        '''
+
+        if node is None:
+            node = self.tail
+
+        if node is None:
+            self.head = self.tail = new_node
+            return
+
+        new_node.previous = node
+        new_node.next = node.next
+        if node.next is None:
+            self.tail = new_node
+        else:
+            node.next.previous = new_node
+
+        node.next = new_node
+
+    def unlink(self, node):
+
+        '''
+        Function:
+            Remove the input chunk from the list
+        '''
+
+        if node.previous is None:
+            self.head = node.next
+        else:
+            node.previous.next = node.next
+
+        if node.next is None:
+            self.tail = node.previous
+        else:
+            node.next.previous = node.previous
+
+    def split(self, node):
+
+        '''
+        Function:
+            If the chunk overflows, move its second half to a new chunk
+        '''
+
+        if len(node.values) > self.chunk_size:
+            half = len(node.values)//2
+            self.link_after(node, self.new_chunk(node.values[half:]))
+            del node.values[half:]
+
+    def merge(self, node):
+
+        '''
+        Function:
+            Remove the chunk if it's empty. Otherwise, if it's less than half
+            full, merge it with its next chunk (or previous one, for the tail)
+            if the two fit into one chunk, or else spread their values evenly
+            over both
+        '''
+
+        if len(node.values) == 0:
+            self.unlink(node)
+            return
+
+        if len(node.values) >= self.chunk_size//2:
+            return
+
+        if node.next is None:
+            node = node.previous
+            if node is None:
+                return
+
+        next_values = node.next.values
+        total = len(node.values) + len(next_values)
+
+        if total <= self.chunk_size:
+            node.values.extend(next_values)
+            self.unlink(node.next)
+
+        else:  # Too many values for one chunk: share them evenly instead
+            shift = total//2 - len(node.values)
+            if shift > 0:
+                node.values.extend(next_values[:shift])
+                del next_values[:shift]
+            else:
+                next_values[0:0] = node.values[shift:]
+                del node.values[shift:]
+
+    def find(self, value):
+
+        '''
+        Function:
+            Output the chunk holding the first occurrence of the input value
+            and the position of the value in it. (None, -1) if it's missing
+        '''
+
+        curr_node = self.head
+
+        while curr_node:
+            if value in curr_node.values:
+                return curr_node, curr_node.values.index(value)
+
+            curr_node = curr_node.next
+
+        return None, -1
+
+    def rebalance(self, node):
+
+        '''
+        Function:
+            Merge the input chunk with the chunks after it (or share their
+            values) while it's less than half full and not the tail. Only
+            the chunk and the ones it absorbs change
+        '''
+
+        while (node.next is not None) and \
+                (len(node.values) < self.chunk_size//2):
+            self.merge(node)
+
+    def cut(self, position):
+
+        '''
+        Function:
+            Split the chunk holding the value at the input position, so that
+            a chunk starts with that value
+        Output:
+            The chunks right before and right after the cut. None at the
+            start or the end of the list
+        '''
+
+        if position <= 0:
+            return None, self.head
+
+        if position >= self.size:
+            return self.tail, None
+
+        node = self.head
+
+        while position >= len(node.values):
+            position -= len(node.values)
+            node = node.next
+
+        if position == 0:
+            return node.previous, node
+
+        rest = self.new_chunk(node.values[position:])
+        del node.values[position:]
+        self.link_after(node, rest)
+
+        return node, rest
+
+    def extend(self, iterable):
+
+        '''
+        Function:
+            Add the values of the input iterable (or generator) at the end of
+            the linked list, consuming it lazily. The tail chunk is filled
+            before a new one is started
+
+        Input:
+            iterable: The values we want to add
+        '''
+
+        node = self.tail
+
+        for value in iterable:
+            if (node is None) or (len(node.values) == self.chunk_size):
+                node = self.new_chunk()
+                self.link_after(None, node)
+
+            node.values.append(value)
+            self.size += 1
+
+    def splice(self, other_list, position=None):
+
+        '''
+        Function:
+            Move all the chunks of other_list (which ends up empty) into this
+            list, at the input position. O(n/b) to find the position and O(b)
+            to split and rebalance the chunks on both sides
+
+        Input:
+            other_list (UnrolledLinkedList): List with the same chunk_size
+                                                and typecode
+            position (int): Number of values of this list which stay before
+                            the moved ones. None for the end of the list
+        '''
+
+        if (other_list.chunk_size, other_list.typecode) != \
+                (self.chunk_size, self.typecode):
+            raise ValueError('The linked lists must have the same chunk_size '
+                             'and typecode!')
+
+        first_node = other_list.head
+        if first_node is None:
+            return
+
+        last_node = other_list.tail
+        size = other_list.size
+        other_list.head = other_list.tail = None
+        other_list.size = 0
+
+        if position is None:
+            position = self.size
+
+        previous_node, next_node = self.cut(position)
+
+        first_node.previous = previous_node
+        if previous_node is None:
+            self.head = first_node
+        else:
+            previous_node.next = first_node
+
+        last_node.next = next_node
+        if next_node is None:
+            self.tail = last_node
+        else:
+            next_node.previous = last_node
+
+        self.size += size
+
+        # Only the chunks around the two seams can be less than half full.
+        # From right to left, as rebalancing only touches the next chunks
+        if next_node is not None:
+            self.rebalance(next_node)
+
+        self.rebalance(last_node)
+        if previous_node is not None:
+            self.rebalance(previous_node)
+
+    def concat(self, *other_lists):
+
+        '''
+        Function:
+            Move the chunks of all the input lists, in order, to the end of
+            this list. O(b) per list
+
+        Input:
+            other_lists: Unrolled linked lists whose chunks we want to move
+        '''
+
+        for other_list in other_lists:
+            self.splice(other_list)
+
+    def split_at(self, position):
+
+        '''
+        Function:
+            Cut the linked list at the input position. The values from there
+            on move to a new linked list. O(n/b + b)
+
+        Input:
+            position (int): Number of values which stay in this list
+
+        Output:
+            The new linked list, with the same chunk_size and typecode
+        '''
+
+        new_list = type(self)(self.chunk_size, self.typecode)
+        position = min(max(position, 0), self.size)
+        previous_node, next_node = self.cut(position)
+
+        if next_node is None:
+            return new_list
+
+        new_list.head = next_node
+        new_list.tail = self.tail
+        new_list.size = self.size - position
+        next_node.previous = None
+        self.tail = previous_node
+        self.size = position
+
+        if previous_node is None:
+            self.head = None
+        else:
+            previous_node.next = None
+
+        new_list.rebalance(next_node)
+
+        return new_list
+
+    def is_empty(self):
+
+        '''
+        Function:
+            Return a boolean var for whether or not the linked list is empty
+        '''
+
+        return self.head is None
+
+    def populate_an_empty_list(self, list_input):
+
+        '''
+        Function:
+            Populate a list of elements to an empty linked list, filling each
+            chunk completely
+
+        Input:
+            list_input (iterable): Elements we want to populate
+        '''
+
+        if self.head is not None:
+            raise ValueError('The linked list is already populated! '
+                             'Please use extend')
+
+        self.extend(list_input)
+
+    def show_element_at_start(self):
+
+        '''
+        Function:
+            If the linked list is populated, return its first value
+
+        Output:
+            First value of the linked list. None if the linked list is empty
+        '''
+
+        if self.head is None:
+            return None
+
+        return self.head.values[0]
+
+    def show_element_at_end(self):
+
+        '''
+        Function:
+            If the linked list is populated, return its last value
+
+        Output:
+            Last value of the linked list. None if the linked list is empty
+        '''
+
+        if self.head is None:
+            return None
+
+        return self.tail.values[-1]
+
+    def print_all_elements(self):
+
+        '''
+        Function:
+            Print all the values present in the linked list
+        '''
+
+        curr_node = self.head
+
+        while curr_node:
+            for value in curr_node.values:
+                print(value)
+
+            curr_node = curr_node.next
+
+    def is_element_present(self, value):
+
+        '''
+        Function:
+            Check if a particular value is present in the linked list
+
+        Input:
+            value (int): The value we want to check
+
+        Output:
+            Boolean var for whether or not the input value is present
+        '''
+
+        return self.find(value)[0] is not None
+
+    def insert_element_at_start(self, value):
+
+        '''
+        Function:
+            Enter a value to be placed at the start of the linked list
+
+        Input:
+            value (int): The value we want to insert in the linked list
+        '''
+
+        if self.head is None:
+            self.link_after(None, self.new_chunk())
+
+        self.head.values.insert(0, value)
+        self.size += 1
+        self.split(self.head)
+
+    def insert_element_at_end(self, value):
+
+        '''
+        Function:
+            Enter a value to be placed at the end of the linked list
+
+        Input:
+            value (int): The value we want to insert in the linked list
+        '''
+
+        if self.head is None:
+            self.link_after(None, self.new_chunk())
+
+        self.tail.values.append(value)
+        self.size += 1
+        self.split(self.tail)
+
+    def insert_element_after_a_node(self, value, curr_value):
+
+        '''
+        Function:
+            Insert the input value after the first occurrence of curr_value
+
+        Input:
+            value (int): The value we want to insert in the linked list
+            curr_value (int): The value after which we want to insert the new
+                                value
+        '''
+
+        node, idx = self.find(curr_value)
+        if node is None:
+            log_debug('%s is missing from the linked list', curr_value)
+            return
+
+        node.values.insert(idx + 1, value)
+        self.size += 1
+        self.split(node)
+
+    def insert_element_before_a_node(self, value, curr_value):
+
+        '''
+        Function:
+            Insert the input value before the first occurrence of curr_value
+
+        Input:
+            value (int): The value we want to insert in the linked list
+            curr_value (int): The value before which we want to insert the
+                                new value
+        '''
+
+        node, idx = self.find(curr_value)
+        if node is None:
+            log_debug('%s is missing from the linked list', curr_value)
+            return
+
+        node.values.insert(idx, value)
+        self.size += 1
+        self.split(node)
+
+    def delete_top_node(self):
+
+        '''
+        Function:
+            Remove the first value of the linked list. Raises IndexError if
+            the linked list is empty
+        '''
+
+        if self.head is None:
+            raise IndexError('delete from an empty linked list')
+
+        del self.head.values[0]
+        self.size -= 1
+        self.merge(self.head)
+
+    def delete_last_node(self):
+
+        '''
+        Function:
+            Remove the last value of the linked list. Raises IndexError if
+            the linked list is empty
+        '''
+
+        if self.head is None:
+            raise IndexError('delete from an empty linked list')
+
+        del self.tail.values[-1]
+        self.size -= 1
+        self.merge(self.tail)
+
+    def delete_node_from_middle(self, node_value):
+
+        '''
+        Function:
+            Remove the first occurrence of node_value
+
+        Input:
+            node_value (int): The value we want to remove
+
+        Output:
+            Boolean var for whether or not the value was found and removed
+        '''
+
+        node, idx = self.find(node_value)
+        if node is None:
+            log_debug('%s is missing from the linked list', node_value)
+            return False
+
+        del node.values[idx]
+        self.size -= 1
+        self.merge(node)
+        return True
+
+
+def benchmark_unrolled_list(n=1000000, chunk_size=64, repeat=3):
+
+    '''
+    Function:
+        Compare DLinkedListWithTail with UnrolledLinkedList (list chunks and
+        'q' typed chunks) on n ints: memory allocated to populate the list,
+        and time to scan it for a missing value
+    Output:
+        dict_results (dict): (bytes, seconds per scan) for each list type
+    '''
+
+    import tracemalloc
+    from timeit import timeit
+
+    dict_lists = {
+        'node per value': DLinkedListWithTail,
+        'unrolled': lambda: UnrolledLinkedList(chunk_size),
+        'unrolled, typed': lambda: UnrolledLinkedList(chunk_size, 'q')}
+    list_input = list(range(n))
+    dict_results = {}
+
+    for name, new_list in dict_lists.items():
+        tracemalloc.start()
+        llist = new_list()
+        llist.populate_an_empty_list(list_input)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        scan_time = timeit(lambda: llist.is_element_present(-1),
+                           number=repeat)/repeat
+        dict_results[name] = (memory, scan_time)
+        print(name + ': ' + str(round(memory/n, 1)) + ' bytes per value, ' +
+              str(round(scan_time*1000, 2)) + ' ms per scan')
+
+    return dict_results
+
+
+if __name__ == '__main__':
+    llist = DLinkedListWithTail()
+    print(llist.is_empty())
+    llist.populate_an_empty_list([41, 37, 25, -7, 925])
+    print(llist.is_empty())
+    llist.print_all_elements()
+    print(llist.show_element_at_start())
+    print(llist.show_element_at_end())
+    print(llist.is_element_present(-96))
+    print(llist.is_element_present(37))
+    llist.insert_element_at_start(120)
+    llist.print_all_elements()
+    llist.insert_element_at_end(219)
+    llist.print_all_elements()
+    llist.insert_element_after_a_node(value=520, curr_value=120)
+    llist.print_all_elements()
+    llist.insert_element_before_a_node(value=0, curr_value=925)
+    llist.print_all_elements()
+    llist.delete_top_node()
+    llist.print_all_elements()
+    llist.delete_last_node()
+    llist.print_all_elements()
+    llist.delete_node_from_middle(25)
+    llist.print_all_elements()
+
+    # Unrolled linked list with 4 values per node, same example as above
+    llist = UnrolledLinkedList(chunk_size=4)
+    llist.populate_an_empty_list([41, 37, 25, -7, 925])
+    llist.insert_element_at_start(120)
+    llist.insert_element_at_end(219)
+    llist.insert_element_after_a_node(value=520, curr_value=120)
+    llist.insert_element_before_a_node(value=0, curr_value=925)
+    llist.delete_top_node()
+    llist.delete_last_node()
+    llist.delete_node_from_middle(25)
+    llist.print_all_elements()
+
+    # Lazy extend, then split at a position and splice the end back in
+    llist = UnrolledLinkedList(chunk_size=4)
+    llist.extend(value*value for value in range(6))
+    end_list = llist.split_at(4)
+    llist.splice(end_list, position=1)
+    print(list(llist))  # [0, 16, 25, 1, 4, 9]
+    benchmark_unrolled_list(n=100000)
+
+    # Index mode: value lookups in O(1), inserts return the new node
+    llist = DLinkedListWithTail(index=True)
+    llist.populate_an_empty_list([41, 37, 25, -7, 925])
+    node = llist.insert_element_after_a_node(value=8, curr_value=25)
+    llist.insert_after_node(node, 9)
+    llist.delete_node_from_middle(37)
+    llist.print_all_elements()  # 41, 25, 8, 9, -7, 925
+
+    # Deque API
+    values = LinkedDeque([1, 2, 3])
+    values.appendleft(0)
+    values.extend([4, 5])
+    values.rotate(2)
+    print(values.to_list())  # [4, 5, 0, 1, 2, 3]
+    print(values.pop(), values.popleft())  # 3 4
+    benchmark_linked_deque(n=100000)
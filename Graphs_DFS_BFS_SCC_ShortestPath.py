@@ -7,44 +7,20 @@ Theory:
     BFS, we also implement programs to fetch list of strongly connected
     components, implement topological sort and reconstruct shortest paths
     between two vertices. Examples for using the script are provided at the end
-'''
-
-
-class Queue:
-
-    '''
-    Helper class for breadth first search
-    '''
-
-    def __init__(self):
-        self.queue = []
-
-    def enqueue(self, value):
-
-        '''
-        Push the input value at the end of the queue
-        '''
-
-        self.queue.append(value)
 
-    def dequeue(self):
+get_shortest_path returns None for a destination that can't be reached, and
+logs it at DEBUG level rather than printing.
+'''
 
-        '''
-        Remove and output the element at the start of the queue
-        '''
+if __package__:  # Imported as a submodule of the package
+    from . import Shared_utilities
+    from .Queue_array_implementation import Queue
+else:
+    import Shared_utilities
+    from Queue_array_implementation import Queue
 
-        return self.queue.pop(0)
 
-    def is_empty(self):
-
-        '''
-        Output boolean value for whether the queue is empty or not
-        '''
-
-        if self.queue == []:
-            return True
-        else:
-            return False
+log_debug = Shared_utilities.debug_logger(__name__)
 
 
 class Graph:
@@ -334,7 +310,8 @@ class Graph:
             origin_node (str): The origin vertex
             destination_node (str): The destination vertex
         Output:
-            A list of the vertices through which the destination is reached
+            A list of the vertices through which the destination is reached.
+            None if the destination is unreachable
         '''
 
         dict_distance, dict_prev_node = self.breadth_first_search(dict_graph,
@@ -343,8 +320,9 @@ class Graph:
         if dict_distance[destination_node] == \
                 len(self.get_list_vertices(dict_graph)) + 1000:
 
-            print('The destination node is unreachable from the origin node!')
-            return
+            log_debug('%s is unreachable from %s', destination_node,
+                      origin_node)
+            return None
 
         output_path_reverse = [destination_node]
         curr_node = destination_node
@@ -355,50 +333,60 @@ class Graph:
 
         return output_path_reverse[::-1]
 
-# Example of an undirected graph.
-dict_undirected_graph = {}
-dict_undirected_graph['A'] = ['B', 'C', 'D']
-dict_undirected_graph['B'] = ['A', 'C']
-dict_undirected_graph['C'] = ['A', 'B']
-dict_undirected_graph['D'] = ['A']
-dict_undirected_graph['E'] = ['F']
-dict_undirected_graph['F'] = ['E']
-dict_undirected_graph['G'] = ['H', 'I']
-dict_undirected_graph['H'] = ['G', 'I']
-dict_undirected_graph['I'] = ['G', 'H']
-
-undirected_graph = Graph(dict_undirected_graph)
-dict_dfs_info = undirected_graph.depth_first_search(dict_undirected_graph)
-print(dict_dfs_info['dict_visited'])
-print(dict_dfs_info['dict_previsit_clock'])
-print(dict_dfs_info['dict_postvisit_clock'])
-print(dict_dfs_info['connected_component'])
-
-# Example on directed graph
-dict_directed_graph = {}
-dict_directed_graph['A'] = ['B']
-dict_directed_graph['B'] = ['E', 'F']
-dict_directed_graph['C'] = ['B']
-dict_directed_graph['D'] = ['A', 'G']
-dict_directed_graph['E'] = ['A', 'C', 'H']
-dict_directed_graph['F'] = []
-dict_directed_graph['G'] = ['H']
-dict_directed_graph['H'] = ['I']
-dict_directed_graph['I'] = ['F', 'H']
-
-directed_graph = Graph(dict_directed_graph)
-dict_directed_graph_reverse = directed_graph.reverse_graph(dict_directed_graph)
-list_all_scc = directed_graph.strongly_connected_componenets(
+
+if __name__ == '__main__':
+    # Example of an undirected graph.
+    dict_undirected_graph = {}
+    dict_undirected_graph['A'] = ['B', 'C', 'D']
+    dict_undirected_graph['B'] = ['A', 'C']
+    dict_undirected_graph['C'] = ['A', 'B']
+    dict_undirected_graph['D'] = ['A']
+    dict_undirected_graph['E'] = ['F']
+    dict_undirected_graph['F'] = ['E']
+    dict_undirected_graph['G'] = ['H', 'I']
+    dict_undirected_graph['H'] = ['G', 'I']
+    dict_undirected_graph['I'] = ['G', 'H']
+
+    undirected_graph = Graph(dict_undirected_graph)
+    dict_dfs_info = undirected_graph.depth_first_search(dict_undirected_graph)
+    print(dict_dfs_info['dict_visited'])
+    print(dict_dfs_info['dict_previsit_clock'])
+    print(dict_dfs_info['dict_postvisit_clock'])
+    print(dict_dfs_info['connected_component'])
+
+    # Example on directed graph
+    dict_directed_graph = {}
+    dict_directed_graph['A'] = ['B']
+    dict_directed_graph['B'] = ['E', 'F']
+    dict_directed_graph['C'] = ['B']
+    dict_directed_graph['D'] = ['A', 'G']
+    dict_directed_graph['E'] = ['A', 'C', 'H']
+    dict_directed_graph['F'] = []
+    dict_directed_graph['G'] = ['H']
+    dict_directed_graph['H'] = ['I']
+    dict_directed_graph['I'] = ['F', 'H']
+
+    directed_graph = Graph(dict_directed_graph)
+    dict_directed_graph_reverse = directed_graph.reverse_graph(
+                                                        dict_directed_graph)
+    list_all_scc = directed_graph.strongly_connected_componenets(
                                                         dict_directed_graph)
 
-# Since dict_directed_graph would have chnaged, we reverse the reverse_graph
-# to get it back
-dict_directed_graph = directed_graph.reverse_graph(dict_directed_graph_reverse)
+    # Since dict_directed_graph would have chnaged, we reverse the
+    # reverse_graph to get it back
+    dict_directed_graph = directed_graph.reverse_graph(
+                                                dict_directed_graph_reverse)
 
-dict_distance, dict_prev_node = directed_graph.breadth_first_search(
+    dict_distance, dict_prev_node = directed_graph.breadth_first_search(
                                                         dict_directed_graph,
                                                         origin_node='A')
 
-output_path = directed_graph.get_shortest_path(dict_directed_graph, 'A', 'I')
-output_path = directed_graph.get_shortest_path(dict_directed_graph, 'A', 'F')
-output_path = directed_graph.get_shortest_path(dict_directed_graph, 'A', 'D')
+    output_path = directed_graph.get_shortest_path(dict_directed_graph,
+                                                   'A', 'I')
+    print(output_path)
+    output_path = directed_graph.get_shortest_path(dict_directed_graph,
+                                                   'A', 'F')
+    print(output_path)
+    output_path = directed_graph.get_shortest_path(dict_directed_graph,
+                                                   'A', 'D')
+    print(output_path)
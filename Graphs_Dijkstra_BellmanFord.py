@@ -346,7 +346,8 @@ class Graph:
         Function:
             Algorithm to find the fastest paths from an input origin to the
             rest of the vertices without the restriction of positive edges.
-            However, there must not be any negative cycles in the graph.
+            However, there must not be any negative cycles in the graph,
+            otherwise ValueError is raised.
         Input:
             origin (str): The origin vertex
         Output:
@@ -395,62 +396,67 @@ class Graph:
                 dict_distance_last_plus_1_step = dict_distance.copy()
 
                 if dict_distance_last_step != dict_distance_last_plus_1_step:
-                    print("There's a negative cycle in the graph!")
-                    return
+                    raise ValueError("There's a negative cycle in the graph!")
 
             iter_num += 1
 
         return dict_distance, dict_previous_vertex
 
-# If an edge of weight 5 goes from A to B we specify {(A, B) : 5}
-dict_graph = {}
-dict_graph[('S', 'A')] = 3
-dict_graph[('S', 'B')] = 10
-dict_graph[('A', 'B')] = 8
-dict_graph[('A', 'C')] = 3
-dict_graph[('A', 'D')] = 5
-dict_graph[('B', 'A')] = 2
-dict_graph[('B', 'D')] = 5
-dict_graph[('C', 'B')] = 3
-dict_graph[('C', 'D')] = 1
-dict_graph[('C', 'E')] = 2
-dict_graph[('D', 'E')] = 0
-
-directed_graph = Graph(dict_graph)
-# Expected output: S-0, A-3, B-9, C-6, D-7, E-7
-dict_distance_dj, dict_previous_vertex_dj = directed_graph.dijkstra('S')
-print(dict_distance_dj)
-# Expected output: S, A, C, D, E
-fastest_path = directed_graph.get_fastest_path('S', 'E')
-print(fastest_path)
-
-# For negative , use Bellman Ford algorithm
-dict_graph = {}
-dict_graph[('S', 'A')] = 4
-dict_graph[('S', 'B')] = 3
-dict_graph[('A', 'B')] = -2
-dict_graph[('A', 'C')] = 4
-dict_graph[('B', 'C')] = -3
-dict_graph[('B', 'D')] = 1
-dict_graph[('C', 'D')] = 2
-
-directed_graph = Graph(dict_graph)
-# Expected output:
-# S:0, A:4, B:2, C:-1, D: 1
-dict_distance_bf, dict_previous_vertex_bf = directed_graph.bellman_ford('S')
-print(dict_distance_bf)
-
-# Test case with a negative cycle (B-C-D)
-dict_graph = {}
-dict_graph[('S', 'A')] = 4
-dict_graph[('S', 'B')] = 3
-dict_graph[('A', 'B')] = -2
-dict_graph[('A', 'C')] = 4
-dict_graph[('B', 'C')] = -3
-dict_graph[('C', 'D')] = 2
-dict_graph[('D', 'B')] = -10
-
-directed_graph = Graph(dict_graph)
-# Expected output:
-# S:0, A:4, B:2, C:-1, D: 1
-directed_graph.bellman_ford('S')
+
+if __name__ == '__main__':
+    # If an edge of weight 5 goes from A to B we specify {(A, B) : 5}
+    dict_graph = {}
+    dict_graph[('S', 'A')] = 3
+    dict_graph[('S', 'B')] = 10
+    dict_graph[('A', 'B')] = 8
+    dict_graph[('A', 'C')] = 3
+    dict_graph[('A', 'D')] = 5
+    dict_graph[('B', 'A')] = 2
+    dict_graph[('B', 'D')] = 5
+    dict_graph[('C', 'B')] = 3
+    dict_graph[('C', 'D')] = 1
+    dict_graph[('C', 'E')] = 2
+    dict_graph[('D', 'E')] = 0
+
+    directed_graph = Graph(dict_graph)
+    # Expected output: S-0, A-3, B-9, C-6, D-7, E-7
+    dict_distance_dj, dict_previous_vertex_dj = directed_graph.dijkstra('S')
+    print(dict_distance_dj)
+    # Expected output: S, A, C, D, E
+    fastest_path = directed_graph.get_fastest_path('S', 'E')
+    print(fastest_path)
+
+    # For negative , use Bellman Ford algorithm
+    dict_graph = {}
+    dict_graph[('S', 'A')] = 4
+    dict_graph[('S', 'B')] = 3
+    dict_graph[('A', 'B')] = -2
+    dict_graph[('A', 'C')] = 4
+    dict_graph[('B', 'C')] = -3
+    dict_graph[('B', 'D')] = 1
+    dict_graph[('C', 'D')] = 2
+
+    directed_graph = Graph(dict_graph)
+    # Expected output:
+    # S:0, A:4, B:2, C:-1, D: 1
+    dict_distance_bf, dict_previous_vertex_bf = \
+        directed_graph.bellman_ford('S')
+    print(dict_distance_bf)
+
+    # Test case with a negative cycle (B-C-D)
+    dict_graph = {}
+    dict_graph[('S', 'A')] = 4
+    dict_graph[('S', 'B')] = 3
+    dict_graph[('A', 'B')] = -2
+    dict_graph[('A', 'C')] = 4
+    dict_graph[('B', 'C')] = -3
+    dict_graph[('C', 'D')] = 2
+    dict_graph[('D', 'B')] = -10
+
+    directed_graph = Graph(dict_graph)
+    # Expected output:
+    # S:0, A:4, B:2, C:-1, D: 1
+    try:
+        directed_graph.bellman_ford('S')
+    except ValueError as error:
+        print(error)
@@ -428,25 +428,28 @@ class Graph:
 
         return connections_list, total_cost
 
-dict_graph = {}
-dict_graph[('A', 'B')] = 4
-dict_graph[('A', 'D')] = 2
-dict_graph[('A', 'E')] = 1
-dict_graph[('B', 'C')] = 8
-dict_graph[('B', 'E')] = 5
-dict_graph[('B', 'F')] = 6
-dict_graph[('C', 'F')] = 1
-dict_graph[('D', 'E')] = 3
-dict_graph[('E', 'F')] = 9
-
-undirected_graph = Graph(dict_graph)
-# Expected output : Cost-14, Connections- [(A,B), (A,D), (A,E), (B,F), (C,F)]
-# Note that the vertices could appear in reverse, since it's an undirected
-# graph
-connections_list_kr, total_cost_kr = undirected_graph.kruskal()
-print(total_cost_kr)
-print(connections_list_kr)
-
-connections_list_pr, total_cost_pr = undirected_graph.prim()
-print(total_cost_pr)
-print(connections_list_pr)
+
+if __name__ == '__main__':
+    dict_graph = {}
+    dict_graph[('A', 'B')] = 4
+    dict_graph[('A', 'D')] = 2
+    dict_graph[('A', 'E')] = 1
+    dict_graph[('B', 'C')] = 8
+    dict_graph[('B', 'E')] = 5
+    dict_graph[('B', 'F')] = 6
+    dict_graph[('C', 'F')] = 1
+    dict_graph[('D', 'E')] = 3
+    dict_graph[('E', 'F')] = 9
+
+    undirected_graph = Graph(dict_graph)
+    # Expected output : Cost-14,
+    #   Connections- [(A,B), (A,D), (A,E), (B,F), (C,F)]
+    # Note that the vertices could appear in reverse, since it's an undirected
+    # graph
+    connections_list_kr, total_cost_kr = undirected_graph.kruskal()
+    print(total_cost_kr)
+    print(connections_list_kr)
+
+    connections_list_pr, total_cost_pr = undirected_graph.prim()
+    print(total_cost_pr)
+    print(connections_list_pr)
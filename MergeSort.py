@@ -1,32 +1,146 @@
 '''
 Merfe sort is a sorting algorithm which uses the divide and conquer principle
 to sort an array in O(nlog(n)) worse time
+
+The implementation below is bottom-up: instead of recursively splitting the
+array, runs of width 1, 2, 4, ... are merged pairwise. Each pass reads from one
+buffer and writes into the other, so only two buffers of size n are ever
+allocated, no matter how many passes are made.
+    1. Time complexity: O(nlog(n))
+    2. Space complexity: O(n)
+    3. Stable: equal values keep their input order
+
+For large numeric arrays, parallel_merge_sort spreads the work over a pool of
+processes. The values are placed in shared memory, so the workers read and
+write them in place instead of receiving pickled copies:
+    1. Every worker sorts one chunk of the array
+    2. Splitter values cut each sorted chunk into ranges such that every
+        range of the output is made of one slice of each chunk
+    3. Every worker k-way merges the slices of one output range
+
+For inputs which are already partly ordered, natural_merge_sort finds the runs
+that are present in the input (reversing the descending ones) instead of
+starting from runs of width 1, and merges them with galloping i.e. when one
+run keeps winning, the number of its values to copy over is found by an
+exponential search instead of one comparison per value. Already sorted or
+reversed inputs are sorted in O(n).
+
+For files larger than the memory, external_merge_sort reads the records in
+batches that fit a memory budget, writes each sorted batch (a run) to a
+temporary file and then k-way merges the runs while streaming them from disk.
 '''
 
+from array import array as typed_array
+from copy import copy
+from heapq import merge as k_way_merge
+from os import cpu_count, path as os_path, remove
+
+MIN_GALLOP = 7  # Consecutive wins of one run after which galloping starts
+
 
 class MergeSort:
 
     def __init__(self, array):
         self.array = array
 
-    def merge_sort(self, array):
+    def merge_sort(self, array, key=None, reverse=False):
 
         '''
-        The main recursive function to sort the input array. See examples below
+        Function:
+            Sort the input array and return the sorted copy. The input array
+            itself isn't modified. See examples below
+        Input:
+            array (sequence): Values to be sorted. A list, array.array or
+                                1-D NumPy array. The output is of same type
+            key (function): Optional, maps a value to the priority it's sorted
+                            by. The priorities are computed once
+            reverse (bool): If True, sort in descending order. Equal values
+                            still keep their input order
+        Output:
+            sorted_array (sequence): The sorted copy of the array
         '''
 
-        if len(array) > 1:
-            middle = int(len(array)/2)
-            left_array = array[:middle]
-            right_array = array[middle:]
-            left_array = self.merge_sort(left_array)
-            right_array = self.merge_sort(right_array)
-            sorted_array = self.merge(left_array, right_array)
+        n = len(array)
 
+        if key is None:
+            src_keys = copy(array)
+            dst_keys = copy(array)
+            src_values = None
+            dst_values = None
         else:
-            sorted_array = array
+            src_keys = [key(value) for value in array]
+            dst_keys = src_keys.copy()
+            src_values = copy(array)
+            dst_values = copy(array)
 
-        return sorted_array
+        width = 1
+
+        while width < n:
+            for low in range(0, n, 2*width):
+                middle = min(low + width, n)
+                high = min(low + 2*width, n)
+                self.merge_runs(src_keys, dst_keys, src_values, dst_values,
+                                low, middle, high, reverse)
+
+            src_keys, dst_keys = dst_keys, src_keys
+            src_values, dst_values = dst_values, src_values
+            width *= 2
+
+        if key is None:
+            return src_keys
+
+        return src_values
+
+    def merge_runs(self, src_keys, dst_keys, src_values, dst_values, low,
+                   middle, high, reverse=False):
+
+        '''
+        Function:
+            Merge the sorted runs src[low:middle] and src[middle:high] into
+            dst[low:high]. Values from the left run win ties
+        Input:
+            src_keys, dst_keys (sequence): Buffers read from and written to
+            src_values, dst_values (sequence): Buffers moved along with the
+                                                keys. None if the keys are the
+                                                values
+            low, middle, high (int): Boundaries of the two runs
+            reverse (bool): If True, the runs are in descending order
+        '''
+
+        i = low
+        j = middle
+        k = low
+
+        while (i < middle) and (j < high):
+            if reverse:
+                take_right = src_keys[i] < src_keys[j]
+            else:
+                take_right = src_keys[j] < src_keys[i]
+
+            if take_right:
+                dst_keys[k] = src_keys[j]
+                if src_values is not None:
+                    dst_values[k] = src_values[j]
+                j += 1
+
+            else:
+                dst_keys[k] = src_keys[i]
+                if src_values is not None:
+                    dst_values[k] = src_values[i]
+                i += 1
+
+            k += 1
+
+        # At most one of the runs has values left. They're already in order
+        if i < middle:
+            dst_keys[k: high] = src_keys[i: middle]
+            if src_values is not None:
+                dst_values[k: high] = src_values[i: middle]
+
+        elif j < high:
+            dst_keys[k: high] = src_keys[j: high]
+            if src_values is not None:
+                dst_values[k: high] = src_values[j: high]
 
     def merge(self, array1, array2):
 
@@ -34,37 +148,761 @@ class MergeSort:
         Compares the elemts of the input arrays and outputs a sorted array
         '''
 
-        sorted_array = []
-        while (array1 != []) & (array2 != []):
+        sorted_array = [None]*(len(array1) + len(array2))
+        self.merge_runs(array1 + array2, sorted_array, None, None, 0,
+                        len(array1), len(sorted_array))
+
+        return sorted_array
+
+    def natural_merge_sort(self, array, key=None, reverse=False, min_run=32):
+
+        '''
+        Function:
+            Adaptive version of merge_sort. Same inputs and output, but the
+            runs already present in the input are used as the starting point.
+            Runs shorter than min_run are extended with a binary insertion sort
+        Input:
+            array (sequence): Values to be sorted. A list, array.array or
+                                1-D NumPy array. The output is of same type
+            key (function): Optional, maps a value to the priority it's sorted
+                            by. The priorities are computed once
+            reverse (bool): If True, sort in descending order. Equal values
+                            still keep their input order
+            min_run (int): Minimum length of the runs that are merged
+        Output:
+            sorted_array (sequence): The sorted copy of the array
+        '''
+
+        n = len(array)
 
-            if array1[0] <= array2[0]:
-                sorted_array.append(array1[0])
-                array1.pop(0)
+        if key is None:
+            src_keys = copy(array)
+            src_values = None
+        else:
+            src_keys = [key(value) for value in array]
+            src_values = copy(array)
 
-            else:
-                sorted_array.append(array2[0])
-                array2.pop(0)
+        # A stable descending sort is a stable ascending sort of the reversed
+        # input, reversed back
+        if reverse:
+            reverse_range(src_keys, 0, n)
+            if src_values is not None:
+                reverse_range(src_values, 0, n)
+
+        run_bounds = [0]
+        low = 0
+
+        while low < n:
+            high = self.find_run(src_keys, src_values, low, n)
+
+            if high - low < min_run:
+                run_end = high
+                high = min(low + min_run, n)
+                self.binary_insertion_sort(src_keys, src_values, low, run_end,
+                                           high)
+
+            run_bounds.append(high)
+            low = high
+
+        dst_keys = copy(src_keys)
+        dst_values = None if src_values is None else copy(src_values)
 
-        if array1 != []:
-            sorted_array = sorted_array + array1
+        while len(run_bounds) > 2:
+            merged_bounds = [0]
 
-        if array2 != []:
-            sorted_array = sorted_array + array2
+            for idx in range(0, len(run_bounds) - 1, 2):
+                low = run_bounds[idx]
+
+                if idx + 2 < len(run_bounds):
+                    high = run_bounds[idx + 2]
+                    self.gallop_merge_runs(src_keys, dst_keys, src_values,
+                                           dst_values, low,
+                                           run_bounds[idx + 1], high)
+                else:  # Odd run out, carried over to the next pass
+                    high = run_bounds[idx + 1]
+                    dst_keys[low: high] = src_keys[low: high]
+                    if src_values is not None:
+                        dst_values[low: high] = src_values[low: high]
+
+                merged_bounds.append(high)
+
+            run_bounds = merged_bounds
+            src_keys, dst_keys = dst_keys, src_keys
+            src_values, dst_values = dst_values, src_values
+
+        sorted_array = src_keys if key is None else src_values
+
+        if reverse:
+            reverse_range(sorted_array, 0, n)
 
         return sorted_array
 
-# Examples
-array = [34, 21, 65, 2, -76, 546, 43]
-print(MergeSort(array).merge_sort(array))
+    def find_run(self, keys, values, low, high):
+
+        '''
+        Function:
+            Find the run starting at low, i.e. the longest non-descending or
+            strictly descending sequence of values. Descending runs are
+            reversed in place. Strictness keeps equal values in input order
+        Output:
+            The index at which the run ends
+        '''
+
+        run_end = low + 1
+
+        if run_end >= high:
+            return high
+
+        if keys[run_end] < keys[low]:
+            while (run_end < high) and (keys[run_end] < keys[run_end - 1]):
+                run_end += 1
+
+            reverse_range(keys, low, run_end)
+            if values is not None:
+                reverse_range(values, low, run_end)
+
+        else:
+            while (run_end < high) and \
+                    not (keys[run_end] < keys[run_end - 1]):
+                run_end += 1
+
+        return run_end
+
+    def binary_insertion_sort(self, keys, values, low, start, high):
+
+        '''
+        Function:
+            Sort keys[low:high] in place given that keys[low:start] is already
+            sorted. Every other value is inserted after the equal values
+            already placed, which keeps the sort stable
+        '''
+
+        for idx in range(start, high):
+            key_value = keys[idx]
+            left = low
+            right = idx
+
+            while left < right:
+                middle = (left + right)//2
+                if key_value < keys[middle]:
+                    right = middle
+                else:
+                    left = middle + 1
+
+            if left == idx:
+                continue
+
+            keys[left + 1: idx + 1] = keys[left: idx]
+            keys[left] = key_value
+
+            if values is not None:
+                value = values[idx]
+                values[left + 1: idx + 1] = values[left: idx]
+                values[left] = value
+
+    def gallop_merge_runs(self, src_keys, dst_keys, src_values, dst_values,
+                          low, middle, high):
+
+        '''
+        Function:
+            Same as merge_runs, for ascending runs, but once a run has won
+            MIN_GALLOP times in a row, all of its values which still come
+            before the head of the other run are found with gallop and copied
+            over at once
+        '''
+
+        i = low
+        j = middle
+        k = low
+        left_wins = 0
+        right_wins = 0
+
+        while (i < middle) and (j < high):
+            if src_keys[j] < src_keys[i]:
+                dst_keys[k] = src_keys[j]
+                if src_values is not None:
+                    dst_values[k] = src_values[j]
+
+                j += 1
+                k += 1
+                right_wins += 1
+                left_wins = 0
+
+                if (right_wins >= MIN_GALLOP) and (j < high):
+                    end = gallop(src_keys, src_keys[i], j, high, True)
+                    dst_keys[k: k + end - j] = src_keys[j: end]
+                    if src_values is not None:
+                        dst_values[k: k + end - j] = src_values[j: end]
+
+                    k += end - j
+                    j = end
+                    right_wins = 0
+
+            else:
+                dst_keys[k] = src_keys[i]
+                if src_values is not None:
+                    dst_values[k] = src_values[i]
+
+                i += 1
+                k += 1
+                left_wins += 1
+                right_wins = 0
+
+                if (left_wins >= MIN_GALLOP) and (i < middle):
+                    end = gallop(src_keys, src_keys[j], i, middle, False)
+                    dst_keys[k: k + end - i] = src_keys[i: end]
+                    if src_values is not None:
+                        dst_values[k: k + end - i] = src_values[i: end]
+
+                    k += end - i
+                    i = end
+                    left_wins = 0
+
+        if i < middle:
+            dst_keys[k: high] = src_keys[i: middle]
+            if src_values is not None:
+                dst_values[k: high] = src_values[i: middle]
+
+        elif j < high:
+            dst_keys[k: high] = src_keys[j: high]
+            if src_values is not None:
+                dst_values[k: high] = src_values[j: high]
+
+
+def reverse_range(array, low, high):
+
+    '''
+    Reverse array[low:high] in place. Works for lists, array.array and NumPy
+    '''
+
+    array[low: high] = array[low: high][::-1]
+
+
+def gallop(keys, value, low, high, strict):
+
+    '''
+    Function:
+        Find how far the sorted keys[low:high] run before the input value.
+        Positions low+1, low+3, low+7, ... are probed until the value is
+        passed, then a binary search is done over the last gap
+    Input:
+        strict (bool): If True, count the keys which are strictly lesser than
+                        the value. Otherwise count the keys <= the value
+    Output:
+        The index of the first key which doesn't come before the value
+    '''
+
+    offset = 1
+
+    while low + offset < high:
+        probe = keys[low + offset]
+        if (probe < value) if strict else not (value < probe):
+            offset = 2*offset + 1
+        else:
+            break
+
+    left = low + (offset - 1)//2 + 1 if offset > 1 else low
+    right = min(low + offset, high)
+
+    while left < right:
+        middle = (left + right)//2
+        probe = keys[middle]
+        if (probe < value) if strict else not (value < probe):
+            left = middle + 1
+        else:
+            right = middle
+
+    return left
+
+
+def benchmark_merge_sort(n=100000, repeat=3):
+
+    '''
+    Function:
+        Compare merge_sort, natural_merge_sort and the built-in sorted on
+        sorted, reversed, 99% sorted, random and few-unique inputs of size n
+    Input:
+        n (int): Number of values to sort
+        repeat (int): Number of timing runs. The best one is reported
+    Output:
+        dict_timings (dict): Best time in seconds per (input, implementation)
+    '''
+
+    from random import randint, random
+    from timeit import repeat as repeat_timer
+
+    nearly_sorted = list(range(n))
+    for i in range(n//100):
+        nearly_sorted[randint(0, n - 1)] = randint(0, n - 1)
+
+    dict_inputs = {'sorted': list(range(n)),
+                   'reversed': list(range(n, 0, -1)),
+                   '99% sorted': nearly_sorted,
+                   'random': [random() for i in range(n)],
+                   'few unique': [randint(0, 9) for i in range(n)]}
+    merge_sort = MergeSort(None)
+    dict_sorts = {'merge_sort': merge_sort.merge_sort,
+                  'natural_merge_sort': merge_sort.natural_merge_sort,
+                  'sorted': sorted}
+    dict_timings = {}
+
+    for input_name, array in dict_inputs.items():
+        for sort_name, sort in dict_sorts.items():
+            timing = min(repeat_timer(lambda: sort(array), number=1,
+                                      repeat=repeat))
+            dict_timings[(input_name, sort_name)] = timing
+            print(input_name + ', ' + sort_name + ': ' +
+                  str(round(timing, 4)) + 's')
+
+    return dict_timings
+
+
+def attach_shared_memory(name):
+
+    '''
+    Attach to an existing shared memory block without registering it with the
+    resource tracker (only the creating process unlinks it)
+    '''
+
+    from multiprocessing.shared_memory import SharedMemory
+
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 always tracks
+        return SharedMemory(name=name)
+
+
+def sort_shared_chunk(name, typecode, low, high, reverse):
+
+    '''
+    Function:
+        Worker for parallel_merge_sort. Sort the values at [low, high) of a
+        shared memory buffer in place
+    Input:
+        name (str): Name of the shared memory block
+        typecode (str): array.array typecode of the values
+        low, high (int): Boundaries of the chunk
+        reverse (bool): If True, sort in descending order
+    '''
+
+    shared_memory = attach_shared_memory(name)
+    view = shared_memory.buf.cast(typecode)
+
+    try:
+        chunk = typed_array(typecode, view[low: high])
+        view[low: high] = MergeSort(chunk).merge_sort(chunk, reverse=reverse)
+    finally:
+        view.release()
+        shared_memory.close()
+
+
+def merge_shared_partition(src_name, dst_name, typecode, run_slices,
+                           dst_low, reverse):
+
+    '''
+    Function:
+        Worker for parallel_merge_sort. K-way merge one slice of every sorted
+        chunk into the output buffer. Values from earlier chunks win ties
+    Input:
+        src_name, dst_name (str): Names of the shared memory blocks holding
+                                    the sorted chunks and the output
+        typecode (str): array.array typecode of the values
+        run_slices (list): (low, high) boundaries of the slice of each chunk
+        dst_low (int): Position in the output where the merged values start
+        reverse (bool): If True, the chunks are in descending order
+    '''
+
+    src_memory = attach_shared_memory(src_name)
+    dst_memory = attach_shared_memory(dst_name)
+    src_view = src_memory.buf.cast(typecode)
+    dst_view = dst_memory.buf.cast(typecode)
+
+    try:
+        merged = typed_array(typecode, k_way_merge(
+            *[src_view[low: high] for low, high in run_slices],
+            reverse=reverse))
+        dst_view[dst_low: dst_low + len(merged)] = merged
+    finally:
+        src_view.release()
+        dst_view.release()
+        src_memory.close()
+        dst_memory.close()
+
+
+def count_before(view, low, high, value, reverse):
+
+    '''
+    Function:
+        Binary search for the number of values in the sorted view[low:high]
+        which come strictly before the input value
+    Output:
+        The index of the first value which doesn't come before the input
+    '''
+
+    while low < high:
+        middle = (low + high)//2
+        if (value < view[middle]) if reverse else (view[middle] < value):
+            low = middle + 1
+        else:
+            high = middle
+
+    return low
+
+
+def round_trips(values, array):
+
+    '''
+    Function:
+        Check that converting a typed array back to a list gives the input
+        list exactly, with the same value and type for every element
+    Input:
+        values (array.array): The values of the list, as a typed array
+        array (list): The list
+    '''
+
+    converted = values.tolist()
+
+    return (converted == array) and \
+        all(type(value) is type(original)
+            for value, original in zip(converted, array))
+
+
+def parallel_merge_sort(array, typecode=None, reverse=False,
+                        max_workers=None, min_chunk_size=100000):
+
+    '''
+    Function:
+        Sort a numeric array using a pool of processes. The output is the same
+        as that of MergeSort.merge_sort, including the order of equal values
+    Input:
+        array (sequence): Numeric values. A list, array.array or 1-D NumPy
+                            array. The input itself isn't modified
+        typecode (str): array.array typecode the values are stored as in
+                        shared memory. Taken from array.array/NumPy inputs.
+                        For lists, 'q' if all values are int, else 'd'. A
+                        list whose values don't all come back unchanged
+                        from the typecode (eg. ints and floats mixed, ints
+                        beyond 64 bits) is sorted sequentially instead
+        reverse (bool): If True, sort in descending order
+        max_workers (int): Number of worker processes. Defaults to the number
+                            of CPUs
+        min_chunk_size (int): Arrays are never cut into chunks smaller than
+                                this. Smaller arrays are sorted sequentially
+    Output:
+        sorted_array (sequence): The sorted copy, of the same type as the
+                                    input
+    '''
+
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing.shared_memory import SharedMemory
+
+    n = len(array)
+
+    if max_workers is None:
+        max_workers = cpu_count() or 1
+
+    num_chunks = min(max_workers, n//max(min_chunk_size, 1))
+
+    if num_chunks < 2:
+        return MergeSort(array).merge_sort(array, reverse=reverse)
+
+    if typecode is None:
+        if hasattr(array, 'typecode'):
+            typecode = array.typecode
+        elif hasattr(array, 'dtype'):
+            typecode = array.dtype.char
+        elif all(type(value) is int for value in array):
+            typecode = 'q'
+        else:
+            typecode = 'd'
+
+    if isinstance(array, list):
+        try:
+            values = typed_array(typecode, array)
+        except (OverflowError, TypeError):
+            values = None
+
+        if (values is None) or not round_trips(values, array):
+            return MergeSort(array).merge_sort(array, reverse=reverse)
+
+    else:
+        values = typed_array(typecode, array)
+    nbytes = max(n*values.itemsize, 1)
+    src_memory = SharedMemory(create=True, size=nbytes)
+    dst_memory = SharedMemory(create=True, size=nbytes)
+    src_view = src_memory.buf.cast(typecode)
+    dst_view = dst_memory.buf.cast(typecode)
+
+    try:
+        src_view[:n] = values
+        del values
+
+        chunk_bounds = [(i*n//num_chunks, (i + 1)*n//num_chunks)
+                        for i in range(num_chunks)]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for future in [executor.submit(sort_shared_chunk,
+                                           src_memory.name, typecode, low,
+                                           high, reverse)
+                           for low, high in chunk_bounds]:
+                future.result()
+
+            # Splitters are evenly spaced values of the sorted chunks. Every
+            # output partition gets the values between two splitters
+            samples = []
+            for low, high in chunk_bounds:
+                step = max((high - low)//num_chunks, 1)
+                samples.extend(src_view[idx] for idx in range(low, high, step))
+
+            samples = MergeSort(samples).merge_sort(samples, reverse=reverse)
+            splitters = [samples[i*len(samples)//num_chunks]
+                         for i in range(1, num_chunks)]
+
+            cuts = [[low for low, high in chunk_bounds]]
+            for splitter in splitters:
+                cuts.append([count_before(src_view, low, high, splitter,
+                                          reverse)
+                             for low, high in chunk_bounds])
+            cuts.append([high for low, high in chunk_bounds])
+
+            futures = []
+            dst_low = 0
+            for i in range(num_chunks):
+                run_slices = list(zip(cuts[i], cuts[i + 1]))
+                futures.append(executor.submit(
+                    merge_shared_partition, src_memory.name, dst_memory.name,
+                    typecode, run_slices, dst_low, reverse))
+                dst_low += sum(high - low for low, high in run_slices)
+
+            for future in futures:
+                future.result()
+
+        sorted_values = typed_array(typecode, dst_view[:n])
+
+    finally:
+        src_view.release()
+        dst_view.release()
+        src_memory.close()
+        dst_memory.close()
+        src_memory.unlink()
+        dst_memory.unlink()
+
+    if isinstance(array, list):
+        return sorted_values.tolist()
+
+    if isinstance(array, typed_array):
+        return sorted_values
+
+    sorted_array = copy(array)
+    sorted_array[:] = sorted_values
+
+    return sorted_array
+
+
+def read_records(file, record_size=None, buffer_size=1 << 20):
+
+    '''
+    Function:
+        Helper for external_merge_sort. Lazily read the records of a file
+        opened in binary mode
+    Input:
+        file (file object): The file to read from
+        record_size (int): Size in bytes of fixed-width binary records. If
+                            None, the records are newline-delimited lines
+        buffer_size (int): Number of bytes read at a time for binary records
+    Output:
+        Generator of the records as bytes. Lines always end with a newline
+    '''
+
+    if record_size is None:
+        for line in file:
+            if not line.endswith(b'\n'):
+                line += b'\n'
+            yield line
+
+        return
+
+    block_size = max(buffer_size//record_size, 1)*record_size
+
+    while True:
+        block = file.read(block_size)
+        if not block:
+            return
+
+        if len(block) % record_size != 0:
+            raise ValueError('The file size is not a multiple of the record '
+                             'size!')
+
+        view = memoryview(block)
+        for idx in range(0, len(block), record_size):
+            yield bytes(view[idx: idx + record_size])
+
+        view.release()
+
+
+def write_run(records, file_path, buffer_size=1 << 20):
+
+    '''
+    Helper for external_merge_sort. Write records to a file and return its path
+    '''
+
+    with open(file_path, 'wb', buffering=buffer_size) as file:
+        file.writelines(records)
+
+    return file_path
+
+
+def merge_run_files(run_paths, key=None, reverse=False, record_size=None,
+                    buffer_size=1 << 20):
+
+    '''
+    Function:
+        Helper for external_merge_sort. Lazily k-way merge sorted run files.
+        Records from earlier runs win ties
+    Output:
+        Generator of the merged records
+    '''
+
+    from contextlib import ExitStack
+
+    with ExitStack() as stack:
+        runs = [read_records(stack.enter_context(open(run_path, 'rb',
+                                                      buffering=buffer_size)),
+                             record_size, buffer_size)
+                for run_path in run_paths]
+
+        yield from k_way_merge(*runs, key=key, reverse=reverse)
+
+
+def external_merge_sort(input_path, output_path=None, record_size=None,
+                        key=None, reverse=False, memory_limit=1 << 28,
+                        buffer_size=1 << 20, max_fan_in=64, temp_dir=None):
+
+    '''
+    Function:
+        Sort the records of a file which doesn't fit in memory. Batches of
+        records that fit within memory_limit are sorted with merge_sort and
+        written as runs to temporary files. The runs are then merged with a
+        k-way merge, max_fan_in of them at a time (in several passes if there
+        are more runs than that). Runs are deleted as soon as they have been
+        merged, so they take about the size of the input on disk, plus one
+        merged run during a pass. The sort is stable
+    Input:
+        input_path (str): The file to sort
+        output_path (str): Optional, the file to write the sorted records to.
+                            If None, the sorted records are returned lazily
+        record_size (int): Size in bytes of fixed-width binary records. If
+                            None, the file is treated as newline-delimited
+        key (function): Optional, maps a record (bytes) to the priority it's
+                        sorted by
+        reverse (bool): If True, sort in descending order
+        memory_limit (int): Approximate number of bytes of records held in
+                            memory while building the runs
+        buffer_size (int): Size in bytes of the I/O buffer of every file
+        max_fan_in (int): Maximum number of runs merged at once
+        temp_dir (str): Optional, directory for the runs. Defaults to the
+                        system temp directory
+    Output:
+        output_path (str) if specified, else a generator of the sorted records
+        (bytes). The runs are deleted once the generator is exhausted or
+        closed
+    '''
+
+    from tempfile import TemporaryDirectory
+
+    def sorted_records():
+        with TemporaryDirectory(dir=temp_dir) as run_dir:
+            run_paths = []
+            batch = []
+            batch_size = 0
+
+            def flush_batch():
+                run_paths.append(write_run(
+                    MergeSort(batch).merge_sort(batch, key=key,
+                                                reverse=reverse),
+                    os_path.join(run_dir, str(len(run_paths))), buffer_size))
+
+            with open(input_path, 'rb', buffering=buffer_size) as file:
+                for record in read_records(file, record_size, buffer_size):
+                    batch.append(record)
+                    batch_size += len(record) + 64  # Object overhead
+
+                    if batch_size >= memory_limit:
+                        flush_batch()
+                        batch = []
+                        batch_size = 0
+
+            if batch != [] or run_paths == []:
+                flush_batch()
+                batch = []
+
+            num_runs = len(run_paths)
+
+            while len(run_paths) > max_fan_in:
+                merged_paths = []
+                for idx in range(0, len(run_paths), max_fan_in):
+                    group = run_paths[idx: idx + max_fan_in]
+                    merged_paths.append(write_run(
+                        merge_run_files(group, key, reverse, record_size,
+                                        buffer_size),
+                        os_path.join(run_dir, str(num_runs)), buffer_size))
+                    num_runs += 1
+
+                    # Free the disk space of the merged runs right away,
+                    # rather than at the end of the pass or of the sort
+                    for run_path in group:
+                        remove(run_path)
+
+                run_paths = merged_paths
+
+            yield from merge_run_files(run_paths, key, reverse, record_size,
+                                       buffer_size)
+
+    if output_path is None:
+        return sorted_records()
+
+    return write_run(sorted_records(), output_path, buffer_size)
+
+
+if __name__ == '__main__':
+    # Examples
+    from tempfile import TemporaryDirectory
+
+    array = [34, 21, 65, 2, -76, 546, 43]
+    print(MergeSort(array).merge_sort(array))
+
+    array = []
+    print(MergeSort(array).merge_sort(array))
+
+    array = [6]
+    print(MergeSort(array).merge_sort(array))
+
+    array = [12, 11, 10, 8, 7, 2]
+    print(MergeSort(array).merge_sort(array))
+
+    array = [2, 7, 8, 10, 11, 12]
+    print(MergeSort(array).merge_sort(array))
+
+    # Sorting by a key.
+    # Expected output: ['les', 'sam', 'alex', 'cathy', 'frank']
+    array = ['cathy', 'les', 'alex', 'frank', 'sam']
+    print(MergeSort(array).merge_sort(array, key=len))
 
-array = []
-print(MergeSort(array).merge_sort(array))
+    # Expected output: ['cathy', 'frank', 'alex', 'les', 'sam']
+    print(MergeSort(array).merge_sort(array, key=len, reverse=True))
 
-array = [6]
-print(MergeSort(array).merge_sort(array))
+    # Adaptive merge sort. Expected output: [2, 7, 8, 10, 11, 12]
+    array = [2, 7, 8, 10, 11, 12]
+    print(MergeSort(array).natural_merge_sort(array))
+    benchmark_merge_sort(n=10000, repeat=1)
 
-array = [12, 11, 10, 8, 7, 2]
-print(MergeSort(array).merge_sort(array))
+    # External sort of a small file, forcing one run per record
+    with TemporaryDirectory() as example_dir:
+        example_path = os_path.join(example_dir, 'example.txt')
+        with open(example_path, 'wb') as example_file:
+            example_file.write(b'les\ncathy\nsam\nalex\nfrank')
 
-array = [2, 7, 8, 10, 11, 12]
-print(MergeSort(array).merge_sort(array))
+        # Expected output:
+        #   [b'alex\n', b'cathy\n', b'frank\n', b'les\n', b'sam\n']
+        print(list(external_merge_sort(example_path, memory_limit=1,
+                                       max_fan_in=2)))
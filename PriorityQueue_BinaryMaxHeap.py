@@ -10,15 +10,32 @@ Theory:
 
 For an alternative dictionary based implementation (where we keep each priority
 value mapped to an element) check out BinaryMinHeap.py
+
+Bulk operations (n = current size of the heap, k = size of the batch):
+    1. extend: O(n + k) using heapify, or O(k*log(n + k)) using repeated
+        shift up for small batches. The cheaper of the two is picked
+    2. pop_many: O(k*log(n))
+    3. merge: O(n + m) where m is the size of the other heap
+
+k largest elements (n = number of input values):
+    Only a min-heap of the k best values seen so far is kept in memory, so
+    the input can be any iterable (eg. a generator over the lines of a file).
+    Time complexity: O(n*log(k)), Space complexity: O(k)
 '''
 
+from itertools import islice
+from math import log2
+from os import cpu_count
+
 
 class BinaryMaxHeap:
 
-    def __init__(self, max_size):
+    def __init__(self, max_size, auto_grow=False):
         self.max_size = max_size
-        self.size = None
-        self.heap = None
+        self.auto_grow = auto_grow  # If True, max_size doubles whenever an
+        # insert would go past it instead of refusing the insert
+        self.size = 0
+        self.heap = []
 
     def parent_index(self, idx):
 
@@ -147,10 +164,31 @@ class BinaryMaxHeap:
             self.heap = array
 
         self.size = len(self.heap)
+        self.heapify()
+
+    def heapify(self):
+
+        '''
+        Function:
+            Restore the max-heap property over the first self.size values of
+            the heap. Only the nodes which have children need shifting down
+        '''
 
-        for idx in range(int(self.max_size/2) - 1, -1, -1):
+        for idx in range(self.size//2 - 1, -1, -1):
             self.shift_down(idx)
 
+    def grow(self, min_size):
+
+        '''
+        Function:
+            Double the capacity of the heap until it can hold min_size values
+        Input:
+            min_size (int): The number of values the heap must be able to hold
+        '''
+
+        while self.max_size < min_size:
+            self.max_size = max(2*self.max_size, 1)
+
     def insert(self, key):
 
         '''
@@ -159,16 +197,58 @@ class BinaryMaxHeap:
             isn't violdated
         Input:
             key (int): Value to be inserted
+            Raises IndexError if the heap is full and auto_grow is off
         '''
 
         if self.size == self.max_size:
-            print('Heap already at max capacity!')
-            return
+            if self.auto_grow:
+                self.grow(self.size + 1)
+
+            else:
+                raise IndexError('Heap already at max capacity!')
 
         self.size += 1
         self.heap.append(key)
         self.shift_up(self.size - 1)
 
+    def extend(self, iterable):
+
+        '''
+        Function:
+            Insert all the values of an input iterable into the heap. If the
+            batch is large compared to the heap, the values are appended and
+            the whole heap is rebuilt in linear time. Otherwise every value is
+            shifted up individually
+        Input:
+            iterable (iterable): Values to be inserted. If they don't all fit
+                                    and auto_grow is off, none is inserted and
+                                    IndexError is raised
+        '''
+
+        batch = list(iterable)
+
+        if self.size + len(batch) > self.max_size:
+            if self.auto_grow:
+                self.grow(self.size + len(batch))
+
+            else:
+                raise IndexError('Heap already at max capacity!')
+
+        if batch == []:
+            return
+
+        new_size = self.size + len(batch)
+        self.heap.extend(batch)
+
+        if len(batch)*log2(new_size) > new_size:
+            self.size = new_size
+            self.heapify()
+
+        else:
+            for idx in range(self.size, new_size):
+                self.size += 1
+                self.shift_up(idx)
+
     def extract_max(self):
 
         '''
@@ -180,12 +260,61 @@ class BinaryMaxHeap:
 
         result = self.heap[0]
         self.heap[0] = self.heap[self.size - 1]
-        self.heap = self.heap[:-1]
+        self.heap.pop()
         self.size -= 1
         self.shift_down(0)
 
         return result
 
+    def pop_many(self, k):
+
+        '''
+        Function:
+            Return and remove the k largest values of the heap
+        Input:
+            k (int): Number of values to extract. If the heap holds fewer
+                        values, all of them are extracted
+        Output:
+            result (list): The extracted values in descending order
+        '''
+
+        result = []
+
+        for i in range(min(k, self.size)):
+            result.append(self.extract_max())
+
+        return result
+
+    def merge(self, other_heap):
+
+        '''
+        Function:
+            Move all the values of another max-heap into this heap. The other
+            heap is left empty. The combined heap is rebuilt in linear time
+        Input:
+            other_heap (BinaryMaxHeap): The heap we want to merge in. Raises
+                                        IndexError if the values don't fit
+                                        and auto_grow is off, ValueError if
+                                        it's this heap
+        '''
+
+        if other_heap is self:
+            raise ValueError("Can't merge a heap into itself!")
+
+        if self.size + other_heap.size > self.max_size:
+            if self.auto_grow:
+                self.grow(self.size + other_heap.size)
+
+            else:
+                raise IndexError('Heap already at max capacity!')
+
+        self.heap.extend(other_heap.heap[: other_heap.size])
+        self.size = len(self.heap)
+        self.heapify()
+
+        other_heap.heap = []
+        other_heap.size = 0
+
     def get_max(self):
 
         '''
@@ -237,50 +366,348 @@ class BinaryMaxHeap:
         print(self.heap)
 
 
-def heap_sort(array):
+def sift_down_range(keys, values, idx, end, reverse=False):
 
-    heap = BinaryMaxHeap(len(array))
-    heap.build_heap(array)
+    '''
+    Function:
+        Helper for heap_sort. Shift the value at idx down the heap stored in
+        keys[:end]. The value is carried in a hole and written once, instead
+        of being swapped at every level
+    Input:
+        keys (sequence): The heap. A list, array.array or NumPy array
+        values (sequence): Values moved along with keys when sorting by a
+                            key function. None if keys are the values
+        idx (int): Array index of the value
+        end (int): Number of values in the heap
+        reverse (bool): If True, keys is a min-heap instead of a max-heap
+    '''
 
-    for i in range(heap.size):
-        heap.swap(0, heap.size - 1)
-        heap.size -= 1
-        heap.shift_down(0)
+    key_value = keys[idx]
+    if values is not None:
+        value = values[idx]
 
-    return heap.heap
+    child_idx = 2*idx + 1
 
+    while child_idx < end:
+        right_idx = child_idx + 1
 
-def k_largest_elements(array, k):
+        if reverse:
+            if (right_idx < end) and (keys[right_idx] < keys[child_idx]):
+                child_idx = right_idx
+            if not keys[child_idx] < key_value:
+                break
 
-    heap = BinaryMaxHeap(len(array))
-    heap.build_heap(array)
+        else:
+            if (right_idx < end) and (keys[child_idx] < keys[right_idx]):
+                child_idx = right_idx
+            if not key_value < keys[child_idx]:
+                break
+
+        keys[idx] = keys[child_idx]
+        if values is not None:
+            values[idx] = values[child_idx]
+
+        idx = child_idx
+        child_idx = 2*idx + 1
+
+    keys[idx] = key_value
+    if values is not None:
+        values[idx] = value
+
+
+def heap_sort(array, key=None, reverse=False, k=None):
+
+    '''
+    Function:
+        Sort an array in place. The array itself is used as the heap, so no
+        BinaryMaxHeap object (or any other copy) is created. Works for lists,
+        array.array and 1-D NumPy arrays. Heap sort isn't stable
+    Input:
+        array (sequence): Values to be sorted
+        key (function): Optional, maps a value to the priority it's sorted
+                        by. The priorities are computed once, in a list
+        reverse (bool): If True, sort in descending order
+        k (int): Optional, partial sort. Only the first k positions are
+                    guaranteed to hold the k smallest (largest if reverse)
+                    values in sorted order, in O(n*log(k)) time. The order of
+                    the remaining values is unspecified
+    Output:
+        array (sequence): The same array, now sorted
+    '''
+
+    n = len(array)
+
+    if key is None:
+        keys = array
+        values = None
+    else:
+        keys = [key(value) for value in array]
+        values = array
+
+    size = n if k is None else max(0, min(k, n))
+
+    for idx in range(size//2 - 1, -1, -1):
+        sift_down_range(keys, values, idx, size, reverse)
+
+    # Partial sort: the root of the heap is the worst of the best k values
+    # found so far. Anything better than it takes its place
+    for idx in range(size, n):
+        if (keys[0] < keys[idx]) if reverse else (keys[idx] < keys[0]):
+            keys[0], keys[idx] = keys[idx], keys[0]
+            if values is not None:
+                values[0], values[idx] = values[idx], values[0]
+
+            sift_down_range(keys, values, 0, size, reverse)
+
+    for end in range(size - 1, 0, -1):
+        keys[0], keys[end] = keys[end], keys[0]
+        if values is not None:
+            values[0], values[end] = values[end], values[0]
+
+        sift_down_range(keys, values, 0, end, reverse)
+
+    return array
+
+
+def benchmark_heap_sort(n=100000, repeat=3):
+
+    '''
+    Function:
+        Compare heap_sort with sorting through the methods of a BinaryMaxHeap
+        object (build_heap, swap and shift_down for every value), and with
+        the built-in sorted, on n random integers
+    Input:
+        n (int): Number of values to sort
+        repeat (int): Number of timing runs. The best one is reported
+    Output:
+        dict_timings (dict): Best time in seconds for each implementation
+    '''
+
+    from random import randint
+    from timeit import repeat as repeat_timer
+
+    array = [randint(-n, n) for i in range(n)]
+
+    def sort_with_heap_object():
+        heap = BinaryMaxHeap(n)
+        heap.build_heap(array.copy())
+        for i in range(heap.size):
+            heap.swap(0, heap.size - 1)
+            heap.size -= 1
+            heap.shift_down(0)
+
+    dict_timings = {
+        'BinaryMaxHeap methods': min(repeat_timer(sort_with_heap_object,
+                                                  number=1, repeat=repeat)),
+        'heap_sort': min(repeat_timer(lambda: heap_sort(array.copy()),
+                                      number=1, repeat=repeat)),
+        'heap_sort, k=n/100': min(repeat_timer(
+                            lambda: heap_sort(array.copy(), k=n//100),
+                            number=1, repeat=repeat)),
+        'sorted': min(repeat_timer(lambda: sorted(array), number=1,
+                                   repeat=repeat))}
+
+    for name, timing in dict_timings.items():
+        print(name + ': ' + str(round(timing, 4)) + 's')
+
+    return dict_timings
+
+
+def shift_up_min(heap, idx):
+
+    '''
+    Function:
+        Helper for k_largest_elements. Shift a value up a plain list based
+        min-heap until its parent is not greater than it
+    Input:
+        heap (list): The min-heap
+        idx (int): Array index of the value
+    '''
+
+    value = heap[idx]
+
+    while idx > 0:
+        parent_idx = (idx - 1) >> 1
+        if value < heap[parent_idx]:
+            heap[idx] = heap[parent_idx]
+            idx = parent_idx
+        else:
+            break
+
+    heap[idx] = value
+
+
+def shift_down_min(heap, idx):
+
+    '''
+    Function:
+        Helper for k_largest_elements. Shift a value down a plain list based
+        min-heap until none of its children are lesser than it
+    Input:
+        heap (list): The min-heap
+        idx (int): Array index of the value
+    '''
+
+    size = len(heap)
+    value = heap[idx]
+    child_idx = 2*idx + 1
+
+    while child_idx < size:
+        if (child_idx + 1 < size) and (heap[child_idx + 1] < heap[child_idx]):
+            child_idx += 1
+
+        if heap[child_idx] < value:
+            heap[idx] = heap[child_idx]
+            idx = child_idx
+            child_idx = 2*idx + 1
+        else:
+            break
+
+    heap[idx] = value
+
+
+def k_largest_elements(iterable, k, key=None):
 
-    for i in range(k):
-        print(heap.extract_max())
-
-# Building a heap
-heap = BinaryMaxHeap(max_size=15)
-array = [76, 90, 113, 15, -7, 36, 64, 20]
-heap.build_heap(array)
-# Expected output: 113, 90, 76, 20, -7, 36, 64, 15
-heap.print_heap()
-# Inserting 107. Expected Output: 113, 107, 76, 90, -7, 36, 64, 15, 20
-heap.insert(107)
-heap.print_heap()
-# Removing the root: 113. Expected output: 107, 90, 76, 20, -7, 36, 64, 15
-heap.remove(0)  # Input is the index of the element to be removed
-heap.print_heap()
-
-heap.get_max()  # 107
-# Changing -7 to 555, Expected output: 555, 107, 76, 20, 90, 36, 64, 15
-heap.change_priority(idx=4, new_key=555)
-heap.print_heap()
-# Changing 555 to -75, Expected output: 107, 90, 76, 20, -75, 36, 64, 15
-heap.change_priority(idx=0, new_key=-75)
-heap.print_heap()
-
-# Heap Sort
-array = [107, 90, 76, 20, -75, 36, 64, 15]
-sorted_array = heap_sort(array)
-print(sorted_array)
-k_largest_elements(array, k=5)
+    '''
+    Function:
+        Return the k largest values of an input iterable. The values are
+        streamed through a min-heap of size k, whose root is the smallest of
+        the values kept so far and is replaced whenever a larger value comes
+        in. Among equal values, the ones seen first are kept
+    Input:
+        iterable (iterable): Values to select from. Consumed only once
+        k (int): Number of values to return
+        key (function): Optional, maps a value to the priority it's compared
+                        by. The value itself is used by default
+    Output:
+        A list of the k largest values in descending order
+    '''
+
+    if k <= 0:
+        return []
+
+    heap = []  # Entries are (priority, -position, value). The position breaks
+    # ties so that the values themselves never need to be compared
+
+    for position, value in enumerate(iterable):
+        priority = value if key is None else key(value)
+
+        if len(heap) < k:
+            heap.append((priority, -position, value))
+            shift_up_min(heap, len(heap) - 1)
+
+        elif priority > heap[0][0]:
+            heap[0] = (priority, -position, value)
+            shift_down_min(heap, 0)
+
+    heap.sort(reverse=True)
+
+    return [entry[2] for entry in heap]
+
+
+def k_largest_elements_parallel(iterable, k, key=None, chunk_size=100000,
+                                max_workers=None):
+
+    '''
+    Function:
+        Parallel version of k_largest_elements. The input is cut into chunks
+        which are handed to worker processes, each of which returns the top k
+        of its chunk. The per-chunk results are merged in input order, so the
+        output is the same as that of k_largest_elements. At most two chunks
+        per worker are held in memory at any time
+    Input:
+        iterable (iterable): Values to select from. Consumed only once
+        k (int): Number of values to return
+        key (function): Optional, same as for k_largest_elements. Must be
+                        picklable i.e. defined at the top level of a module
+        chunk_size (int): Number of values sent to a worker at a time
+        max_workers (int): Number of worker processes. Defaults to the
+                            number of CPUs
+    Output:
+        A list of the k largest values in descending order
+    '''
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    if k <= 0:
+        return []
+
+    if max_workers is None:
+        max_workers = cpu_count() or 1
+
+    iterator = iter(iterable)
+    result = []
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        max_pending = 2*max_workers
+        pending = []
+
+        while True:
+            while len(pending) < max_pending:
+                chunk = list(islice(iterator, chunk_size))
+                if chunk == []:
+                    break
+
+                pending.append(executor.submit(k_largest_elements, chunk, k,
+                                               key))
+
+            if pending == []:
+                break
+
+            # Oldest chunk first so that ties are resolved in input order
+            result = k_largest_elements(result + pending.pop(0).result(), k,
+                                        key)
+
+    return result
+
+
+if __name__ == '__main__':
+    # Building a heap
+    heap = BinaryMaxHeap(max_size=15)
+    array = [76, 90, 113, 15, -7, 36, 64, 20]
+    heap.build_heap(array)
+    # Expected output: 113, 90, 76, 20, -7, 36, 64, 15
+    heap.print_heap()
+    # Inserting 107. Expected Output: 113, 107, 76, 90, -7, 36, 64, 15, 20
+    heap.insert(107)
+    heap.print_heap()
+    # Removing the root: 113. Expected output: 107, 90, 76, 20, -7, 36, 64, 15
+    heap.remove(0)  # Input is the index of the element to be removed
+    heap.print_heap()
+
+    heap.get_max()  # 107
+    # Changing -7 to 555, Expected output: 555, 107, 76, 20, 90, 36, 64, 15
+    heap.change_priority(idx=4, new_key=555)
+    heap.print_heap()
+    # Changing 555 to -75, Expected output: 107, 90, 76, 20, -75, 36, 64, 15
+    heap.change_priority(idx=0, new_key=-75)
+    heap.print_heap()
+
+    # Heap Sort
+    array = [107, 90, 76, 20, -75, 36, 64, 15]
+    sorted_array = heap_sort(array)
+    print(sorted_array)
+    # Expected output: [107, 90, 76, -75, ...]. Only the first 3 are sorted
+    print(heap_sort([107, 90, 76, 20, -75, 36, 64, 15], k=3, reverse=True))
+    # Expected output: ['les', 'alex', 'cathy', 'violet']
+    print(heap_sort(['cathy', 'les', 'alex', 'violet'], key=len))
+    benchmark_heap_sort(n=10000)
+    # Expected output: [107, 90, 76, 64, 36]
+    print(k_largest_elements(array, k=5))
+    # Works on generators too. Expected output: ['eeeee', 'dddd']
+    print(k_largest_elements((char*(i + 1) for i, char in enumerate('abcde')),
+                             k=2, key=len))
+
+    # Bulk operations. Expected output: [113, 107, 90, 76, 64]
+    heap = BinaryMaxHeap(max_size=4, auto_grow=True)
+    heap.extend([76, 90, 113, 15, -7])
+    other_heap = BinaryMaxHeap(max_size=4)
+    other_heap.extend([36, 64, 107, 20])
+    heap.merge(other_heap)
+    print(heap.pop_many(5))
+    # A heap can't be merged into itself. Expected output: ValueError, 4
+    try:
+        heap.merge(heap)
+    except ValueError:
+        print('ValueError')
+    print(heap.size)
@@ -4,13 +4,118 @@ Theory:
     All three basic operations (delete, insert, display) is applicable to the
     oldest element of the queue.
 
+    The queue below is a ring buffer: the values are kept in a preallocated
+    array whose size is a power of two, from a head index onwards, wrapping
+    around to the start of the array. Dequeuing only moves the head, so
+    nothing is shifted. The array doubles when it's full and halves when it's
+    less than a quarter full.
+
+Space and time complexity:
+    1. Space complexity: O(n)
+    2. Enqueue: O(1) amortized
+    3. Dequeue: O(1) amortized
+    4. Enqueue/dequeue k values at once: O(k), copied as at most two slices
+    5. Display front element: O(1)
+    6. Is empty: O(1)
+
+If a max_size is given, the queue is bounded. Once full, an enqueue either
+drops the new value (overflow='drop') or overwrites the oldest one
+(overflow='overwrite'). The number of values lost is kept in num_dropped.
+
+BlockingQueue and AsyncQueue make a queue safe to share between producer and
+consumer threads (resp. coroutines). Consumers wait for values, producers
+wait for free room when a max_size is set (backpressure), both with optional
+timeouts. put_many pushes as many values as there is room for, and get_many
+drains up to max_n values, per lock acquisition and wake-up, which amortizes
+the synchronization cost over the batch.
 '''
 
+if __package__:  # Imported as a submodule of the package
+    from . import Shared_utilities
+else:
+    import Shared_utilities
+
 
 class Queue:
 
-    def __init__(self):
-        self.queue = []
+    def __init__(self, capacity=8, max_size=None, overflow='drop'):
+
+        '''
+        Input:
+            capacity (int): Initial number of slots, rounded up to a power of
+                            two. Also the size below which it never shrinks
+            max_size (int): Optional, maximum number of values in the queue.
+                            At least 1
+            overflow (str): 'drop' or 'overwrite', what happens when a value
+                            is enqueued to a full bounded queue
+        '''
+
+        if overflow not in ('drop', 'overwrite'):
+            raise ValueError('overflow must be drop or overwrite!')
+
+        if (max_size is not None) and (max_size < 1):
+            raise ValueError('max_size must be at least 1!')
+
+        self.min_capacity = 1 << max(capacity - 1, 0).bit_length()
+        self.queue = [None]*self.min_capacity
+        self.head = 0
+        self.size = 0
+        self.max_size = max_size
+        self.overflow = overflow
+        self.num_dropped = 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+
+        '''
+        Generate the values from the front to the back, lazily
+        '''
+
+        mask = len(self.queue) - 1
+
+        for i in range(self.size):
+            yield self.queue[(self.head + i) & mask]
+
+    def __reversed__(self):
+
+        '''
+        Generate the values from the back to the front, lazily
+        '''
+
+        mask = len(self.queue) - 1
+
+        for i in reversed(range(self.size)):
+            yield self.queue[(self.head + i) & mask]
+
+    def __contains__(self, value):
+        return any(data == value for data in self)
+
+    def resize(self, capacity):
+
+        '''
+        Function:
+            Move the values to a new array of the input capacity, starting at
+            index 0
+        '''
+
+        self.queue = self.values_from_front(self.size) + \
+            [None]*(capacity - self.size)
+        self.head = 0
+
+    def values_from_front(self, count):
+
+        '''
+        Return a list of the first count values, without removing them
+        '''
+
+        end = self.head + count
+
+        if end <= len(self.queue):
+            return self.queue[self.head: end]
+
+        return self.queue[self.head:] + self.queue[: end - len(self.queue)]
 
     def enqueue(self, value):
 
@@ -18,23 +123,116 @@ class Queue:
         Push the input value at the end of the queue
         '''
 
-        self.queue.append(value)
+        if self.size == self.max_size:
+            self.num_dropped += 1
+            if self.overflow == 'drop':
+                return
+
+            self.dequeue()
+
+        if self.size == len(self.queue):
+            self.resize(2*len(self.queue))
+
+        self.queue[(self.head + self.size) & (len(self.queue) - 1)] = value
+        self.size += 1
+
+    def enqueue_many(self, values):
+
+        '''
+        Push all the input values at the end of the queue, in order
+        '''
+
+        if self.max_size is not None:
+            for value in values:
+                self.enqueue(value)
+
+            return
+
+        values = list(values)
+        capacity = len(self.queue)
+
+        while self.size + len(values) > capacity:
+            capacity *= 2
+
+        if capacity != len(self.queue):
+            self.resize(capacity)
+
+        start = (self.head + self.size) & (capacity - 1)
+        first_part = min(len(values), capacity - start)
+        self.queue[start: start + first_part] = values[: first_part]
+        self.queue[: len(values) - first_part] = values[first_part:]
+        self.size += len(values)
 
     def dequeue(self):
 
         '''
-        Remove and output the element at the start of the queue
+        Remove and output the element at the start of the queue. None if the
+        queue is empty
+        '''
+
+        if self.size == 0:
+            return
+
+        value = self.queue[self.head]
+        self.queue[self.head] = None  # Let go of the value
+        self.head = (self.head + 1) & (len(self.queue) - 1)
+        self.size -= 1
+        self.shrink()
+
+        return value
+
+    def dequeue_many(self, count):
+
+        '''
+        Remove and output (as a list) the count elements at the start of the
+        queue. Fewer if the queue doesn't have that many. Raise ValueError if
+        count is negative
+        '''
+
+        if count < 0:
+            raise ValueError('count must not be negative!')
+
+        count = min(count, self.size)
+        values = self.values_from_front(count)
+        end = self.head + count
+
+        if end <= len(self.queue):
+            self.queue[self.head: end] = [None]*count
+        else:
+            self.queue[self.head:] = [None]*(len(self.queue) - self.head)
+            self.queue[: end - len(self.queue)] = \
+                [None]*(end - len(self.queue))
+
+        self.head = end & (len(self.queue) - 1)
+        self.size -= count
+        self.shrink()
+
+        return values
+
+    def shrink(self):
+
+        '''
+        Halve the array while it's less than a quarter full
         '''
 
-        self.queue.pop(0)
+        capacity = len(self.queue)
+
+        while (capacity > self.min_capacity) and (self.size < capacity//4):
+            capacity //= 2
+
+        if capacity != len(self.queue):
+            self.resize(capacity)
 
     def display_front_element(self):
 
         '''
-        Output the element at the start of the queue
+        Output the element at the start of the queue. None if it's empty
         '''
 
-        return self.queue[0]
+        if self.size == 0:
+            return
+
+        return self.queue[self.head]
 
     def is_empty(self):
 
@@ -42,22 +240,106 @@ class Queue:
         Output boolean value for whether the queue is empty or not
         '''
 
-        if self.queue == []:
-            return True
-
-        else:
-            return False
+        return self.size == 0
 
     def print_all_elements(self):
 
-        print(self.queue)
-
-queue = Queue()
-queue.is_empty()
-queue.enqueue(50)
-queue.enqueue(-2)
-queue.enqueue(23)
-queue.enqueue(17)
-queue.display_front_element()
-queue.dequeue()
-queue.print_all_elements()
+        print(self.values_from_front(self.size))
+
+
+class BlockingQueue(Shared_utilities.BlockingContainer):
+
+    '''
+    Thread-safe queue, see Shared_utilities.BlockingContainer for the
+    methods. Wraps any queue with enqueue and dequeue methods (by default the
+    ring buffer Queue above, but eg. the linked list Queue of
+    Queue_linked_list_implementation.py works too)
+    '''
+
+    def __init__(self, max_size=None, queue=None):
+
+        '''
+        Input:
+            max_size (int): Optional, put waits while the queue holds this
+                            many values
+            queue: Optional, the underlying queue. Must be empty
+        '''
+
+        self.queue = Queue() if queue is None else queue
+        super().__init__(self.queue.enqueue, self.queue.dequeue, max_size,
+                         getattr(self.queue, 'dequeue_many', None), 'queue')
+
+
+class AsyncQueue(Shared_utilities.AsyncContainer):
+
+    '''
+    asyncio version of BlockingQueue, for producers and consumers running as
+    coroutines of a single event loop. Same methods, as coroutines
+    '''
+
+    def __init__(self, max_size=None, queue=None):
+        self.queue = Queue() if queue is None else queue
+        super().__init__(self.queue.enqueue, self.queue.dequeue, max_size,
+                         getattr(self.queue, 'dequeue_many', None), 'queue')
+
+
+def benchmark_blocking_queue(n=100000, max_size=1000, batch_size=100):
+
+    '''
+    Function:
+        Measure the throughput (values per second) of passing n values
+        through a queue: single-threaded through Queue, then from a producer
+        thread to a consumer thread through BlockingQueue, getting the values
+        one at a time and batch_size at a time, and the same with AsyncQueue
+        and two coroutines
+    Output:
+        dict_throughput (dict): Values per second for each setup
+    '''
+
+    return Shared_utilities.benchmark_blocking(BlockingQueue, AsyncQueue, n,
+                                               max_size, batch_size)
+
+
+if __name__ == '__main__':
+    import threading
+
+    queue = Queue()
+    queue.is_empty()
+    queue.enqueue(50)
+    queue.enqueue(-2)
+    queue.enqueue(23)
+    queue.enqueue(17)
+    queue.display_front_element()
+    queue.dequeue()
+    queue.print_all_elements()
+
+    # Bulk operations. Expected output: [-2, 23, 17, 0, 1], then [2, 3]
+    queue.enqueue_many(range(4))
+    print(queue.dequeue_many(5))
+    queue.print_all_elements()
+
+    # A negative count is rejected. Expected output: ValueError, [2, 3]
+    try:
+        queue.dequeue_many(-1)
+    except ValueError:
+        print('ValueError')
+    queue.print_all_elements()
+
+    # Bounded queue keeping the latest 3 values. Expected output: [7, 8, 9], 7
+    queue = Queue(max_size=3, overflow='overwrite')
+    queue.enqueue_many(range(10))
+    queue.print_all_elements()
+    print(queue.num_dropped)
+
+    # Thread-safe queue. Expected output: [0, 1, 2], then a TimeoutError
+    queue = BlockingQueue(max_size=3)
+    producer = threading.Thread(target=queue.put_many, args=(range(3),))
+    producer.start()
+    producer.join()
+    print(queue.get_many(10))
+    try:
+        queue.get(timeout=0.01)
+    except TimeoutError:
+        print('TimeoutError')
+
+    benchmark_blocking_queue(n=10000)
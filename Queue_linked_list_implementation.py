@@ -11,25 +11,101 @@ Space and time complexity:
     4. Display front element: O(1)
     5. Display back element: O(1)
     6. Is empty: O(1)
+
+Nodes use __slots__, which saves their per-instance __dict__. A Queue
+created with a NodePool also recycles the nodes freed by dequeue for the next
+enqueues, which spares the allocator on queues with a high turnover.
 '''
 
+from time import perf_counter
+
+if __package__:  # Imported as a submodule of the package
+    from . import Shared_utilities
+else:
+    import Shared_utilities
+
 
 class Node:
     '''
     Node of a linked list
     '''
 
+    __slots__ = ('data', 'next', 'previous')
+
     def __init__(self, data):
         self.data = data
         self.next = None
         self.previous = None
 
 
+class NodePool(Shared_utilities.NodePool):
+
+    '''
+    Pool of the Nodes above, see Shared_utilities.NodePool
+    '''
+
+    node_class = Node
+
+
 class DLinkedListWithTail:
 
-    def __init__(self):
+    def __init__(self, pool=None):
+
+        '''
+        Input:
+            pool (NodePool): Optional, pool to take nodes from and release
+                             removed nodes to
+        '''
+
         self.head = None
         self.tail = None
+        self.size = 0
+        self.pool = pool
+        self.make_node = Node if pool is None else pool.new_node
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+
+        '''
+        Function:
+            Generate the values from the head to the tail, lazily
+        '''
+
+        curr_node = self.head
+
+        while curr_node:
+            yield curr_node.data
+            curr_node = curr_node.next
+
+    def __reversed__(self):
+
+        '''
+        Function:
+            Generate the values from the tail to the head, lazily
+        '''
+
+        curr_node = self.tail
+
+        while curr_node:
+            yield curr_node.data
+            curr_node = curr_node.previous
+
+    def __contains__(self, value):
+        return any(data == value for data in self)
+
+    def release_node(self, node):
+
+        '''
+        Function:
+            Hand a removed node back to the node pool, if any
+        '''
+
+        self.size -= 1
+
+        if self.pool is not None:
+            self.pool.release(node)
 
     def is_empty(self):
 
@@ -38,13 +114,7 @@ class DLinkedListWithTail:
             Return a boolean var for whether or not the linked list is empty
         '''
 
-        if self.head is None:
-            print('The linked list is empty!')
-            return True
-
-        else:
-            print('The linked list is not empty!')
-            return False
+        return self.head is None
 
     def insert(self, val):
 
@@ -55,7 +125,8 @@ class DLinkedListWithTail:
             val (int/float): The value of the elements we want to add
         '''
 
-        new_node = Node(val)
+        new_node = self.make_node(val)
+        self.size += 1
 
         if self.head is None:
             self.head = new_node
@@ -95,12 +166,16 @@ class DLinkedListWithTail:
         '''
 
         if self.head is not None:
-            output = self.head.data
-            next_node = self.head.next
+            head_node = self.head
+            output = head_node.data
+            next_node = head_node.next
             self.head = next_node
             if next_node is not None:
                 next_node.previous = None
+            else:
+                self.tail = None
 
+            self.release_node(head_node)
             return output
 
     def print_all_elements(self):
@@ -119,8 +194,36 @@ class DLinkedListWithTail:
 
 class Queue:
 
-    def __init__(self):
-        self.queue = DLinkedListWithTail()
+    def __init__(self, pool=None):
+
+        '''
+        Input:
+            pool (NodePool): Optional, pool to recycle the nodes with
+        '''
+
+        self.queue = DLinkedListWithTail(pool)
+
+    def __len__(self):
+        return len(self.queue)
+
+    def __iter__(self):
+
+        '''
+        Iterate over the values from the front to the back
+        '''
+
+        return iter(self.queue)
+
+    def __reversed__(self):
+
+        '''
+        Iterate over the values from the back to the front
+        '''
+
+        return reversed(self.queue)
+
+    def __contains__(self, value):
+        return value in self.queue
 
     def enqueue(self, value):
 
@@ -158,14 +261,71 @@ class Queue:
 
         self.queue.print_all_elements()
 
-queue = Queue()
-queue.is_empty()
-queue.enqueue(50)
-queue.enqueue(-2)
-queue.enqueue(23)
-queue.enqueue(17)
-queue.display_front_element()
-queue.dequeue()
-queue.print_all_elements()
-queue.dequeue()
-queue.print_all_elements()
+
+def benchmark_node_pool(n=1000000, depth=1000):
+
+    '''
+    Function:
+        Measure the memory taken per node, with and without __slots__, and
+        the time per enqueue/dequeue pair of a queue holding depth values,
+        with and without a NodePool
+    Output:
+        dict_results (dict): Bytes per node and seconds per operation pair
+    '''
+
+    import tracemalloc
+
+    class DictNode:  # Same as Node without __slots__
+        def __init__(self, data):
+            self.data = data
+            self.next = None
+            self.previous = None
+
+    dict_results = {}
+
+    for name, node_type in (('slots', Node), ('dict', DictNode)):
+        tracemalloc.start()
+        nodes = [node_type(None) for i in range(depth)]
+        dict_results[name + ' bytes/node'] = \
+            tracemalloc.get_traced_memory()[0]/depth
+        tracemalloc.stop()
+        del nodes
+
+    for name, pool in (('no pool', None), ('pool', NodePool())):
+        queue = Queue(pool)
+        for value in range(depth):
+            queue.enqueue(value)
+
+        start_time = perf_counter()
+        for value in range(n):
+            queue.enqueue(value)
+            queue.dequeue()
+
+        dict_results[name + ' s/op'] = (perf_counter() - start_time)/n
+
+    for name, result in dict_results.items():
+        print(name + ': ' + str(round(result, 9)))
+
+    return dict_results
+
+
+if __name__ == '__main__':
+    queue = Queue()
+    queue.is_empty()
+    queue.enqueue(50)
+    queue.enqueue(-2)
+    queue.enqueue(23)
+    queue.enqueue(17)
+    queue.display_front_element()
+    queue.dequeue()
+    queue.print_all_elements()
+    queue.dequeue()
+    queue.print_all_elements()
+
+    # Queue recycling its nodes
+    queue = Queue(NodePool())
+    for value in range(5):
+        queue.enqueue(value)
+        queue.dequeue()
+    print(len(queue.queue.pool.free_nodes))  # 1: the same node was reused
+    benchmark_node_pool(n=100000)
@@ -0,0 +1,814 @@
+'''
+Helpers shared by the data structure scripts: a node pool (free list) for the
+linked structures, the lazy DEBUG logging they use to report lookup misses
+instead of printing them, the bookkeeping common to the linked lists
+(LinkedListMixin), and the thread-safe (BlockingContainer) and asyncio
+(AsyncContainer) wrappers behind BlockingQueue, AsyncQueue, BlockingStack and
+AsyncStack. This script has no examples of its own.
+'''
+
+from time import monotonic, perf_counter
+
+
+def debug_logger(name):
+
+    '''
+    Function:
+        Create a log_debug(message, *args) function which logs a diagnostic
+        message at DEBUG level to the logger of the input name. The logging
+        module is only imported when a message is logged, which keeps
+        importing the calling module fast
+    Input:
+        name (str): Logger name, the __name__ of the calling module
+    Output:
+        log_debug (function)
+    '''
+
+    def log_debug(message, *args):
+        import logging
+        logging.getLogger(name).debug(message, *args)
+
+    return log_debug
+
+
+class NodePool:
+
+    '''
+    Free list of nodes. Structures created with a pool hand the nodes they
+    remove back to it and take their new nodes from it, so that a structure
+    which keeps growing and shrinking reuses its nodes instead of allocating
+    new ones. Only use a pool if no references to removed nodes are kept.
+
+    Each script subclasses it with its own node_class, whose constructor
+    takes the data and sets all the other fields of the node to None
+    '''
+
+    node_class = None
+
+    def __init__(self, max_size=65536):
+
+        '''
+        Input:
+            max_size (int): Maximum number of free nodes kept for reuse
+        '''
+
+        self.free_nodes = []
+        self.max_size = max_size
+
+    def new_node(self, data):
+
+        '''
+        Function:
+            Output a node holding the input data, reusing a free node if any
+        '''
+
+        if self.free_nodes:
+            node = self.free_nodes.pop()
+            node.data = data
+            return node
+
+        return self.node_class(data)
+
+    def release(self, node):
+
+        '''
+        Function:
+            Take back a removed node. Its fields are reset to None by its
+            constructor, so it doesn't keep its value or its former
+            neighbours alive
+        '''
+
+        if len(self.free_nodes) < self.max_size:
+            node.__init__(None)
+            self.free_nodes.append(node)
+
+
+class LinkedListMixin:
+
+    '''
+    Node, pool and index bookkeeping shared by SLinkedListWithoutTail,
+    SLinkedListWithTail and DLinkedListWithTail, which keep the linking of
+    their nodes to themselves. Each sets node_class to its Node, and tells
+    the bulk operations (extend, splice, concat, split_at) whether it keeps a
+    tail (has_tail) and previous pointers (doubly_linked). They also rely on
+    its last_node method.
+
+    A list created with index=True keeps a dict from each value to the nodes
+    holding it (values must then be hashable), so that finding a node which
+    holds a value is O(1) instead of O(n). With duplicates, the index picks
+    the oldest node still holding the value rather than the one closest to
+    the head. The insert methods return the node they create, for use with
+    insert_after_node, insert_before_node and delete_node
+    '''
+
+    node_class = None
+    has_tail = False
+    doubly_linked = False
+
+    def __init__(self, pool=None, index=False):
+
+        '''
+        Input:
+            pool (NodePool): Optional, pool to take nodes from and release
+                             removed nodes to
+            index (bool): Whether to keep a dict from values to nodes
+        '''
+
+        self.head = None
+        self.size = 0  # None when unknown, after a split_at
+        self.pool = pool
+        self.index = {} if index else None
+
+        if index:
+            self.make_node = self.make_indexed_node
+        else:
+            self.make_node = self.node_class if pool is None else \
+                pool.new_node
+
+    def make_indexed_node(self, data):
+
+        '''
+        Function:
+            Create a node for the input data and add it to the index
+        '''
+
+        node = self.node_class(data) if self.pool is None else \
+            self.pool.new_node(data)
+        self.index.setdefault(data, {})[node] = None
+
+        return node
+
+    def release_node(self, node):
+
+        '''
+        Function:
+            Drop a removed node from the index and hand it back to the node
+            pool, if any
+        '''
+
+        if self.size is not None:
+            self.size -= 1
+
+        if self.index is not None:
+            self.unindex_node(node)
+
+        if self.pool is not None:
+            self.pool.release(node)
+
+    def unindex_node(self, node):
+
+        '''
+        Function:
+            Remove the input node from the index
+        '''
+
+        nodes = self.index[node.data]
+        del nodes[node]
+        if not nodes:
+            del self.index[node.data]
+
+    def index_nodes(self, node):
+
+        '''
+        Function:
+            Add the input node and all the nodes after it to the index
+        '''
+
+        while node is not None:
+            self.index.setdefault(node.data, {})[node] = None
+            node = node.next
+
+    def find_node(self, value):
+
+        '''
+        Function:
+            Find a node holding the input value. O(1) with an index, O(n)
+            otherwise
+        Input:
+            value (int): The value we want to find
+        Output:
+            The first node holding the value (the oldest one with an index).
+            None if the value is missing
+        '''
+
+        if self.index is not None:
+            nodes = self.index.get(value)
+            return next(iter(nodes)) if nodes else None
+
+        curr_node = self.head
+
+        while curr_node:
+            if curr_node.data == value:
+                return curr_node
+
+            curr_node = curr_node.next
+
+        return None
+
+    def extend(self, iterable):
+
+        '''
+        Function:
+            Add the values of the input iterable (or generator) at the end of
+            the linked list, consuming it lazily
+        Input:
+            iterable: The values we want to add
+        '''
+
+        end_node = self.last_node()
+        doubly_linked = self.doubly_linked
+        count = 0
+
+        try:
+            for value in iterable:
+                new_node = self.make_node(value)
+
+                if end_node is None:
+                    self.head = new_node
+                else:
+                    end_node.next = new_node
+                    if doubly_linked:
+                        new_node.previous = end_node
+
+                end_node = new_node
+                count += 1
+
+        finally:  # Keep the list consistent if the iterable raises
+            if self.has_tail:
+                self.tail = end_node
+            if self.size is not None:
+                self.size += count
+
+    def splice(self, other_list, after=None):
+
+        '''
+        Function:
+            Move all the nodes of other_list (which ends up empty) into this
+            list, right after the node after. Linking is O(1). Without a
+            tail, finding the last node of other_list (and of this list, if
+            after is None) takes O(n). Updating the index, if this list has
+            one, takes O(len(other_list))
+        Input:
+            other_list: Linked list (of the same type) whose nodes we want
+                        to move. Not this list: ValueError is raised
+            after (Node): Node of this list after which the nodes go. None
+                            for the end of the list
+        '''
+
+        if other_list is self:
+            raise ValueError("Can't splice a linked list into itself!")
+
+        first_node = other_list.head
+        if first_node is None:
+            return
+
+        last_node = other_list.last_node()
+        other_list.head = None
+        if (self.size is not None) and (other_list.size is not None):
+            self.size += other_list.size
+        else:
+            self.size = None
+
+        other_list.size = 0
+
+        if other_list.has_tail:
+            other_list.tail = None
+        if other_list.index is not None:
+            other_list.index = {}
+        if self.index is not None:
+            self.index_nodes(first_node)
+
+        if after is None:
+            after = self.last_node()
+
+        if after is None:
+            self.head = first_node
+
+        else:
+            last_node.next = after.next
+            after.next = first_node
+
+            if self.doubly_linked:
+                first_node.previous = after
+                if last_node.next is not None:
+                    last_node.next.previous = last_node
+
+        if self.has_tail and (after is self.tail):
+            self.tail = last_node
+
+    def concat(self, *other_lists):
+
+        '''
+        Function:
+            Move the nodes of all the input lists, in order, to the end of
+            this list. Same costs as splice with after=None
+        Input:
+            other_lists: Linked lists whose nodes we want to move
+        '''
+
+        for other_list in other_lists:
+            self.splice(other_list, self.last_node())
+
+    def split_at(self, node):
+
+        '''
+        Function:
+            Cut the linked list right after the input node. The nodes after
+            it move to a new linked list. O(1), plus O(len(new list)) to
+            update the indexes if the list has one (the lengths are then known
+            right away, otherwise they are counted on the next len call)
+        Input:
+            node (Node): Node of this list which becomes its last node
+        Output:
+            The new linked list, with the same pool and index setting
+        '''
+
+        new_list = type(self)(self.pool, self.index is not None)
+        first_node = node.next
+        if first_node is None:
+            return new_list
+
+        node.next = None
+        new_list.head = first_node
+        new_list.size = None
+
+        if self.doubly_linked:
+            first_node.previous = None
+        if self.has_tail:
+            new_list.tail = self.tail
+            self.tail = node
+
+        if self.index is not None:
+            curr_node = first_node
+            count = 0
+
+            while curr_node is not None:
+                self.unindex_node(curr_node)
+                curr_node = curr_node.next
+                count += 1
+
+            new_list.index_nodes(first_node)
+            new_list.size = count
+            if self.size is not None:
+                self.size -= count
+
+        else:
+            self.size = None
+
+        return new_list
+
+    def __len__(self):
+
+        '''
+        Function:
+            Output the number of values. O(1), except for the first call
+            after a split_at which counts them
+        '''
+
+        if self.size is None:
+            self.size = sum(1 for value in self)
+
+        return self.size
+
+    def __iter__(self):
+
+        '''
+        Function:
+            Generate the values from the head to the end, lazily
+        '''
+
+        curr_node = self.head
+
+        while curr_node:
+            yield curr_node.data
+            curr_node = curr_node.next
+
+    def __contains__(self, value):
+
+        '''
+        Function:
+            Whether the input value is present, without printing anything.
+            O(1) with an index, O(n) otherwise
+        '''
+
+        return self.find_node(value) is not None
+
+
+class SynchronizedContainer:
+
+    '''
+    State and helpers shared by BlockingContainer and AsyncContainer: the
+    wrapped container, given by the method which adds a value to it and the
+    one which takes a value out, and the number of values it holds
+    '''
+
+    def __init__(self, put, take, max_size=None, take_many=None,
+                 name='container'):
+
+        '''
+        Input:
+            put (function): Adds the input value to the container
+            take (function): Removes and outputs a value of the container
+            max_size (int): Optional, put waits while the container holds
+                            this many values
+            take_many (function): Optional, removes and outputs (as a list)
+                                    the input number of values. Faster than
+                                    calling take that many times
+            name (str): Name of the container in error messages
+        '''
+
+        self.put_value = put
+        self.take_value = take
+        self.take_values = take_many
+        self.max_size = max_size
+        self.name = name
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def is_not_full(self):
+        return (self.max_size is None) or (self.size < self.max_size)
+
+    def is_not_empty(self):
+        return self.size > 0
+
+    def take(self, count):
+
+        '''
+        Function:
+            Take count values out of the container (with the lock held) and
+            wake up as many waiting producers
+        '''
+
+        if self.take_values is not None:
+            values = self.take_values(count)
+        else:
+            values = [self.take_value() for i in range(count)]
+
+        self.size -= count
+        self.not_full.notify(count)
+
+        return values
+
+
+class BlockingContainer(SynchronizedContainer):
+
+    '''
+    Thread-safe wrapper of a container (queue or stack). Consumers wait for
+    values, producers wait for room when a max_size is set, both with
+    optional timeouts. put_many and get_many move as many values as they can
+    per lock acquisition and wake-up
+    '''
+
+    def __init__(self, put, take, max_size=None, take_many=None,
+                 name='container'):
+
+        '''
+        Input:
+            Same as SynchronizedContainer
+        '''
+
+        import threading
+
+        super().__init__(put, take, max_size, take_many, name)
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    def wait(self, condition, predicate, timeout):
+
+        '''
+        Function:
+            Wait on the condition (with the lock held) until the predicate is
+            True
+        Input:
+            timeout (float): Maximum number of seconds to wait. None to wait
+                                for as long as needed
+        Output:
+            False if the timeout ran out, True otherwise
+        '''
+
+        if timeout is None:
+            while not predicate():
+                condition.wait()
+
+            return True
+
+        end_time = monotonic() + timeout
+
+        while not predicate():
+            remaining = end_time - monotonic()
+            if remaining <= 0:
+                return False
+
+            condition.wait(remaining)
+
+        return True
+
+    def put(self, value, timeout=None):
+
+        '''
+        Function:
+            Add the input value to the container. If it's full, wait for room
+        Input:
+            value: The value to add
+            timeout (float): Optional, maximum number of seconds to wait.
+                                TimeoutError is raised once it runs out
+        '''
+
+        with self.lock:
+            if not self.wait(self.not_full, self.is_not_full, timeout):
+                raise TimeoutError('The ' + self.name + ' is still full!')
+
+            self.put_value(value)
+            self.size += 1
+            self.not_empty.notify()
+
+    def put_many(self, values, timeout=None):
+
+        '''
+        Function:
+            Add all the input values, in order, taking the lock once for as
+            many values as there is room for
+        Input:
+            values (iterable): The values to add
+            timeout (float): Optional, maximum number of seconds to wait for
+                                room, in total. TimeoutError is raised once it
+                                runs out (the values added so far stay)
+        '''
+
+        end_time = None if timeout is None else monotonic() + timeout
+        iterator = iter(values)
+        value = next(iterator, self)  # self marks the end of the values
+
+        with self.lock:
+            while value is not self:
+                remaining = None if end_time is None else \
+                    max(end_time - monotonic(), 0)
+                if not self.wait(self.not_full, self.is_not_full, remaining):
+                    raise TimeoutError('The ' + self.name +
+                                       ' is still full!')
+
+                count = 0
+                while (value is not self) and self.is_not_full():
+                    self.put_value(value)
+                    self.size += 1
+                    count += 1
+                    value = next(iterator, self)
+
+                self.not_empty.notify(count)
+
+    def get(self, timeout=None):
+
+        '''
+        Function:
+            Take a value out of the container and output it. If it's empty,
+            wait for a value
+        Input:
+            timeout (float): Optional, maximum number of seconds to wait.
+                                TimeoutError is raised once it runs out
+        '''
+
+        with self.lock:
+            if not self.wait(self.not_empty, self.is_not_empty, timeout):
+                raise TimeoutError('The ' + self.name + ' is still empty!')
+
+            value = self.take_value()
+            self.size -= 1
+            self.not_full.notify()
+
+        return value
+
+    def get_many(self, max_n, timeout=None):
+
+        '''
+        Function:
+            Wait until the container has at least one value, then take out
+            and output (as a list, in the order get would) up to max_n values
+        Input:
+            max_n (int): Maximum number of values to get. ValueError is
+                            raised if it's negative
+            timeout (float): Optional, maximum number of seconds to wait. An
+                                empty list is returned once it runs out
+        '''
+
+        if max_n < 0:
+            raise ValueError('max_n must not be negative!')
+
+        with self.lock:
+            if not self.wait(self.not_empty, self.is_not_empty, timeout):
+                return []
+
+            return self.take(min(max_n, self.size))
+
+
+class AsyncContainer(SynchronizedContainer):
+
+    '''
+    asyncio version of BlockingContainer, for producers and consumers running
+    as coroutines of a single event loop. Same methods, as coroutines
+    '''
+
+    def __init__(self, put, take, max_size=None, take_many=None,
+                 name='container'):
+
+        '''
+        Input:
+            Same as SynchronizedContainer
+        '''
+
+        super().__init__(put, take, max_size, take_many, name)
+        self.lock = None  # Created on first use, inside the event loop
+        self.not_empty = None
+        self.not_full = None
+
+    async def wait(self, condition, predicate, timeout):
+
+        '''
+        Function:
+            Acquire the lock, then wait on the condition until the predicate
+            is True. Raise asyncio.TimeoutError (without the lock) if it's
+            still False after timeout seconds
+        Input:
+            condition (str): 'not_empty' or 'not_full'
+        '''
+
+        import asyncio
+
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+            self.not_empty = asyncio.Condition(self.lock)
+            self.not_full = asyncio.Condition(self.lock)
+
+        await self.lock.acquire()
+        if predicate():
+            return
+
+        try:
+            await asyncio.wait_for(
+                getattr(self, condition).wait_for(predicate), timeout)
+        except BaseException:
+            if self.lock.locked():
+                self.lock.release()
+            raise
+
+    async def put(self, value, timeout=None):
+
+        '''
+        Same as BlockingContainer.put
+        '''
+
+        await self.wait('not_full', self.is_not_full, timeout)
+
+        try:
+            self.put_value(value)
+            self.size += 1
+            self.not_empty.notify()
+        finally:
+            self.lock.release()
+
+    async def put_many(self, values, timeout=None):
+
+        '''
+        Same as BlockingContainer.put_many
+        '''
+
+        end_time = None if timeout is None else monotonic() + timeout
+        iterator = iter(values)
+        value = next(iterator, self)  # self marks the end of the values
+
+        while value is not self:
+            remaining = None if end_time is None else \
+                max(end_time - monotonic(), 0)
+            await self.wait('not_full', self.is_not_full, remaining)
+
+            try:
+                count = 0
+                while (value is not self) and self.is_not_full():
+                    self.put_value(value)
+                    self.size += 1
+                    count += 1
+                    value = next(iterator, self)
+
+                self.not_empty.notify(count)
+            finally:
+                self.lock.release()
+
+    async def get(self, timeout=None):
+
+        '''
+        Same as BlockingContainer.get
+        '''
+
+        await self.wait('not_empty', self.is_not_empty, timeout)
+
+        try:
+            value = self.take_value()
+            self.size -= 1
+            self.not_full.notify()
+        finally:
+            self.lock.release()
+
+        return value
+
+    async def get_many(self, max_n, timeout=None):
+
+        '''
+        Same as BlockingContainer.get_many
+        '''
+
+        import asyncio
+
+        if max_n < 0:
+            raise ValueError('max_n must not be negative!')
+
+        try:
+            await self.wait('not_empty', self.is_not_empty, timeout)
+        except asyncio.TimeoutError:  # Not TimeoutError before Python 3.11
+            return []
+
+        try:
+            return self.take(min(max_n, self.size))
+        finally:
+            self.lock.release()
+
+
+def benchmark_blocking(blocking_class, async_class, n=100000, max_size=1000,
+                       batch_size=100):
+
+    '''
+    Function:
+        Measure the throughput (values per second) of passing n values
+        through a container: single-threaded through the container itself,
+        then from a producer thread to a consumer thread through the
+        blocking_class wrapper, getting the values one at a time and
+        batch_size at a time, and the same with the async_class wrapper and
+        two coroutines
+    Input:
+        blocking_class (class): Subclass of BlockingContainer
+        async_class (class): Subclass of AsyncContainer
+    Output:
+        dict_throughput (dict): Values per second for each setup
+    '''
+
+    import asyncio
+    import threading
+
+    def single_threaded():
+        container = blocking_class()
+        put, take = container.put_value, container.take_value
+        for value in range(n):
+            put(value)
+            take()
+
+    def threaded(batched):
+        container = blocking_class(max_size)
+
+        def producer():
+            for start in range(0, n, batch_size):
+                container.put_many(range(start, min(start + batch_size, n)))
+
+        thread = threading.Thread(target=producer)
+        thread.start()
+        received = 0
+        while received < n:
+            if batched:
+                received += len(container.get_many(batch_size))
+            else:
+                container.get()
+                received += 1
+
+        thread.join()
+
+    def with_asyncio():
+        async def run():
+            container = async_class(max_size)
+
+            async def producer():
+                for start in range(0, n, batch_size):
+                    await container.put_many(range(start,
+                                                   min(start + batch_size, n)))
+
+            task = asyncio.ensure_future(producer())
+            received = 0
+            while received < n:
+                received += len(await container.get_many(batch_size))
+
+            await task
+
+        asyncio.run(run())
+
+    dict_setups = {'single thread': single_threaded,
+                   'threads, get': lambda: threaded(False),
+                   'threads, get_many': lambda: threaded(True),
+                   'asyncio, get_many': with_asyncio}
+    dict_throughput = {}
+
+    for name, setup in dict_setups.items():
+        start_time = perf_counter()
+        setup()
+        dict_throughput[name] = n/(perf_counter() - start_time)
+        print(name + ': ' + str(int(dict_throughput[name])) + ' values/s')
+
+    return dict_throughput
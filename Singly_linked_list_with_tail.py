@@ -16,40 +16,193 @@ Space and Time complexities for a Singly linked list WITH tail:
     11. Check whether the linked list is empty: O(1)
     12. Check whether an element is present: O(n)
 
+7. can't be O(1) without previous pointers. For O(1) pops at both ends, use
+LinkedDeque (Doubly_linked_list_with_tail.py), which has the
+collections.deque API.
+
+With index=True (see Shared_utilities.LinkedListMixin), 12. and inserting
+after a given value become O(1). Inserting before and deleting a node stay
+O(n) since a singly linked node doesn't know its previous node (see
+DLinkedListWithTail for O(1)).
+
+For long lists, UnrolledLinkedList (Doubly_linked_list_with_tail.py) has
+the same methods but stores a chunk of values per node, which takes several
+times less memory and scans much faster.
+
+For sorted data, SkipList adds express lanes on top of the sorted singly
+linked list: each node is promoted to the next level with probability p (up
+to max_level levels) and keeps one next pointer per level. Each pointer
+also stores how many values it skips (its width), which gives ranks and
+selection by rank. The pointers and widths of a node share one flat list.
+
+Space and Time complexities (expected) for a skip list:
+    1. Space complexity: O(n), with 1/(1 - p) pointers per node on average
+    2. Search, insert, delete: O(log n)
+    3. Rank of a value, value at a rank: O(log n)
+    4. Iterating over the values in [lo, hi): O(log n + number of values)
+
+Missing values and empty lists are reported through return values (None or
+False) or exceptions (IndexError when deleting from an empty list) rather
+than printed. Lookup misses are also logged at DEBUG level to the module's
+logger.
 '''
 
 
+if __package__:  # Imported as a submodule of the package
+    from . import Shared_utilities
+else:
+    import Shared_utilities
+
+
+log_debug = Shared_utilities.debug_logger(__name__)
+
+
 class Node:
 
+    __slots__ = ('data', 'next')
+
     def __init__(self, data):
         self.data = data
         self.next = None
 
 
-class SLinkedListWithTail:
+class NodePool(Shared_utilities.NodePool):
+
+    '''
+    Pool of the Nodes above, see Shared_utilities.NodePool
+    '''
+
+    node_class = Node
+
+
+class SLinkedListWithTail(Shared_utilities.LinkedListMixin):
 
     '''
     Class for Singly linked list with tail
     '''
 
-    def __init__(self):
-        self.head = None
+    node_class = Node
+    has_tail = True
+
+    def __init__(self, pool=None, index=False):
+
+        '''
+        Input:
+            Same as Shared_utilities.LinkedListMixin
+        '''
+
+        super().__init__(pool, index)
         self.tail = None
 
-    def is_empty(self):
+    def find_previous_node(self, node):
 
         '''
         Function:
-            Return a boolean var for whether or not the linked list is empty
+            Find the node right before the input node. O(n)
+        Input:
+            node (Node): A node of the linked list, other than the head
         '''
 
-        if self.head is None:
-            print('The linked list is empty!')
-            return True
+        curr_node = self.head
+
+        while curr_node.next is not node:
+            curr_node = curr_node.next
+
+        return curr_node
+
+    def insert_after_node(self, node, value):
+
+        '''
+        Function:
+            Insert the input value right after the input node. O(1)
+        Input:
+            node (Node): A node of the linked list
+            value (int): The value we want to insert in the linked list
+        Output:
+            The new node
+        '''
+
+        new_node = self.make_node(value)
+        new_node.next = node.next
+        node.next = new_node
+
+        if node is self.tail:
+            self.tail = new_node
+
+        if self.size is not None:
+            self.size += 1
+
+        return new_node
+
+    def insert_before_node(self, node, value):
+
+        '''
+        Function:
+            Insert the input value right before the input node. O(1) for the
+            head node, O(n) otherwise
+        Input:
+            node (Node): A node of the linked list
+            value (int): The value we want to insert in the linked list
+        Output:
+            The new node
+        '''
+
+        if node is self.head:
+            return self.insert_element_at_start(value)
+
+        return self.insert_after_node(self.find_previous_node(node), value)
+
+    def delete_node(self, node):
+
+        '''
+        Function:
+            Remove the input node from the linked list. O(1) for the head
+            node, O(n) otherwise
+        Input:
+            node (Node): A node of the linked list
+        '''
+
+        if node is self.head:
+            previous_node = None
+            self.head = node.next
 
         else:
-            print('The linked list is not empty!')
-            return False
+            previous_node = self.find_previous_node(node)
+            previous_node.next = node.next
+
+        if node is self.tail:
+            self.tail = previous_node
+
+        self.release_node(node)
+
+    def last_node(self):
+
+        '''
+        Function:
+            Output the last node, None if the list is empty. O(1)
+        '''
+
+        return self.tail
+
+    def __reversed__(self):
+
+        '''
+        Function:
+            Generate the values from the last to the first. The nodes don't
+            know their previous node, so this first copies the values: O(n)
+            extra memory
+        '''
+
+        return reversed(list(self))
+
+    def is_empty(self):
+
+        '''
+        Function:
+            Return a boolean var for whether or not the linked list is empty
+        '''
+
+        return self.head is None
 
     def populate_an_empty_list(self, list_input):
 
@@ -59,25 +212,14 @@ class SLinkedListWithTail:
             pointer would point to the first value of the array and the tail
             pointer to the last value of the array
         Input:
-            list_input (list): Array of elements we want to populate
+            list_input (iterable): Elements we want to populate
         '''
 
         if self.head is not None:
-            print('The linked list is already populated! Please use one of the\
-                   following: insert_element_at_start, insert_element_at_end, \
-                      insert_element_after_a_node, insert_element_after_a_node\
-                          ')
-
-        else:
-            self.head = Node(list_input[0])
-            curr_node = self.head
-
-            for i in range(1, len(list_input)):
-                new_node = Node(list_input[i])
-                curr_node.next = new_node
-                curr_node = new_node
+            raise ValueError('The linked list is already populated! '
+                             'Please use extend')
 
-            self.tail = curr_node
+        self.extend(list_input)
 
     def show_element_at_start(self):
 
@@ -91,12 +233,9 @@ class SLinkedListWithTail:
         '''
 
         if self.head is None:
-            print('The linked list is empty')
-            return
+            return None
 
-        else:
-            print('The element at start is ' + str(self.head.data))
-            return self.head.data
+        return self.head.data
 
     def show_element_at_end(self):
 
@@ -110,12 +249,9 @@ class SLinkedListWithTail:
         '''
 
         if self.head is None:
-            print('The linked list is empty')
-            return
+            return None
 
-        else:
-            print('The element at end is ' + str(self.tail.data))
-            return self.tail.data
+        return self.tail.data
 
     def print_all_elements(self):
 
@@ -141,28 +277,7 @@ class SLinkedListWithTail:
             Boolean var for whether or not the input value is present
         '''
 
-        if self.head is None:
-            print('The linked list is empty')
-            return
-
-        else:
-            curr_node = self.head
-            fl_found = 0
-
-            while curr_node:
-                if curr_node.data == value:
-                    fl_found = 1
-                    break
-
-                curr_node = curr_node.next
-
-            if fl_found == 1:
-                print('The value ' + str(value) + ' is present in the list')
-                return True
-
-            else:
-                print('The value ' + str(value) + ' is missing from the list')
-                return False
+        return self.find_node(value) is not None
 
     def insert_element_at_start(self, value):
 
@@ -173,13 +288,23 @@ class SLinkedListWithTail:
             to this value will point at the previous head node
         Input:
             value (int): The value we want to insert in the linked list
+        Output:
+            The new node
         '''
 
-        new_node = Node(value)
+        new_node = self.make_node(value)
         head_node = self.head
         self.head = new_node
         new_node.next = head_node
 
+        if head_node is None:
+            self.tail = new_node
+
+        if self.size is not None:
+            self.size += 1
+
+        return new_node
+
     def insert_element_at_end(self, value):
 
         '''
@@ -189,16 +314,14 @@ class SLinkedListWithTail:
             have its next pointed at this node
         Input:
             value (int): The value we want to insert in the linked list
+        Output:
+            The new node
         '''
 
         if self.head is None:
-            print('The list is empty! Please use insert_element_at_start')
+            return self.insert_element_at_start(value)
 
-        else:
-            new_node = Node(value)
-            end_node = self.tail
-            end_node.next = new_node
-            self.tail = new_node
+        return self.insert_after_node(self.tail, value)
 
     def insert_element_after_a_node(self, value, curr_value):
 
@@ -209,24 +332,17 @@ class SLinkedListWithTail:
             value (int): The value we want to insert in the linked list
             curr_value (int): The value of the node after which we want to
                                 insert the new value
+        Output:
+            The new node. None if curr_value is missing
         '''
 
-        if self.head is None:
-            print('The list is empty! Please use insert_element_at_start')
-
-        else:
-            new_node = Node(value)
-            tmp_node = self.head
-            # The solution becomes O(1) only if the node is supplied as input.
+        # Only the search is O(n), and O(1) too with an index
+        node = self.find_node(curr_value)
+        if node is None:
+            log_debug('%s is missing from the linked list', curr_value)
+            return None
 
-            while tmp_node:
-                if tmp_node.data == curr_value:
-                    next_node = tmp_node.next
-                    tmp_node.next = new_node
-                    new_node.next = next_node
-                    break
-
-                tmp_node = tmp_node.next
+        return self.insert_after_node(node, value)
 
     def insert_element_before_a_node(self, value, curr_value):
 
@@ -239,27 +355,16 @@ class SLinkedListWithTail:
             value (int): The value we want to insert in the linked list
             curr_value (int): The value of the node before which we want to
                                 insert the new value
+        Output:
+            The new node. None if curr_value is missing
         '''
 
-        if self.head is None:
-            print('The list is empty! Please use insert_element_at_start')
-
-        else:
-            new_node = Node(value)
-            tmp_node = self.head
-
-            while tmp_node:
-                if tmp_node.next is not None:
-                    if tmp_node.next.data == curr_value:
-                        curr_next_node = tmp_node.next
-                        tmp_node.next = new_node
-                        new_node.next = curr_next_node
-                        break
-
-                    tmp_node = tmp_node.next
+        node = self.find_node(curr_value)
+        if node is None:
+            log_debug('%s is missing from the linked list', curr_value)
+            return None
 
-                else:
-                    print('Reached the end of the Linked List!')
+        return self.insert_before_node(node, value)
 
     def delete_top_node(self):
 
@@ -268,13 +373,13 @@ class SLinkedListWithTail:
             Remove the current head node of the linked list. The head pointer
             will now point at the node to which the previous head node was
             pointing at
+            Raises IndexError if the linked list is empty
         '''
 
         if self.head is None:
-            print('The list is empty!')
+            raise IndexError('delete from an empty linked list')
 
-        else:
-            self.head = self.head.next
+        self.delete_node(self.head)
 
     def delete_last_node(self):  # Same as for without tail
 
@@ -282,20 +387,14 @@ class SLinkedListWithTail:
         Function:
             Remove the current tail node of the linked list. The tail pointer
             will now point at the node right before the previous tail node
+            Raises IndexError if the linked list is empty
         '''
 
         if self.head is None:
-            print('The list is empty!')
-
-        else:
-            curr_node = self.head
-
-            while curr_node:
-                if curr_node.next.next is None:
-                    curr_node.next = None
-                    self.tail = curr_node
+            raise IndexError('delete from an empty linked list')
 
-                curr_node = curr_node.next
+        # The tail doesn't know its previous node: O(n) walk from the head
+        self.delete_node(self.tail)
 
     def delete_node_from_middle(self, node_value):
 
@@ -305,46 +404,360 @@ class SLinkedListWithTail:
 
         Input:
             node_value (int): Value of the node we want to remove
+        Output:
+            Boolean var for whether or not the value was found and removed
         '''
 
-        if self.head is None:
-            print('The list is empty!')
+        node = self.find_node(node_value)
+        if node is None:
+            log_debug('%s is missing from the linked list', node_value)
+            return False
+
+        self.delete_node(node)
+        return True
+
+
+class SkipNode:
+
+    '''
+    Node of a skip list. links holds, for each level, the next pointer then
+    its width: [next_0, width_0, next_1, width_1, ...]. One list per node
+    instead of one per field saves an object per node, and keeps the pair
+    read together during a search side by side
+    '''
+
+    __slots__ = ('data', 'links')
+
+    def __init__(self, data, level):
+        self.data = data
+        self.links = [None, 1]*level
+
+
+class SkipList:
+
+    '''
+    Sorted list of values (duplicates allowed) backed by a skip list. Level 0
+    is a plain sorted singly linked list. A None next pointer stands for the
+    end of the list, and the width of such a pointer is the number of steps
+    to one past the last value
+    '''
+
+    def __init__(self, p=0.5, max_level=32):
+
+        '''
+        Input:
+            p (float): Probability of promoting a node to the next level
+            max_level (int): Maximum number of levels
+        '''
+
+        from random import random
+
+        self.random = random  # Bound once, random_level runs per insert
+        self.p = p
+        self.max_level = max_level
+        self.head = SkipNode(None, max_level)
+        self.level = 1  # Number of levels in use
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+
+        '''
+        Function:
+            Generate the values in order, lazily
+        '''
+
+        node = self.head.links[0]
+
+        while node:
+            yield node.data
+            node = node.links[0]
+
+    def __contains__(self, value):
+        return self.search(value)
+
+    def random_level(self):
+
+        '''
+        Function:
+            Draw the number of levels of a new node: 1 + the number of
+            successful promotions with probability p
+        '''
+
+        level = 1
+
+        while level < self.max_level and self.random() < self.p:
+            level += 1
+
+        return level
+
+    def find_first(self, value):
+
+        '''
+        Function:
+            Find, on each level, the last node holding a value smaller than
+            the input value
+        Output:
+            nodes_before (list): That node for each level in use
+            position (int): Number of values smaller than the input value
+        '''
+
+        nodes_before = [None]*self.level
+        node = self.head
+        position = 0
+
+        for level in reversed(range(self.level)):
+            i = 2*level
+            j = i + 1  # Index of the width
+            next_node = node.links[i]
+            while (next_node is not None) and (next_node.data < value):
+                position += node.links[j]
+                node = next_node
+                next_node = node.links[i]
+
+            nodes_before[level] = node
+
+        return nodes_before, position
+
+    def search(self, value):
+
+        '''
+        Function:
+            Check if the input value is present
+        Output:
+            Boolean var for whether or not the value is present
+        '''
+
+        node = self.find_first(value)[0][0].links[0]
+
+        return (node is not None) and (node.data == value)
+
+    def insert(self, value):
+
+        '''
+        Function:
+            Insert the input value, after the values equal to it
+        '''
+
+        new_level = self.random_level()
+        if new_level > self.level:
+            for level in range(self.level, new_level):
+                self.head.links[2*level] = None
+                self.head.links[2*level + 1] = self.size + 1
+
+            self.level = new_level
+
+        # Last node on each level with a value <= the input value, and the
+        # number of steps taken on each level to reach it
+        nodes_before = [None]*self.level
+        steps_at_level = [0]*self.level
+        node = self.head
+
+        for level in reversed(range(self.level)):
+            i = 2*level
+            j = i + 1
+            next_node = node.links[i]
+            while (next_node is not None) and (next_node.data <= value):
+                steps_at_level[level] += node.links[j]
+                node = next_node
+                next_node = node.links[i]
+
+            nodes_before[level] = node
+
+        new_node = SkipNode(value, new_level)
+        steps = 0  # From nodes_before[level] to the new node
+
+        for level in range(new_level):
+            i = 2*level
+            links = nodes_before[level].links
+            new_node.links[i] = links[i]
+            links[i] = new_node
+            new_node.links[i + 1] = links[i + 1] - steps
+            links[i + 1] = steps + 1
+            steps += steps_at_level[level]
+
+        for level in range(new_level, self.level):
+            nodes_before[level].links[2*level + 1] += 1
+
+        self.size += 1
+
+    def delete(self, value):
+
+        '''
+        Function:
+            Remove the first occurrence of the input value
+        Output:
+            Boolean var for whether or not the value was present
+        '''
+
+        nodes_before = self.find_first(value)[0]
+        node = nodes_before[0].links[0]
+        if (node is None) or (node.data != value):
+            return False
+
+        node_level = len(node.links)//2
+
+        for level in range(node_level):
+            i = 2*level
+            links = nodes_before[level].links
+            links[i + 1] += node.links[i + 1] - 1
+            links[i] = node.links[i]
+
+        for level in range(node_level, self.level):
+            nodes_before[level].links[2*level + 1] -= 1
+
+        while (self.level > 1) and \
+                (self.head.links[2*(self.level - 1)] is None):
+            self.level -= 1
+
+        self.size -= 1
+        return True
+
+    def rank(self, value):
+
+        '''
+        Function:
+            Output the number of values smaller than the input value, ie. the
+            index it has (or would have) in the sorted list
+        '''
+
+        return self.find_first(value)[1]
+
+    def select(self, idx):
+
+        '''
+        Function:
+            Output the value at the input index of the sorted list
+        Input:
+            idx (int): Index, negative ones count from the end
+        '''
+
+        if idx < 0:
+            idx += self.size
+
+        if not 0 <= idx < self.size:
+            raise IndexError('skip list index out of range')
+
+        node = self.head
+        remaining = idx + 1  # Steps to take from the head
+
+        for level in reversed(range(self.level)):
+            i = 2*level
+            j = i + 1
+            while node.links[j] <= remaining:
+                remaining -= node.links[j]
+                node = node.links[i]
+
+        return node.data
+
+    def range(self, lo, hi):
+
+        '''
+        Function:
+            Generate, in order, the values v with lo <= v < hi
+        '''
+
+        node = self.find_first(lo)[0][0].links[0]
+
+        while (node is not None) and (node.data < hi):
+            yield node.data
+            node = node.links[0]
+
+    def print_all_elements(self):
+
+        '''
+        Function:
+            Print all the values present in the skip list, in order
+        '''
+
+        for value in self:
+            print(value)
+
+
+def benchmark_is_empty(n=1000000):
+
+    '''
+    Function:
+        Measure the number of is_empty calls per second on an empty and on a
+        populated list, against the former version which printed its answer.
+        Its output goes to os.devnull here, a terminal is slower still
+    Output:
+        dict_throughput (dict): Calls per second for each version and list
+    '''
+
+    from contextlib import redirect_stdout
+    from os import devnull
+    from timeit import timeit
+
+    def printing_is_empty(llist):
+        if llist.head is None:
+            print('The linked list is empty!')
+            return True
 
         else:
-            curr_node = self.head
-
-            while curr_node:
-                if curr_node.next is not None:
-                    if curr_node.next.data == node_value:
-                        curr_node.next = curr_node.next.next
-                        break
-
-                    curr_node = curr_node.next
-
-                else:
-                    print('Reached the end of the Linked List!')
-                    break
-
-llist = SLinkedListWithTail()
-llist.is_empty()
-llist.populate_an_empty_list([41, 37, 25, -7, 925])
-llist.is_empty()
-llist.print_all_elements()
-llist.show_element_at_start()
-llist.show_element_at_end()
-llist.is_element_present(-9)
-llist.is_element_present(925)
-llist.insert_element_at_start(64)
-llist.print_all_elements()
-llist.insert_element_at_end(72)
-llist.print_all_elements()
-llist.insert_element_after_a_node(value=21, curr_value=-7)
-llist.print_all_elements()
-llist.insert_element_before_a_node(value=1, curr_value=37)
-llist.print_all_elements()
-llist.delete_top_node()
-llist.print_all_elements()
-llist.delete_last_node()
-llist.print_all_elements()
-llist.delete_node_from_middle(25)
-llist.print_all_elements()
+            print('The linked list is not empty!')
+            return False
+
+    dict_throughput = {}
+
+    with open(devnull, 'w') as null_file, redirect_stdout(null_file):
+        for values in ([], [41, 37, 25]):
+            llist = SLinkedListWithTail()
+            llist.extend(values)
+            state = 'populated' if values else 'empty'
+
+            dict_throughput['printing, ' + state] = n/timeit(
+                lambda: printing_is_empty(llist), number=n)
+            dict_throughput['current, ' + state] = n/timeit(
+                llist.is_empty, number=n)
+
+    for name, throughput in dict_throughput.items():
+        print('is_empty, ' + name + ': ' + str(int(throughput)) + ' calls/s')
+
+    return dict_throughput
+
+
+if __name__ == '__main__':
+    llist = SLinkedListWithTail()
+    print(llist.is_empty())
+    llist.populate_an_empty_list([41, 37, 25, -7, 925])
+    print(llist.is_empty())
+    llist.print_all_elements()
+    print(llist.show_element_at_start())
+    print(llist.show_element_at_end())
+    print(llist.is_element_present(-9))
+    print(llist.is_element_present(925))
+    llist.insert_element_at_start(64)
+    llist.print_all_elements()
+    llist.insert_element_at_end(72)
+    llist.print_all_elements()
+    llist.insert_element_after_a_node(value=21, curr_value=-7)
+    llist.print_all_elements()
+    llist.insert_element_before_a_node(value=1, curr_value=37)
+    llist.print_all_elements()
+    llist.delete_top_node()
+    llist.print_all_elements()
+    llist.delete_last_node()
+    llist.print_all_elements()
+    llist.delete_node_from_middle(25)
+    llist.print_all_elements()
+
+    # Bulk operations: lazy extend, O(1) split and splice
+    llist = SLinkedListWithTail()
+    llist.extend(value*value for value in range(6))  # 0, 1, 4, 9, 16, 25
+    second_half = llist.split_at(llist.find_node(4))  # 9, 16, 25
+    llist.splice(second_half, after=llist.head)
+    llist.print_all_elements()  # 0, 9, 16, 25, 1, 4
+
+    # Sorted skip list
+    skip_list = SkipList()
+    for value in [41, 37, 25, -7, 925, 37]:
+        skip_list.insert(value)
+    skip_list.delete(925)
+    print(list(skip_list.range(0, 40)))  # [25, 37, 37]
+    print(skip_list.rank(37), skip_list.select(-1))  # 2 41
+
+    # Return values instead of prints
+    benchmark_is_empty(n=100000)
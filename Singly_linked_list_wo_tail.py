@@ -21,38 +21,165 @@ Space and Time complexities for a Singly linked list WITHOUT tail:
     11. Check whether the linked list is empty: O(1)
     12. Check whether an element is present: O(n)
 
+With index=True (see Shared_utilities.LinkedListMixin), 12. and inserting
+after a given value become O(1). Inserting before and deleting a node stay
+O(n) since a singly linked node doesn't know its previous node (see
+DLinkedListWithTail for O(1)).
+
+For long lists, UnrolledLinkedList (Doubly_linked_list_with_tail.py) has
+the same methods but stores a chunk of values per node, which takes several
+times less memory and scans much faster.
+
+None of the methods except print_all_elements prints: an empty list or a
+missing value shows up in the return value (None/False), deleting from an
+empty list raises IndexError, and misses are logged at DEBUG level.
 '''
 
+if __package__:  # Imported as a submodule of the package
+    from . import Shared_utilities
+else:
+    import Shared_utilities
+
+log_debug = Shared_utilities.debug_logger(__name__)
+
 
 class Node:
 
+    __slots__ = ('data', 'next')
+
     def __init__(self, data):
         self.data = data
         self.next = None
 
 
-class SLinkedListWithoutTail:
+class NodePool(Shared_utilities.NodePool):
+
+    '''
+    Pool of the Nodes above, see Shared_utilities.NodePool
+    '''
+
+    node_class = Node
+
+
+class SLinkedListWithoutTail(Shared_utilities.LinkedListMixin):
 
     '''
     Class for Singly linked list without tail
     '''
-    def __init__(self):
-        self.head = None
 
-    def is_empty(self):
+    node_class = Node
+
+    def find_previous_node(self, node):
 
         '''
         Function:
-            Return a boolean var for whether or not the linked list is empty
+            Find the node right before the input node. O(n)
+        Input:
+            node (Node): A node of the linked list, other than the head
         '''
 
-        if self.head is None:
-            print('The linked list is empty!')
-            return True
+        curr_node = self.head
+
+        while curr_node.next is not node:
+            curr_node = curr_node.next
+
+        return curr_node
+
+    def insert_after_node(self, node, value):
+
+        '''
+        Function:
+            Insert the input value right after the input node. O(1)
+        Input:
+            node (Node): A node of the linked list
+            value (int): The value we want to insert in the linked list
+        Output:
+            The new node
+        '''
+
+        new_node = self.make_node(value)
+        new_node.next = node.next
+        node.next = new_node
+
+        if self.size is not None:
+            self.size += 1
+
+        return new_node
+
+    def insert_before_node(self, node, value):
+
+        '''
+        Function:
+            Insert the input value right before the input node. O(1) for the
+            head node, O(n) otherwise
+        Input:
+            node (Node): A node of the linked list
+            value (int): The value we want to insert in the linked list
+        Output:
+            The new node
+        '''
+
+        if node is self.head:
+            return self.insert_element_at_start(value)
+
+        return self.insert_after_node(self.find_previous_node(node), value)
+
+    def delete_node(self, node):
+
+        '''
+        Function:
+            Remove the input node from the linked list. O(1) for the head
+            node, O(n) otherwise
+        Input:
+            node (Node): A node of the linked list
+        '''
+
+        if node is self.head:
+            previous_node = None
+            self.head = node.next
 
         else:
-            print('The linked list is not empty!')
-            return False
+            previous_node = self.find_previous_node(node)
+            previous_node.next = node.next
+
+        self.release_node(node)
+
+    def last_node(self):
+
+        '''
+        Function:
+            Output the last node, None if the list is empty. O(n)
+        '''
+
+        if self.head is None:
+            return None
+
+        curr_node = self.head
+
+        while curr_node.next is not None:
+            curr_node = curr_node.next
+
+        return curr_node
+
+    def __reversed__(self):
+
+        '''
+        Function:
+            Generate the values from the last to the first. The nodes don't
+            know their previous node, so this first copies the values: O(n)
+            extra memory
+        '''
+
+        return reversed(list(self))
+
+    def is_empty(self):
+
+        '''
+        Function:
+            Return a boolean var for whether or not the linked list is empty
+        '''
+
+        return self.head is None
 
     def populate_an_empty_list(self, list_input):
 
@@ -61,18 +188,15 @@ class SLinkedListWithoutTail:
             Populate a list of elements to an empty linked list. The head
             pointer would point to the first value of the array.
         Input:
-            list_input (list): Array of elements we want to populate
+            list_input (iterable): Elements we want to populate
         '''
 
-        self.head = Node(list_input[0])
-        curr_node = self.head
-
-        for i in range(1, len(list_input)):
-            new_node = Node(list_input[i])
-            curr_node.next = new_node
-            curr_node = new_node
+        self.head = None
+        self.size = 0
+        if self.index is not None:
+            self.index = {}
 
-        curr_node.next = None
+        self.extend(list_input)
 
     def show_element_at_start(self):
 
@@ -86,10 +210,9 @@ class SLinkedListWithoutTail:
         '''
 
         if self.head is None:
-            print('The linked list is empty')
+            return None
 
-        else:
-            print('The element at start is ' + str(self.head.data))
+        return self.head.data
 
     def show_element_at_end(self):
 
@@ -100,17 +223,9 @@ class SLinkedListWithoutTail:
             Value of the end node. None if the linked list is empty
         '''
 
-        if self.head is None:
-            print('The linked list is empty')
-
-        else:
-            curr_node = self.head
-
-            while curr_node:
-                if curr_node.next is None:
-                    print('The element at end is ' + str(curr_node.data))
+        end_node = self.last_node()
 
-                curr_node = curr_node.next
+        return None if end_node is None else end_node.data
 
     def print_all_elements(self):
 
@@ -136,27 +251,7 @@ class SLinkedListWithoutTail:
             Boolean var for whether or not the input value is present
         '''
 
-        if self.head is None:
-            print('The linked list is empty')
-
-        else:
-            curr_node = self.head
-            fl_found = 0
-
-            while curr_node:
-                if curr_node.data == value:
-                    fl_found = 1
-                    break
-
-                curr_node = curr_node.next
-
-            if fl_found == 1:
-                print('The value ' + str(value) + ' is present in the list')
-                return True
-
-            else:
-                print('The value ' + str(value) + ' is missing from the list')
-                return False
+        return self.find_node(value) is not None
 
     def insert_element_at_start(self, value):
 
@@ -167,13 +262,20 @@ class SLinkedListWithoutTail:
             to this value will point at the previous head node
         Input:
             value (int): The value we want to insert in the linked list
+        Output:
+            The new node
         '''
 
-        new_node = Node(value)
+        new_node = self.make_node(value)
         head_node = self.head
         self.head = new_node
         new_node.next = head_node
 
+        if self.size is not None:
+            self.size += 1
+
+        return new_node
+
     def insert_element_at_end(self, value):
 
         '''
@@ -183,21 +285,15 @@ class SLinkedListWithoutTail:
             a new node at the end
         Input:
             value (int): The value we want to insert in the linked list
+        Output:
+            The new node
         '''
 
-        if self.head is None:
-            print('The list is empty! Please use insert_element_at_start')
+        end_node = self.last_node()
+        if end_node is None:
+            return self.insert_element_at_start(value)
 
-        else:
-            new_node = Node(value)
-            curr_node = self.head
-
-            while curr_node:
-                if curr_node.next is None:
-                    curr_node.next = new_node
-                    break
-
-                curr_node = curr_node.next
+        return self.insert_after_node(end_node, value)
 
     def insert_element_after_a_node(self, value, curr_value):
 
@@ -208,22 +304,17 @@ class SLinkedListWithoutTail:
             value (int): The value we want to insert in the linked list
             curr_value (int): The value of the node after which we want to
                                 insert the new value
+        Output:
+            The new node. None if curr_value is missing
         '''
 
-        if self.head is None:
-            print('The list is empty! Please use insert_element_at_start')
-
-        else:
-            new_node = Node(value)
-            tmp_node = self.head
-
-            while tmp_node:
-                if tmp_node.data == curr_value:
-                    next_node = tmp_node.next
-                    tmp_node.next = new_node
-                    new_node.next = next_node
+        # Only the search is O(n), and O(1) too with an index
+        node = self.find_node(curr_value)
+        if node is None:
+            log_debug('%s is missing from the linked list', curr_value)
+            return None
 
-                tmp_node = tmp_node.next
+        return self.insert_after_node(node, value)
 
     def insert_element_before_a_node(self, value, curr_value):
 
@@ -235,28 +326,16 @@ class SLinkedListWithoutTail:
             value (int): The value we want to insert in the linked list
             curr_value (int): The value of the node before which we want to
                                 insert the new value
+        Output:
+            The new node. None if curr_value is missing
         '''
 
-        if self.head is None:
-            print('The list is empty! Please use insert_element_at_start')
-
-        else:
-            new_node = Node(value)
-            tmp_node = self.head
+        node = self.find_node(curr_value)
+        if node is None:
+            log_debug('%s is missing from the linked list', curr_value)
+            return None
 
-            while tmp_node:
-                if tmp_node.next is not None:
-                    if tmp_node.next.data == curr_value:
-                        curr_next_node = tmp_node.next
-                        tmp_node.next = new_node
-                        new_node.next = curr_next_node
-                        break
-
-                    tmp_node = tmp_node.next
-
-                else:
-                    print('Reached the end of the Linked List!')
-                    break
+        return self.insert_before_node(node, value)
 
     def delete_top_node(self):
 
@@ -265,32 +344,26 @@ class SLinkedListWithoutTail:
             Remove the current head node of the linked list. The head pointer
             will now point at the node to which the previous head node was
             pointing at
+            Raises IndexError if the linked list is empty
         '''
 
         if self.head is None:
-            print('The list is empty!')
+            raise IndexError('delete from an empty linked list')
 
-        else:
-            self.head = self.head.next
+        self.delete_node(self.head)
 
     def delete_last_node(self):
 
         '''
         Function:
             Remove the current end node of the linked list.
+            Raises IndexError if the linked list is empty
         '''
 
         if self.head is None:
-            print('The list is empty!')
+            raise IndexError('delete from an empty linked list')
 
-        else:
-            curr_node = self.head
-
-            while curr_node:
-                if curr_node.next.next is None:
-                    curr_node.next = None
-
-                curr_node = curr_node.next
+        self.delete_node(self.last_node())
 
     def delete_node_from_middle(self, node_value):
 
@@ -299,46 +372,40 @@ class SLinkedListWithoutTail:
             Remove the node which takes the value node_value
         Input:
             node_value (int): Value of the node we want to remove
+        Output:
+            Boolean var for whether or not the value was found and removed
         '''
 
-        if self.head is None:
-            print('The list is empty!')
+        node = self.find_node(node_value)
+        if node is None:
+            log_debug('%s is missing from the linked list', node_value)
+            return False
 
-        else:
-            curr_node = self.head
-
-            while curr_node:
-                if curr_node.next is not None:
-                    if curr_node.next.data == node_value:
-                        curr_node.next = curr_node.next.next
-                        break
-
-                    curr_node = curr_node.next
-
-                else:
-                    print('Reached the end of the Linked List!')
-                    break
-
-llist = SLinkedListWithoutTail()
-llist.is_empty()
-llist.populate_an_empty_list([41, 37, 25, -7, 925])
-llist.is_empty()
-llist.print_all_elements()
-llist.show_element_at_start()
-llist.show_element_at_end()
-llist.is_element_present(-9)
-llist.is_element_present(-7)
-llist.insert_element_at_start(64)
-llist.print_all_elements()
-llist.insert_element_at_end(72)
-llist.print_all_elements()
-llist.insert_element_after_a_node(value=21, curr_value=-7)
-llist.print_all_elements()
-llist.insert_element_before_a_node(value=1, curr_value=37)
-llist.print_all_elements()
-llist.delete_top_node()
-llist.print_all_elements()
-llist.delete_last_node()
-llist.print_all_elements()
-llist.delete_node_from_middle(37)
-llist.print_all_elements()
+        self.delete_node(node)
+        return True
+
+
+if __name__ == '__main__':
+    llist = SLinkedListWithoutTail()
+    print(llist.is_empty())
+    llist.populate_an_empty_list([41, 37, 25, -7, 925])
+    print(llist.is_empty())
+    llist.print_all_elements()
+    print(llist.show_element_at_start())
+    print(llist.show_element_at_end())
+    print(llist.is_element_present(-9))
+    print(llist.is_element_present(-7))
+    llist.insert_element_at_start(64)
+    llist.print_all_elements()
+    llist.insert_element_at_end(72)
+    llist.print_all_elements()
+    llist.insert_element_after_a_node(value=21, curr_value=-7)
+    llist.print_all_elements()
+    llist.insert_element_before_a_node(value=1, curr_value=37)
+    llist.print_all_elements()
+    llist.delete_top_node()
+    llist.print_all_elements()
+    llist.delete_last_node()
+    llist.print_all_elements()
+    llist.delete_node_from_middle(37)
+    llist.print_all_elements()
@@ -11,14 +11,46 @@ Space and time complexity:
     4. Display: O(1)
     5. Is empty: O(1)
 
+BlockingStack and AsyncStack make a stack safe to share between producer and
+consumer threads (resp. coroutines): get waits for a value, put waits for
+room when a max_size is set, both with optional timeouts. put_many pushes as
+many values as there is room for, and get_many pops up to max_n values, per
+lock acquisition and wake-up.
 '''
 
+if __package__:  # Imported as a submodule of the package
+    from . import Shared_utilities
+else:
+    import Shared_utilities
+
 
 class Stack:
 
     def __init__(self):
         self.stack = []
 
+    def __len__(self):
+        return len(self.stack)
+
+    def __iter__(self):
+
+        '''
+        Iterate over the values from the bottom to the top of the stack
+        '''
+
+        return iter(self.stack)
+
+    def __reversed__(self):
+
+        '''
+        Iterate over the values from the top to the bottom of the stack
+        '''
+
+        return reversed(self.stack)
+
+    def __contains__(self, value):
+        return value in self.stack
+
     def push(self, value):
 
         '''
@@ -33,7 +65,7 @@ class Stack:
         Remove and output the element at the top of the stack
         '''
 
-        self.stack.pop()
+        return self.stack.pop()
 
     def top(self):
 
@@ -59,14 +91,78 @@ class Stack:
 
         print(self.stack)
 
-stack = Stack()
-stack.is_empty()
-stack.push(12)
-stack.push(6)
-stack.push(87)
-stack.push(90)
-top_elem = stack.top()
-print(top_elem)
-stack.pop()
-stack.pop()
-stack.print_all_elements()
+
+class BlockingStack(Shared_utilities.BlockingContainer):
+
+    '''
+    Thread-safe stack, see Shared_utilities.BlockingContainer for the
+    methods (get_many outputs the values top first). Wraps any stack with
+    push and pop methods (by default the Stack above, but eg. the linked list
+    Stack of Stack_linked_list_implmentation.py works too)
+    '''
+
+    def __init__(self, max_size=None, stack=None):
+
+        '''
+        Input:
+            max_size (int): Optional, put waits while the stack holds this
+                            many values
+            stack: Optional, the underlying stack. Must be empty
+        '''
+
+        self.stack = Stack() if stack is None else stack
+        super().__init__(self.stack.push, self.stack.pop, max_size,
+                         name='stack')
+
+
+class AsyncStack(Shared_utilities.AsyncContainer):
+
+    '''
+    asyncio version of BlockingStack, for producers and consumers running as
+    coroutines of a single event loop. Same methods, as coroutines
+    '''
+
+    def __init__(self, max_size=None, stack=None):
+        self.stack = Stack() if stack is None else stack
+        super().__init__(self.stack.push, self.stack.pop, max_size,
+                         name='stack')
+
+
+def benchmark_blocking_stack(n=100000, max_size=1000, batch_size=100):
+
+    '''
+    Measure the throughput (values per second) of passing n values through a
+    stack: single-threaded through Stack, then from a producer thread to a
+    consumer thread through BlockingStack (getting one value and batch_size
+    values at a time), and between two coroutines through AsyncStack. Output
+    a dict of the throughputs
+    '''
+
+    return Shared_utilities.benchmark_blocking(BlockingStack, AsyncStack, n,
+                                               max_size, batch_size)
+
+
+if __name__ == '__main__':
+    stack = Stack()
+    stack.is_empty()
+    stack.push(12)
+    stack.push(6)
+    stack.push(87)
+    stack.push(90)
+    top_elem = stack.top()
+    print(top_elem)
+    stack.pop()
+    stack.pop()
+    stack.print_all_elements()
+
+    # Thread-safe stack. Expected output: [2, 1, 0], then a TimeoutError
+    stack = BlockingStack(max_size=3)
+    for value in range(3):
+        stack.put(value)
+    try:
+        stack.put(3, timeout=0.01)
+    except TimeoutError:
+        print('TimeoutError')
+    print(stack.get_many(10))
+
+    benchmark_blocking_stack(n=10000)
@@ -13,23 +13,93 @@ Space and time complexity:
 
 '''
 
+if __package__:  # Imported as a submodule of the package
+    from . import Shared_utilities
+else:
+    import Shared_utilities
+
 
 class Node:
     '''
     Node of a linked list
     '''
 
+    __slots__ = ('data', 'next', 'previous')
+
     def __init__(self, data):
         self.data = data
         self.next = None
         self.previous = None
 
 
+class NodePool(Shared_utilities.NodePool):
+
+    '''
+    Pool of the Nodes above, see Shared_utilities.NodePool
+    '''
+
+    node_class = Node
+
+
 class DLinkedListWithTail:
 
-    def __init__(self):
+    def __init__(self, pool=None):
+
+        '''
+        Input:
+            pool (NodePool): Optional, pool to take nodes from and release
+                             removed nodes to
+        '''
+
         self.head = None
         self.tail = None
+        self.size = 0
+        self.pool = pool
+        self.make_node = Node if pool is None else pool.new_node
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+
+        '''
+        Function:
+            Generate the values from the head to the tail, lazily
+        '''
+
+        curr_node = self.head
+
+        while curr_node:
+            yield curr_node.data
+            curr_node = curr_node.next
+
+    def __reversed__(self):
+
+        '''
+        Function:
+            Generate the values from the tail to the head, lazily
+        '''
+
+        curr_node = self.tail
+
+        while curr_node:
+            yield curr_node.data
+            curr_node = curr_node.previous
+
+    def __contains__(self, value):
+        return any(data == value for data in self)
+
+    def release_node(self, node):
+
+        '''
+        Function:
+            Hand a removed node back to the node pool, if any
+        '''
+
+        self.size -= 1
+
+        if self.pool is not None:
+            self.pool.release(node)
 
     def is_empty(self):
 
@@ -38,13 +108,7 @@ class DLinkedListWithTail:
             Return a boolean var for whether or not the linked list is empty
         '''
 
-        if self.head is None:
-            print('The linked list is empty!')
-            return True
-
-        else:
-            print('The linked list is not empty!')
-            return False
+        return self.head is None
 
     def insert(self, val):
 
@@ -55,7 +119,8 @@ class DLinkedListWithTail:
             val (int/float): The value of the elements we want to add
         '''
 
-        new_node = Node(val)
+        new_node = self.make_node(val)
+        self.size += 1
 
         if self.head is None:
             self.head = new_node
@@ -103,6 +168,7 @@ class DLinkedListWithTail:
             else:
                 self.head = None
             self.tail = previous_node
+            self.release_node(end_node)
 
             return output
 
@@ -122,8 +188,36 @@ class DLinkedListWithTail:
 
 class Stack:
 
-    def __init__(self):
-        self.stack = DLinkedListWithTail()
+    def __init__(self, pool=None):
+
+        '''
+        Input:
+            pool (NodePool): Optional, pool to recycle the nodes with
+        '''
+
+        self.stack = DLinkedListWithTail(pool)
+
+    def __len__(self):
+        return len(self.stack)
+
+    def __iter__(self):
+
+        '''
+        Iterate over the values from the bottom to the top
+        '''
+
+        return iter(self.stack)
+
+    def __reversed__(self):
+
+        '''
+        Iterate over the values from the top to the bottom
+        '''
+
+        return reversed(self.stack)
+
+    def __contains__(self, value):
+        return value in self.stack
 
     def push(self, value):
 
@@ -161,14 +255,16 @@ class Stack:
 
         self.stack.print_all_elements()
 
-stack = Stack()
-stack.is_empty()
-stack.push(12)
-stack.push(6)
-stack.push(87)
-stack.push(90)
-top_elem = stack.top()
-print(top_elem)
-stack.pop()
-stack.pop()
-stack.print_all_elements()
+
+if __name__ == '__main__':
+    stack = Stack()
+    stack.is_empty()
+    stack.push(12)
+    stack.push(6)
+    stack.push(87)
+    stack.push(90)
+    top_elem = stack.top()
+    print(top_elem)
+    stack.pop()
+    stack.pop()
+    stack.print_all_elements()
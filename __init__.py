@@ -0,0 +1,96 @@
+'''
+The repository doubles as a package: each script is a submodule, loaded the
+first time it's used. Importing the package itself imports nothing else, and
+importing a submodule no longer runs its examples (they only run when the
+script is executed, eg. python AVL_Tree.py).
+
+The main classes and functions are available from the package directly, eg.
+package.AVLTree is AVL_Tree.AVLTree. Names defined in several scripts (the
+Graph classes, the linked list versions of Queue and Stack) are only reached
+through their submodule, eg. package.Graphs_Dijkstra_BellmanFord.Graph.
+
+python -m <package> lists the scripts, runs the examples of the ones given
+as arguments, and --import-time measures their cold import time.
+'''
+
+from importlib import import_module
+
+SUBMODULES = ('AVL_Tree', 'Array_operations', 'BinaryMinHeap', 'BinarySearch',
+              'DisjointSets', 'Doubly_linked_list_with_tail',
+              'Graphs_DFS_BFS_SCC_ShortestPath',
+              'Graphs_Dijkstra_BellmanFord',
+              'Graphs_Kruskal_Prim_Algorithms', 'MergeSort',
+              'PriorityQueue_BinaryMaxHeap', 'Queue_array_implementation',
+              'Queue_linked_list_implementation',
+              'Singly_linked_list_with_tail', 'Singly_linked_list_wo_tail',
+              'Stack_array_implmentation', 'Stack_linked_list_implmentation')
+
+# Public name -> submodule defining it
+dict_exports = {
+    'AVLTree': 'AVL_Tree',
+    'Array': 'Array_operations',
+    'GapBufferArray': 'Array_operations',
+    'ChunkedArray': 'Array_operations',
+    'BinaryMinHeap': 'BinaryMinHeap',
+    'BinarySearch': 'BinarySearch',
+    'lower_bound': 'BinarySearch',
+    'upper_bound': 'BinarySearch',
+    'equal_range': 'BinarySearch',
+    'search_many': 'BinarySearch',
+    'SearchIndex': 'BinarySearch',
+    'MappedSortedFile': 'BinarySearch',
+    'DisjointSet': 'DisjointSets',
+    'DLinkedListWithTail': 'Doubly_linked_list_with_tail',
+    'LinkedDeque': 'Doubly_linked_list_with_tail',
+    'UnrolledLinkedList': 'Doubly_linked_list_with_tail',
+    'MergeSort': 'MergeSort',
+    'parallel_merge_sort': 'MergeSort',
+    'external_merge_sort': 'MergeSort',
+    'BinaryMaxHeap': 'PriorityQueue_BinaryMaxHeap',
+    'heap_sort': 'PriorityQueue_BinaryMaxHeap',
+    'k_largest_elements': 'PriorityQueue_BinaryMaxHeap',
+    'k_largest_elements_parallel': 'PriorityQueue_BinaryMaxHeap',
+    'Queue': 'Queue_array_implementation',
+    'BlockingQueue': 'Queue_array_implementation',
+    'AsyncQueue': 'Queue_array_implementation',
+    'SLinkedListWithTail': 'Singly_linked_list_with_tail',
+    'SkipList': 'Singly_linked_list_with_tail',
+    'SLinkedListWithoutTail': 'Singly_linked_list_wo_tail',
+    'Stack': 'Stack_array_implmentation',
+    'BlockingStack': 'Stack_array_implmentation',
+    'AsyncStack': 'Stack_array_implmentation',
+}
+
+__all__ = list(SUBMODULES) + list(dict_exports)
+
+
+def __getattr__(name):
+
+    '''
+    Function:
+        Called for names missing from the package namespace (PEP 562).
+        Imports the submodule on first use and caches the result in the
+        namespace, so later lookups don't come back here
+    Input:
+        name (str): A submodule or a name from dict_exports
+    Output:
+        The submodule or the object it defines
+    '''
+
+    if name in SUBMODULES:
+        value = import_module('.' + name, __name__)
+
+    elif name in dict_exports:
+        value = getattr(import_module('.' + dict_exports[name], __name__),
+                        name)
+
+    else:
+        raise AttributeError('module ' + repr(__name__) + ' has no attribute '
+                             + repr(name))
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,93 @@
+'''
+Entry point for python -m <package>:
+    python -m <package>                      # List the scripts
+    python -m <package> AVL_Tree MergeSort   # Run their examples
+    python -m <package> --import-time        # Cold import time of each script
+'''
+
+from argparse import ArgumentParser
+from os import path as os_path
+from runpy import run_module
+import subprocess
+import sys
+
+from . import SUBMODULES
+
+# Run in a fresh interpreter so that nothing is cached from a previous import
+IMPORT_TIMER = '''
+import sys
+from time import perf_counter
+sys.path.insert(0, sys.argv[1])
+start = perf_counter()
+for name in sys.argv[2:]:
+    __import__(name)
+print(perf_counter() - start)
+'''
+
+
+def cold_import_time(names, repeat=5):
+
+    '''
+    Function:
+        Measure the time it takes to import modules of the package in a new
+        interpreter, ie. with none of their dependencies imported yet. The
+        .pyc files are written by a first, untimed, run
+    Input:
+        names (list): Full names of the modules, imported one after the other
+        repeat (int): Number of interpreters started. The best time is kept
+    Output:
+        Import time in seconds
+    '''
+
+    parent_dir = os_path.dirname(os_path.dirname(os_path.abspath(__file__)))
+    command = [sys.executable, '-c', IMPORT_TIMER, parent_dir] + list(names)
+
+    list_times = []
+    for _ in range(repeat + 1):
+        output = subprocess.run(command, capture_output=True, check=True,
+                                text=True).stdout
+        list_times.append(float(output))
+
+    return min(list_times[1:])
+
+
+def main(args=None):
+    parser = ArgumentParser(prog='python -m ' + __package__,
+                            description='Run the examples of the scripts')
+    parser.add_argument('scripts', nargs='*', metavar='script',
+                        help='Script name, or all')
+    parser.add_argument('--import-time', action='store_true',
+                        help='Measure the cold import time of the package '
+                             'and of each script instead')
+    args = parser.parse_args(args)
+
+    for name in args.scripts:
+        if name not in SUBMODULES + ('all',):
+            parser.error('unknown script ' + repr(name) + ', choose from: ' +
+                         ', '.join(SUBMODULES))
+
+    scripts = SUBMODULES if 'all' in args.scripts else args.scripts
+
+    if args.import_time:
+        names = [__package__ + '.' + name for name in scripts or SUBMODULES]
+        print(__package__ + ': ' +
+              str(round(cold_import_time([__package__])*1e3, 2)) + ' ms')
+
+        for name in names:
+            print(name + ': ' + str(round(cold_import_time([name])*1e3, 2)) +
+                  ' ms')
+
+        print('all of the above: ' +
+              str(round(cold_import_time(names)*1e3, 2)) + ' ms')
+
+    elif not scripts:
+        print('\n'.join(SUBMODULES))
+
+    else:
+        for name in scripts:
+            print('# ' + name)
+            run_module(__package__ + '.' + name, run_name='__main__')
+
+
+if __name__ == '__main__':
+    main()
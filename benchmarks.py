@@ -0,0 +1,1445 @@
+'''
+Benchmark suite for the data structures and algorithms of the repository.
+
+Every case times one public operation on a synthetic input of size n, for n
+growing by powers of 10 (10^2 to 10^7 by default). A case stops growing as
+soon as its next size is expected to take longer than the time budget, so the
+slow structures stop early and the fast ones go up to 10^7. The lookup-like
+cases, which time a fixed number of queries (NUM_QUERIES), skip the sizes
+that aren't larger than it.
+
+Inputs (all generated from a seeded random.Random, so runs are comparable):
+    1. Arrays: random, permutation (random without duplicates), sorted,
+        reversed, nearly sorted, few unique values, organ pipe (ascending then
+        descending) and skewed (i**4, adversarial for interpolation search)
+    2. Graphs with n vertices: random (3n edges), grid (square, edges to the
+        right and bottom neighbours) and power-law (Barabasi-Albert, each new
+        vertex attached to 2 vertices picked proportionally to their degree)
+    3. Operation mixes: n operations, half inserts, a quarter deletes and a
+        quarter lookups
+
+Complexity regressions: every case declares the complexity of the timed work
+(eg. n log n for n inserts in a balanced tree, log n for a fixed number of
+lookups). The scaling exponent is the slope of log(time) against log(n),
+fitted over the sizes which took long enough to be measured reliably. A case
+is flagged when its exponent exceeds that of its declared complexity, over the
+same sizes, by more than the tolerance: O(n log n) turning into O(n^2) adds
+about 0.9 to the exponent. With --baseline, the exponents and the times are
+also compared to those of a previous run.
+
+Usage (from the repository, or python -m <package>.benchmarks):
+    python benchmarks.py --list                       # List the cases
+    python benchmarks.py AVLTree MergeSort            # Cases matching a regex
+    python benchmarks.py --max-size 1e5 --json out.json --plot plots
+    python benchmarks.py --baseline out.json          # Compare to a past run
+
+The exit status is 1 if a regression was found. Plots need matplotlib.
+'''
+
+from argparse import ArgumentParser
+import gc
+from importlib import import_module
+import json
+from math import log, log2
+from os import path as os_path
+import platform
+from random import Random
+import re
+import sys
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+DEFAULT_SIZES = (10**2, 10**3, 10**4, 10**5, 10**6, 10**7)
+NUM_QUERIES = 1000  # Number of operations timed by the lookup-like cases
+MIN_TIME = 2e-4  # Shorter runs are left out of the exponent fit
+
+dict_complexities = {
+    '1': lambda n: 1,
+    'log n': lambda n: log2(n),
+    'n': lambda n: n,
+    'n log n': lambda n: n*log2(n),
+    'n^2': lambda n: n*n,
+}
+
+
+def load(name):
+
+    '''
+    Function:
+        Import one of the scripts of the repository, as a submodule of the
+        package if this module was imported from it
+    Input:
+        name (str): Name of the script, without .py
+    Output:
+        The module
+    '''
+
+    if __package__:
+        return import_module('.' + name, __package__)
+
+    return import_module(name)
+
+
+class Case:
+
+    '''
+    One benchmarked operation. setup(n, rng, work_dir) builds the input of
+    size n and returns the function to time, which takes no arguments
+    '''
+
+    def __init__(self, name, setup, expected, ops=None):
+
+        '''
+        Input:
+            name (str): Structure.operation[input], eg. AVLTree.insert[sorted]
+            setup (function): Returns the function to time
+            expected (str): Key of dict_complexities, for the whole timed
+                            function
+            ops (function): Optional, number of operations the timed function
+                            makes for a size n. n by default
+        '''
+
+        self.name = name
+        self.setup = setup
+        self.expected = expected
+        self.ops = (lambda n: n) if ops is None else ops
+        # A fixed number of queries is only lookup-like on an input larger
+        # than it: smaller sizes would time a different workload
+        self.min_size = NUM_QUERIES + 1 if ops is fixed_queries else 1
+
+
+def fixed_queries(n):
+    return NUM_QUERIES
+
+
+# Inputs
+
+def make_array(kind, n, rng):
+
+    '''
+    Function:
+        Generate an array of n integers
+    Input:
+        kind (str): random, permutation, sorted, reversed, nearly_sorted,
+                    few_unique, organ_pipe or skewed
+        n (int): Length of the array
+        rng (Random): Source of randomness
+    Output:
+        array (list): The generated array
+    '''
+
+    if kind == 'random':
+        return [rng.randrange(n) for _ in range(n)]
+
+    elif kind == 'permutation':
+        return rng.sample(range(n), n)
+
+    elif kind == 'sorted':
+        return list(range(n))
+
+    elif kind == 'reversed':
+        return list(range(n, 0, -1))
+
+    elif kind == 'nearly_sorted':
+        array = list(range(n))
+        for _ in range(n//100 + 1):
+            i, j = rng.randrange(n), rng.randrange(n)
+            array[i], array[j] = array[j], array[i]
+        return array
+
+    elif kind == 'few_unique':
+        return [rng.randrange(10) for _ in range(n)]
+
+    elif kind == 'organ_pipe':
+        return list(range(n//2)) + list(range(n - n//2, 0, -1))
+
+    elif kind == 'skewed':
+        return [i**4 for i in range(n)]
+
+    raise ValueError('Unknown array kind: ' + kind)
+
+
+def make_edges(kind, n, rng):
+
+    '''
+    Function:
+        Generate the edges of a graph whose vertices are 0, ..., n - 1
+    Input:
+        kind (str): random, grid or power_law
+        n (int): Number of vertices (rounded down to a square for grids)
+        rng (Random): Source of randomness
+    Output:
+        list_edges (list): (u, v) tuples, without duplicates or self-loops.
+                            Each edge is listed once, in one direction
+    '''
+
+    if kind == 'random':
+        set_edges = set()
+        while len(set_edges) < 3*n:
+            u, v = rng.randrange(n), rng.randrange(n)
+            if u != v:
+                set_edges.add((u, v))
+        return list(set_edges)
+
+    elif kind == 'grid':
+        side = int(n**0.5)
+        list_edges = []
+        for row in range(side):
+            for col in range(side):
+                vertex = row*side + col
+                if col + 1 < side:
+                    list_edges.append((vertex, vertex + 1))
+                if row + 1 < side:
+                    list_edges.append((vertex, vertex + side))
+        return list_edges
+
+    elif kind == 'power_law':
+        list_edges = [(0, 1), (1, 2), (0, 2)]
+        endpoints = [0, 1, 1, 2, 0, 2]  # Every vertex once per edge it has
+        for vertex in range(3, n):
+            targets = set()
+            while len(targets) < 2:
+                targets.add(endpoints[rng.randrange(len(endpoints))])
+            for target in targets:
+                list_edges.append((vertex, target))
+                endpoints += [vertex, target]
+        return list_edges
+
+    raise ValueError('Unknown graph kind: ' + kind)
+
+
+def adjacency_lists(list_edges):
+
+    '''
+    Function:
+        Convert a list of edges to the {vertex: [neighbours]} representation
+        of Graphs_DFS_BFS_SCC_ShortestPath.py. Every vertex is a key
+    '''
+
+    dict_graph = {}
+    for u, v in list_edges:
+        dict_graph.setdefault(u, []).append(v)
+        dict_graph.setdefault(v, [])
+
+    return dict_graph
+
+
+def weighted_edges(list_edges, rng):
+
+    '''
+    Function:
+        Convert a list of edges to the {(u, v): weight} representation of the
+        Dijkstra/Bellman-Ford and Kruskal/Prim scripts. Weights are floats in
+        (0, 1]: their heaps find the vertices by priority, so distances must
+        not tie, and must stay below the n + 1000 used for unreached vertices
+    '''
+
+    return {edge: 1 - rng.random() for edge in list_edges}
+
+
+def make_mix(n, rng):
+
+    '''
+    Function:
+        Generate n operations on keys in [0, n): half inserts, a quarter
+        deletes and a quarter lookups
+    Output:
+        list_ops (list): (operation, key) tuples, operation being 'insert',
+                            'delete' or 'lookup'
+    '''
+
+    list_ops = []
+    for _ in range(n):
+        draw = rng.random()
+        operation = 'insert' if draw < 0.5 else \
+            'delete' if draw < 0.75 else 'lookup'
+        list_ops.append((operation, rng.randrange(n)))
+
+    return list_ops
+
+
+# Cases
+
+def avl_cases():
+    # Distinct keys: the rotations of AVLTree don't handle duplicates
+    def tree_of(n, rng, kind='permutation'):
+        tree = load('AVL_Tree').AVLTree()
+        for value in make_array(kind, n, rng):
+            tree.insert(value)
+        return tree
+
+    def insert(kind):
+        def setup(n, rng, work_dir):
+            tree = load('AVL_Tree').AVLTree()
+            values = make_array(kind, n, rng)
+
+            def run():
+                for value in values:
+                    tree.insert(value)
+            return run
+        return setup
+
+    def queries(method):
+        def setup(n, rng, work_dir):
+            tree = tree_of(n, rng)
+            keys = [rng.randrange(n) for _ in range(NUM_QUERIES)]
+            return lambda: method(tree, keys)
+        return setup
+
+    def find(tree, keys):
+        for key in keys:
+            tree.find(key, tree.root)
+
+    def contains(tree, keys):
+        for key in keys:
+            key in tree
+
+    def delete(tree, keys):
+        for key in keys:
+            node = tree.find(key, tree.root)
+            if node.data == key:
+                tree.delete(node)
+
+    def range_search(tree, keys):
+        for key in keys:
+            tree.range_search(key, key + 10, tree.root)
+
+    def next_node(tree, keys):
+        for key in keys:
+            tree.next_node(tree.find(key, tree.root))
+
+    def previous_node(tree, keys):
+        for key in keys:
+            tree.previous_node(tree.find(key, tree.root))
+
+    def extremes(tree, keys):
+        for _ in keys:
+            tree.largest_element()
+            tree.smallest_element()
+
+    def traversal(name):
+        def setup(n, rng, work_dir):
+            tree = tree_of(n, rng)
+            return lambda: list(getattr(tree, name)())
+        return setup
+
+    def is_avl_tree(n, rng, work_dir):
+        tree = tree_of(n, rng)
+        return tree.is_AVL_Tree
+
+    def mix(n, rng, work_dir):
+        tree = tree_of(n//2, rng)
+        list_ops = make_mix(n, rng)
+
+        def run():
+            for operation, key in list_ops:
+                if operation == 'insert':
+                    if key not in tree:
+                        tree.insert(key)
+                elif tree.root is None:
+                    continue
+                elif operation == 'delete':
+                    node = tree.find(key, tree.root)
+                    if node.data == key:
+                        tree.delete(node)
+                else:
+                    key in tree
+        return run
+
+    list_cases = [Case('AVLTree.insert[' + kind + ']', insert(kind),
+                       'n log n') for kind in ('permutation', 'sorted')]
+
+    for name, method in (('find', find), ('contains', contains),
+                         ('delete', delete), ('range_search', range_search),
+                         ('next_node', next_node),
+                         ('previous_node', previous_node),
+                         ('largest_smallest_element', extremes)):
+        list_cases.append(Case('AVLTree.' + name + '[permutation]',
+                               queries(method), 'log n', fixed_queries))
+
+    for name in ('iter_in_order', 'iter_pre_order', 'iter_post_order',
+                 'iter_level_order'):
+        list_cases.append(Case('AVLTree.' + name + '[permutation]',
+                               traversal(name), 'n'))
+
+    list_cases.append(Case('AVLTree.is_AVL_Tree[permutation]', is_avl_tree,
+                           'n'))
+    list_cases.append(Case('AVLTree.mix[permutation]', mix, 'n log n'))
+
+    return list_cases
+
+
+def heap_cases():
+    def min_heap_of(n, rng):
+        heap = load('BinaryMinHeap').BinaryMinHeap(n)
+        heap.build_heap({i: value for i, value in
+                         enumerate(make_array('random', n, rng))})
+        return heap
+
+    def min_build_heap(n, rng, work_dir):
+        heap = load('BinaryMinHeap').BinaryMinHeap(n)
+        dict_mapping = {i: value for i, value in
+                        enumerate(make_array('random', n, rng))}
+        return lambda: heap.build_heap(dict_mapping)
+
+    def min_insert(n, rng, work_dir):
+        heap = load('BinaryMinHeap').BinaryMinHeap(n)
+        heap.build_heap({})  # Sets the size, as the graph scripts do
+        values = make_array('random', n, rng)
+
+        def run():
+            for i, value in enumerate(values):
+                heap.insert({i: value})
+        return run
+
+    def min_extract(n, rng, work_dir):
+        heap = min_heap_of(n, rng)
+
+        def run():
+            for _ in range(n):
+                heap.extract_min()
+        return run
+
+    def min_queries(method):
+        def setup(n, rng, work_dir):
+            heap = min_heap_of(n, rng)
+            indexes = [rng.randrange(n - NUM_QUERIES) for _ in
+                       range(NUM_QUERIES)]
+            return lambda: method(heap, indexes)
+        return setup
+
+    def min_get(heap, indexes):
+        for _ in indexes:
+            heap.get_min()
+
+    def min_change_priority(heap, indexes):
+        for idx in indexes:
+            heap.change_priority(idx, heap.heap[idx] - 1)
+
+    def min_remove(heap, indexes):
+        for idx in indexes:
+            if idx < heap.size:
+                heap.remove(idx)
+
+    def max_heap_of(n, rng):
+        heap = load('PriorityQueue_BinaryMaxHeap').BinaryMaxHeap(
+            n, auto_grow=True)
+        heap.build_heap(make_array('random', n, rng))
+        return heap
+
+    def max_build_heap(n, rng, work_dir):
+        heap = load('PriorityQueue_BinaryMaxHeap').BinaryMaxHeap(n)
+        values = make_array('random', n, rng)
+        return lambda: heap.build_heap(values)
+
+    def max_insert(n, rng, work_dir):
+        heap = load('PriorityQueue_BinaryMaxHeap').BinaryMaxHeap(n)
+        values = make_array('random', n, rng)
+
+        def run():
+            for value in values:
+                heap.insert(value)
+        return run
+
+    def max_extend(n, rng, work_dir):
+        heap = max_heap_of(n//2, rng)
+        values = make_array('random', n - n//2, rng)
+        return lambda: heap.extend(values)
+
+    def max_extract(n, rng, work_dir):
+        heap = max_heap_of(n, rng)
+
+        def run():
+            for _ in range(n):
+                heap.extract_max()
+        return run
+
+    def max_pop_many(n, rng, work_dir):
+        heap = max_heap_of(n, rng)
+        return lambda: heap.pop_many(n//2)
+
+    def max_merge(n, rng, work_dir):
+        heap = max_heap_of(n//2, rng)
+        other_heap = max_heap_of(n - n//2, rng)
+        return lambda: heap.merge(other_heap)
+
+    def max_queries(method):
+        def setup(n, rng, work_dir):
+            heap = max_heap_of(n, rng)
+            indexes = [rng.randrange(n - NUM_QUERIES) for _ in
+                       range(NUM_QUERIES)]
+            return lambda: method(heap, indexes)
+        return setup
+
+    def max_get(heap, indexes):
+        for _ in indexes:
+            heap.get_max()
+
+    def max_change_priority(heap, indexes):
+        for idx in indexes:
+            heap.change_priority(idx, heap.heap[idx] + 1)
+
+    def max_remove(heap, indexes):
+        for idx in indexes:
+            if idx < heap.size:
+                heap.remove(idx)
+
+    def heap_sort(kind):
+        def setup(n, rng, work_dir):
+            array = make_array(kind, n, rng)
+            heap_sort = load('PriorityQueue_BinaryMaxHeap').heap_sort
+            return lambda: heap_sort(array)
+        return setup
+
+    def k_largest(name):
+        def setup(n, rng, work_dir):
+            array = make_array('random', n, rng)
+            function = getattr(load('PriorityQueue_BinaryMaxHeap'), name)
+            return lambda: function(array, 100)
+        return setup
+
+    def max_mix(n, rng, work_dir):
+        heap = max_heap_of(n//2, rng)
+        list_ops = make_mix(n, rng)
+
+        def run():
+            for operation, key in list_ops:
+                if operation == 'insert':
+                    heap.insert(key)
+                elif heap.size == 0:
+                    continue
+                elif operation == 'delete':
+                    heap.extract_max()
+                else:
+                    heap.get_max()
+        return run
+
+    return [
+        Case('BinaryMinHeap.build_heap[random]', min_build_heap, 'n'),
+        Case('BinaryMinHeap.insert[random]', min_insert, 'n log n'),
+        Case('BinaryMinHeap.extract_min[random]', min_extract, 'n log n'),
+        Case('BinaryMinHeap.get_min[random]', min_queries(min_get), '1',
+             fixed_queries),
+        Case('BinaryMinHeap.change_priority[random]',
+             min_queries(min_change_priority), 'log n', fixed_queries),
+        Case('BinaryMinHeap.remove[random]', min_queries(min_remove),
+             'log n', fixed_queries),
+        Case('BinaryMaxHeap.build_heap[random]', max_build_heap, 'n'),
+        Case('BinaryMaxHeap.insert[random]', max_insert, 'n log n'),
+        Case('BinaryMaxHeap.extend[random]', max_extend, 'n'),
+        Case('BinaryMaxHeap.extract_max[random]', max_extract, 'n log n'),
+        Case('BinaryMaxHeap.pop_many[random]', max_pop_many, 'n log n'),
+        Case('BinaryMaxHeap.merge[random]', max_merge, 'n'),
+        Case('BinaryMaxHeap.get_max[random]', max_queries(max_get), '1',
+             fixed_queries),
+        Case('BinaryMaxHeap.change_priority[random]',
+             max_queries(max_change_priority), 'log n', fixed_queries),
+        Case('BinaryMaxHeap.remove[random]', max_queries(max_remove),
+             'log n', fixed_queries),
+        Case('BinaryMaxHeap.mix[random]', max_mix, 'n log n'),
+    ] + [Case('heap_sort[' + kind + ']', heap_sort(kind), 'n log n')
+         for kind in ('random', 'sorted', 'few_unique')] + \
+        [Case(name + '[random]', k_largest(name), 'n')
+         for name in ('k_largest_elements', 'k_largest_elements_parallel')]
+
+
+def disjoint_set_cases():
+    def sets_of(n):
+        disjoint_set = load('DisjointSets').DisjointSet()
+        for value in range(n):
+            disjoint_set.make_set(value)
+        return disjoint_set
+
+    def make_set(n, rng, work_dir):
+        disjoint_set = load('DisjointSets').DisjointSet()
+
+        def run():
+            for value in range(n):
+                disjoint_set.make_set(value)
+        return run
+
+    def union(n, rng, work_dir):
+        disjoint_set = sets_of(n)
+        pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(n)]
+
+        def run():
+            for i, j in pairs:
+                disjoint_set.union(i, j)
+        return run
+
+    def find(n, rng, work_dir):
+        disjoint_set = sets_of(n)
+        for _ in range(n):
+            disjoint_set.union(rng.randrange(n), rng.randrange(n))
+        keys = [rng.randrange(n) for _ in range(NUM_QUERIES)]
+
+        def run():
+            for key in keys:
+                disjoint_set.find(key)
+        return run
+
+    return [Case('DisjointSet.make_set', make_set, 'n'),
+            Case('DisjointSet.union[random]', union, 'n log n'),
+            Case('DisjointSet.find[random]', find, 'log n', fixed_queries)]
+
+
+def sort_cases():
+    list_kinds = ('random', 'sorted', 'reversed', 'nearly_sorted',
+                  'few_unique', 'organ_pipe')
+
+    def sort(name, kind):
+        def setup(n, rng, work_dir):
+            array = make_array(kind, n, rng)
+            merge_sort = load('MergeSort').MergeSort(array)
+            method = getattr(merge_sort, name)
+            return lambda: method(array)
+        return setup
+
+    def merge(n, rng, work_dir):
+        array1 = sorted(make_array('random', n//2, rng))
+        array2 = sorted(make_array('random', n - n//2, rng))
+        merge_sort = load('MergeSort').MergeSort(array1)
+        return lambda: merge_sort.merge(array1, array2)
+
+    def parallel(n, rng, work_dir):
+        array = make_array('random', n, rng)
+        parallel_merge_sort = load('MergeSort').parallel_merge_sort
+        return lambda: parallel_merge_sort(array, typecode='q')
+
+    def external(n, rng, work_dir):
+        input_path = os_path.join(work_dir, 'records.txt')
+        with open(input_path, 'wb') as file:
+            file.write(b'\n'.join(b'%d' % value for value in
+                                  make_array('random', n, rng)))
+        external_merge_sort = load('MergeSort').external_merge_sort
+        output_path = os_path.join(work_dir, 'sorted_records.txt')
+        return lambda: external_merge_sort(input_path, output_path,
+                                           memory_limit=1 << 20)
+
+    return [Case('MergeSort.' + name + '[' + kind + ']', sort(name, kind),
+                 'n log n')
+            for name in ('merge_sort', 'natural_merge_sort')
+            for kind in list_kinds] + [
+        Case('MergeSort.merge[random]', merge, 'n'),
+        Case('parallel_merge_sort[random]', parallel, 'n log n'),
+        Case('external_merge_sort[random]', external, 'n log n'),
+    ]
+
+
+def search_cases():
+    def queries(kind, n, rng):
+        array = make_array(kind, n, rng)
+        return array, [array[rng.randrange(n)] for _ in range(NUM_QUERIES)]
+
+    def class_search(name, kind):
+        def setup(n, rng, work_dir):
+            array, keys = queries(kind, n, rng)
+            BinarySearch = load('BinarySearch').BinarySearch
+
+            def run():
+                for key in keys:
+                    getattr(BinarySearch(array, key), name)()
+            return run
+        return setup
+
+    def function_search(name):
+        def setup(n, rng, work_dir):
+            array, keys = queries('sorted', n, rng)
+            function = getattr(load('BinarySearch'), name)
+
+            def run():
+                for key in keys:
+                    function(array, key)
+            return run
+        return setup
+
+    def search_many(n, rng, work_dir):
+        array = sorted(make_array('random', n, rng))
+        keys = make_array('random', n, rng)
+        function = load('BinarySearch').search_many
+        return lambda: function(array, keys)
+
+    def index_build(layout):
+        def setup(n, rng, work_dir):
+            array = make_array('sorted', n, rng)
+            SearchIndex = load('BinarySearch').SearchIndex
+            return lambda: SearchIndex(array, layout=layout)
+        return setup
+
+    def index_search(layout, name):
+        def setup(n, rng, work_dir):
+            array, keys = queries('sorted', n, rng)
+            method = getattr(load('BinarySearch').SearchIndex(
+                array, layout=layout), name)
+
+            def run():
+                for key in keys:
+                    method(key)
+            return run
+        return setup
+
+    def mapped_file(name):
+        def setup(n, rng, work_dir):
+            # Fixed-width records, searched in O(log n) (newline-delimited
+            # ones are scanned within blocks of fence_step bytes)
+            file_path = os_path.join(work_dir, 'sorted_records.txt')
+            with open(file_path, 'wb') as file:
+                file.write(b''.join(b'%012d\n' % value for value in range(n)))
+            sorted_file = load('BinarySearch').MappedSortedFile(
+                file_path, record_size=13)
+            method = getattr(sorted_file, name)
+            keys = [b'%012d\n' % rng.randrange(n)
+                    for _ in range(NUM_QUERIES)]
+
+            def run():
+                for key in keys:
+                    method(key)
+            return run
+        return setup
+
+    list_cases = [Case('BinarySearch.' + name + '[' + kind + ']',
+                       class_search(name, kind), 'log n', fixed_queries)
+                  for name, kind in (('binary_search', 'sorted'),
+                                     ('interpolation_search', 'sorted'),
+                                     ('interpolation_search', 'skewed'),
+                                     ('exponential_search', 'sorted'))]
+    list_cases += [Case(name + '[sorted]', function_search(name), 'log n',
+                        fixed_queries)
+                   for name in ('lower_bound', 'upper_bound', 'equal_range')]
+    list_cases.append(Case('search_many[random]', search_many, 'n log n'))
+
+    for layout in ('eytzinger', 'btree'):
+        list_cases.append(Case('SearchIndex.build[' + layout + ']',
+                               index_build(layout), 'n'))
+        for name in ('lower_bound', 'binary_search'):
+            list_cases.append(Case('SearchIndex.' + name + '[' + layout + ']',
+                                   index_search(layout, name), 'log n',
+                                   fixed_queries))
+
+    for name in ('lower_bound', 'binary_search'):
+        list_cases.append(Case('MappedSortedFile.' + name + '[sorted]',
+                               mapped_file(name), 'log n', fixed_queries))
+
+    return list_cases
+
+
+def graph_cases():
+    list_kinds = ('random', 'grid', 'power_law')
+
+    def traversal(name, kind):
+        def setup(n, rng, work_dir):
+            list_edges = make_edges(kind, n, rng)
+            if name == 'topological_sort':  # Needs a DAG
+                list_edges = [(min(edge), max(edge)) for edge in list_edges]
+            dict_graph = adjacency_lists(list_edges)
+            graph = load('Graphs_DFS_BFS_SCC_ShortestPath').Graph(dict_graph)
+
+            if name == 'breadth_first_search':
+                return lambda: graph.breadth_first_search(dict_graph, 0)
+
+            elif name == 'get_shortest_path':
+                destination = list_edges[-1][1]
+                return lambda: graph.get_shortest_path(dict_graph, 0,
+                                                       destination)
+
+            return lambda: getattr(graph, name)(dict_graph)
+        return setup
+
+    def shortest_path(name, kind):
+        def setup(n, rng, work_dir):
+            list_edges = make_edges(kind, n, rng)
+            graph = load('Graphs_Dijkstra_BellmanFord').Graph(
+                weighted_edges(list_edges, rng))
+            origin = list_edges[0][0]
+
+            if name == 'get_fastest_path':
+                destination = list_edges[-1][1]
+                return lambda: graph.get_fastest_path(origin, destination)
+
+            return lambda: getattr(graph, name)(origin)
+        return setup
+
+    def spanning_tree(name, kind):
+        def setup(n, rng, work_dir):
+            graph = load('Graphs_Kruskal_Prim_Algorithms').Graph(
+                weighted_edges(make_edges(kind, n, rng), rng))
+            return getattr(graph, name)
+        return setup
+
+    list_cases = []
+    for kind in list_kinds:
+        for name in ('depth_first_search', 'breadth_first_search',
+                     'reverse_graph', 'strongly_connected_componenets',
+                     'topological_sort', 'get_shortest_path'):
+            list_cases.append(Case('Graph.' + name + '[' + kind + ']',
+                                   traversal(name, kind), 'n'))
+
+        for name in ('dijkstra', 'get_fastest_path'):
+            list_cases.append(Case('Graph.' + name + '[' + kind + ']',
+                                   shortest_path(name, kind), 'n log n'))
+
+        # O(V*E): every edge is relaxed once per vertex
+        list_cases.append(Case('Graph.bellman_ford[' + kind + ']',
+                               shortest_path('bellman_ford', kind), 'n^2'))
+
+        for name in ('kruskal', 'prim'):
+            list_cases.append(Case('Graph.' + name + '[' + kind + ']',
+                                   spanning_tree(name, kind), 'n log n'))
+
+    return list_cases
+
+
+def linked_list_cases():
+    dict_classes = {
+        'SLinkedListWithTail': 'Singly_linked_list_with_tail',
+        'SLinkedListWithoutTail': 'Singly_linked_list_wo_tail',
+        'DLinkedListWithTail': 'Doubly_linked_list_with_tail',
+        'UnrolledLinkedList': 'Doubly_linked_list_with_tail',
+    }
+
+    def new_list(cls_name, **kwargs):
+        return getattr(load(dict_classes[cls_name]), cls_name)(**kwargs)
+
+    def list_of(cls_name, n, **kwargs):
+        llist = new_list(cls_name, **kwargs)
+        llist.populate_an_empty_list(list(range(n)))
+        return llist
+
+    def insert(cls_name, name):
+        def setup(n, rng, work_dir):
+            method = getattr(new_list(cls_name), name)
+
+            def run():
+                for value in range(n):
+                    method(value)
+            return run
+        return setup
+
+    def populate(cls_name):
+        def setup(n, rng, work_dir):
+            llist = new_list(cls_name)
+            values = list(range(n))
+            return lambda: llist.populate_an_empty_list(values)
+        return setup
+
+    def delete(cls_name, name):
+        def setup(n, rng, work_dir):
+            method = getattr(list_of(cls_name, n), name)
+
+            def run():
+                for _ in range(n):
+                    method()
+            return run
+        return setup
+
+    def search(cls_name, name):
+        def setup(n, rng, work_dir):
+            method = getattr(list_of(cls_name, n), name)
+            keys = [n//2 + i for i in range(NUM_QUERIES//10)]
+
+            def run():
+                for key in keys:
+                    method(key)
+            return run
+        return setup
+
+    def iterate(cls_name):
+        def setup(n, rng, work_dir):
+            llist = list_of(cls_name, n)
+            return lambda: list(llist)
+        return setup
+
+    def mix(cls_name):
+        def setup(n, rng, work_dir):
+            llist = list_of(cls_name, n//2, index=True)
+            list_ops = make_mix(n, rng)
+
+            def run():
+                for operation, key in list_ops:
+                    if operation == 'insert':
+                        llist.insert_element_at_start(key)
+                    elif operation == 'delete':
+                        llist.delete_node_from_middle(key)
+                    else:
+                        llist.is_element_present(key)
+            return run
+        return setup
+
+    list_cases = []
+    for cls_name in dict_classes:
+        singly = cls_name.startswith('S')
+        unrolled = cls_name == 'UnrolledLinkedList'
+        # O(chunk_size) per update for the unrolled list, O(n) per value at
+        # the end of a singly linked list without tail, and O(n) per delete
+        # at the end of a singly linked list
+        list_cases += [
+            Case(cls_name + '.insert_element_at_start',
+                 insert(cls_name, 'insert_element_at_start'), 'n'),
+            Case(cls_name + '.insert_element_at_end',
+                 insert(cls_name, 'insert_element_at_end'),
+                 'n^2' if cls_name == 'SLinkedListWithoutTail' else 'n'),
+            Case(cls_name + '.populate_an_empty_list', populate(cls_name),
+                 'n'),
+            Case(cls_name + '.delete_top_node',
+                 delete(cls_name, 'delete_top_node'), 'n'),
+            Case(cls_name + '.delete_last_node',
+                 delete(cls_name, 'delete_last_node'),
+                 'n^2' if singly else 'n'),
+            Case(cls_name + '.is_element_present',
+                 search(cls_name, 'is_element_present'), 'n',
+                 lambda n: NUM_QUERIES//10),
+            Case(cls_name + '.delete_node_from_middle',
+                 search(cls_name, 'delete_node_from_middle'), 'n',
+                 lambda n: NUM_QUERIES//10),
+            Case(cls_name + '.iter', iterate(cls_name), 'n'),
+        ]
+        if not unrolled:
+            # Index mode: O(1) lookups, deletes stay O(n) in singly lists
+            list_cases.append(Case(cls_name + '.mix[random, index]',
+                                   mix(cls_name), 'n^2' if singly else 'n'))
+
+    return list_cases
+
+
+def deque_and_skip_list_cases():
+    def deque_op(name):
+        def setup(n, rng, work_dir):
+            deque = load('Doubly_linked_list_with_tail').LinkedDeque(
+                range(n) if name.startswith('pop') else ())
+            method = getattr(deque, name)
+
+            if name.startswith('pop'):
+                def run():
+                    for _ in range(n):
+                        method()
+
+            else:
+                def run():
+                    for value in range(n):
+                        method(value)
+            return run
+        return setup
+
+    def rotate(n, rng, work_dir):
+        deque = load('Doubly_linked_list_with_tail').LinkedDeque(range(n))
+        return lambda: deque.rotate(n//3)
+
+    def skip_list_of(n, rng):
+        skip_list = load('Singly_linked_list_with_tail').SkipList()
+        for value in make_array('random', n, rng):
+            skip_list.insert(value)
+        return skip_list
+
+    def skip_insert(n, rng, work_dir):
+        skip_list = load('Singly_linked_list_with_tail').SkipList()
+        values = make_array('random', n, rng)
+
+        def run():
+            for value in values:
+                skip_list.insert(value)
+        return run
+
+    def skip_query(name):
+        def setup(n, rng, work_dir):
+            skip_list = skip_list_of(n, rng)
+            method = getattr(skip_list, name)
+            keys = [rng.randrange(n) for _ in range(NUM_QUERIES)]
+
+            if name == 'select':
+                keys = [key % len(skip_list) for key in keys]
+
+            elif name == 'range':
+                return lambda: [list(method(key, key + 10)) for key in keys]
+
+            def run():
+                for key in keys:
+                    method(key)
+            return run
+        return setup
+
+    return [Case('LinkedDeque.' + name, deque_op(name), 'n')
+            for name in ('append', 'appendleft', 'pop', 'popleft')] + [
+        Case('LinkedDeque.rotate', rotate, 'n', lambda n: 1),
+        Case('SkipList.insert[random]', skip_insert, 'n log n'),
+    ] + [Case('SkipList.' + name + '[random]', skip_query(name), 'log n',
+              fixed_queries)
+         for name in ('search', 'delete', 'rank', 'select', 'range')]
+
+
+def stack_and_queue_cases():
+    dict_classes = {
+        'Stack': 'Stack_array_implmentation',
+        'Stack (linked)': 'Stack_linked_list_implmentation',
+        'Queue': 'Queue_array_implementation',
+        'Queue (linked)': 'Queue_linked_list_implementation',
+        'BlockingStack': 'Stack_array_implmentation',
+        'BlockingQueue': 'Queue_array_implementation',
+    }
+    dict_methods = {
+        'Stack': ('push', 'pop', 'top'),
+        'Queue': ('enqueue', 'dequeue', 'display_front_element'),
+        'BlockingStack': ('put', 'get', None),
+        'BlockingQueue': ('put', 'get', None),
+    }
+
+    def new(name):
+        return getattr(load(dict_classes[name]), name.split()[0])()
+
+    def insert(name):
+        def setup(n, rng, work_dir):
+            method = getattr(new(name), dict_methods[name.split()[0]][0])
+
+            def run():
+                for value in range(n):
+                    method(value)
+            return run
+        return setup
+
+    def remove(name):
+        def setup(n, rng, work_dir):
+            structure = new(name)
+            insert_name, remove_name, _ = dict_methods[name.split()[0]]
+            for value in range(n):
+                getattr(structure, insert_name)(value)
+            method = getattr(structure, remove_name)
+
+            def run():
+                for _ in range(n):
+                    method()
+            return run
+        return setup
+
+    def peek(name):
+        def setup(n, rng, work_dir):
+            structure = new(name)
+            insert_name, _, peek_name = dict_methods[name.split()[0]]
+            for value in range(n):
+                getattr(structure, insert_name)(value)
+            method = getattr(structure, peek_name)
+
+            def run():
+                for _ in range(NUM_QUERIES):
+                    method()
+            return run
+        return setup
+
+    def mix(name):
+        def setup(n, rng, work_dir):
+            structure = new(name)
+            insert_name, remove_name, _ = dict_methods[name.split()[0]]
+            insert_method = getattr(structure, insert_name)
+            remove_method = getattr(structure, remove_name)
+            for value in range(n//2):
+                insert_method(value)
+            list_ops = make_mix(n, rng)
+
+            def run():
+                size = n//2
+                for operation, key in list_ops:
+                    if operation == 'insert':
+                        insert_method(key)
+                        size += 1
+                    elif size > 0:
+                        remove_method()
+                        size -= 1
+            return run
+        return setup
+
+    def many(name):
+        def setup(n, rng, work_dir):
+            structure = new(name)
+            if name == 'Queue':
+                return lambda: structure.dequeue_many(
+                    structure.enqueue_many(range(n)) or n)
+            return lambda: structure.get_many(
+                structure.put_many(range(n)) or n)
+        return setup
+
+    list_cases = []
+    for name in dict_classes:
+        methods = dict_methods[name.split()[0]]
+        list_cases += [Case(name + '.' + methods[0], insert(name), 'n'),
+                       Case(name + '.' + methods[1], remove(name), 'n')]
+        if methods[2] is not None:
+            list_cases.append(Case(name + '.' + methods[2], peek(name), '1',
+                                   fixed_queries))
+        list_cases.append(Case(name + '.mix[random]', mix(name), 'n'))
+
+    list_cases += [Case('Queue.enqueue_many_dequeue_many', many('Queue'),
+                        'n'),
+                   Case('BlockingQueue.put_many_get_many',
+                        many('BlockingQueue'), 'n')]
+
+    return list_cases
+
+
+def array_cases():
+    list_classes = ('Array', 'GapBufferArray', 'ChunkedArray')
+
+    def insert(cls_name, position):
+        def setup(n, rng, work_dir):
+            array = getattr(load('Array_operations'), cls_name)()
+
+            def run():
+                for value in range(n):
+                    if position == 'start':
+                        array.insert_element_at_start(value)
+                    elif position == 'end':
+                        array.insert_element_at_end(value)
+                    else:
+                        array.insert_element_at_given_index(value//2, value)
+            return run
+        return setup
+
+    def fetch(cls_name):
+        def setup(n, rng, work_dir):
+            array = getattr(load('Array_operations'), cls_name)()
+            array.extend(range(n))
+            indexes = [rng.randrange(n) for _ in range(NUM_QUERIES)]
+
+            def run():
+                for idx in indexes:
+                    array.fetch_value_at_index(idx)
+            return run
+        return setup
+
+    # Inserting at the start or in the middle is O(n) per value for Array,
+    # O(1) amortized at the cursor of the gap buffer (which moves by one
+    # position per insert in the middle) and O(log n + chunk_size) for
+    # ChunkedArray
+    dict_expected = {'Array': ('n^2', 'n^2'),
+                     'GapBufferArray': ('n', 'n'),
+                     'ChunkedArray': ('n log n', 'n log n')}
+
+    list_cases = []
+    for cls_name in list_classes:
+        start, middle = dict_expected[cls_name]
+        list_cases += [
+            Case(cls_name + '.insert_element_at_end',
+                 insert(cls_name, 'end'), 'n'),
+            Case(cls_name + '.insert_element_at_start',
+                 insert(cls_name, 'start'), start),
+            Case(cls_name + '.insert_element_at_given_index[middle]',
+                 insert(cls_name, 'middle'), middle),
+            Case(cls_name + '.fetch_value_at_index[random]', fetch(cls_name),
+                 'log n' if cls_name == 'ChunkedArray' else '1',
+                 fixed_queries),
+        ]
+
+    return list_cases
+
+
+def list_all_cases():
+
+    '''
+    Function:
+        Build the list of all the benchmark cases. The scripts they exercise
+        are only imported when a case is run
+    '''
+
+    return avl_cases() + heap_cases() + disjoint_set_cases() + \
+        sort_cases() + search_cases() + graph_cases() + \
+        linked_list_cases() + deque_and_skip_list_cases() + \
+        stack_and_queue_cases() + array_cases()
+
+
+# Measurements
+
+def fit_exponent(sizes, values):
+
+    '''
+    Function:
+        Least squares slope of log(values) against log(sizes)
+    Output:
+        The slope, None if there are fewer than 2 points
+    '''
+
+    if len(sizes) < 2:
+        return None
+
+    xs = [log(size) for size in sizes]
+    ys = [log(value) for value in values]
+    x_mean = sum(xs)/len(xs)
+    y_mean = sum(ys)/len(ys)
+    covariance = sum((x - x_mean)*(y - y_mean) for x, y in zip(xs, ys))
+    variance = sum((x - x_mean)**2 for x in xs)
+
+    return covariance/variance
+
+
+def time_case(case, n, seed, repeat, work_dir):
+
+    '''
+    Function:
+        Run the setup and the timed function of a case repeat times, each time
+        on a fresh input. The garbage collector is disabled while timing, as
+        timeit does
+    Output:
+        Best time of the timed function and best total time (with the setup),
+        in seconds
+    '''
+
+    best_time = best_total = float('inf')
+
+    for i in range(repeat):
+        start = perf_counter()
+        run = case.setup(n, Random(seed + i), work_dir)
+
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            run_start = perf_counter()
+            run()
+            run_time = perf_counter() - run_start
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        best_time = min(best_time, run_time)
+        best_total = min(best_total, perf_counter() - start)
+
+    return best_time, best_total
+
+
+def run_case(case, sizes, seed, repeat, budget, work_dir, tolerance):
+
+    '''
+    Function:
+        Time a case for increasing sizes from its min_size, as long as the
+        next size is expected to fit the time budget (per repeat, setup
+        included). The time of the next size is extrapolated with the worse
+        of the declared complexity and the exponent measured between the last
+        two sizes
+    Output:
+        dict_result (dict): Sizes, seconds, seconds per operation, fitted and
+                            expected exponents, error message if the case
+                            raised an exception and the list of regressions
+    '''
+
+    complexity = dict_complexities[case.expected]
+    dict_result = {'expected': case.expected, 'sizes': [], 'seconds': [],
+                   'seconds_per_op': [], 'error': None}
+    last_total = None
+
+    for n in sizes:
+        if n < case.min_size:
+            continue
+
+        if last_total is not None:
+            last_n = dict_result['sizes'][-1]
+            growth = max(complexity(n)/complexity(last_n), n/last_n)
+            if len(dict_result['sizes']) >= 2 and \
+                    min(dict_result['seconds'][-2:]) >= MIN_TIME:
+                local_exponent = fit_exponent(dict_result['sizes'][-2:],
+                                              dict_result['seconds'][-2:])
+                growth = max(growth, (n/last_n)**local_exponent)
+            if last_total*growth > budget:
+                break
+
+        try:
+            seconds, last_total = time_case(case, n, seed, repeat, work_dir)
+        except Exception as error:  # Recorded, the other cases still run
+            dict_result['error'] = type(error).__name__ + ': ' + str(error)
+            break
+
+        dict_result['sizes'].append(n)
+        dict_result['seconds'].append(seconds)
+        dict_result['seconds_per_op'].append(seconds/max(case.ops(n), 1))
+
+    fit_sizes = [n for n, seconds in zip(dict_result['sizes'],
+                                         dict_result['seconds'])
+                 if seconds >= MIN_TIME]
+    fit_seconds = [seconds for seconds in dict_result['seconds']
+                   if seconds >= MIN_TIME]
+    exponent = fit_exponent(fit_sizes, fit_seconds)
+    expected_exponent = fit_exponent(
+        fit_sizes, [max(complexity(n), 1) for n in fit_sizes])
+
+    dict_result['exponent'] = exponent
+    dict_result['expected_exponent'] = expected_exponent
+    dict_result['regressions'] = []
+
+    if exponent is not None and exponent > expected_exponent + tolerance:
+        dict_result['regressions'].append(
+            'scales as n^' + str(round(exponent, 2)) + ', expected ' +
+            case.expected + ' (n^' + str(round(expected_exponent, 2)) + ')')
+
+    return dict_result
+
+
+def compare_to_baseline(dict_results, dict_baseline, tolerance, slowdown):
+
+    '''
+    Function:
+        Add to the regressions of each case those found against a previous
+        run: an exponent larger by more than tolerance, or a time more than
+        slowdown times longer at a size measured in both runs
+    '''
+
+    for name, dict_result in dict_results.items():
+        dict_old = dict_baseline.get(name)
+        if dict_old is None:
+            continue
+
+        if dict_result['exponent'] is not None and \
+                dict_old.get('exponent') is not None and \
+                dict_result['exponent'] > dict_old['exponent'] + tolerance:
+            dict_result['regressions'].append(
+                'exponent went from ' + str(round(dict_old['exponent'], 2)) +
+                ' to ' + str(round(dict_result['exponent'], 2)))
+
+        dict_old_seconds = dict(zip(dict_old['sizes'], dict_old['seconds']))
+        for n, seconds in zip(dict_result['sizes'], dict_result['seconds']):
+            old_seconds = dict_old_seconds.get(n)
+            if old_seconds is not None and seconds >= MIN_TIME and \
+                    seconds > slowdown*old_seconds:
+                dict_result['regressions'].append(
+                    str(round(seconds/old_seconds, 1)) + 'x slower at n=' +
+                    str(n))
+
+
+def plot_results(dict_results, plot_dir):
+
+    '''
+    Function:
+        Save one log-log plot of time against n per structure (the part of
+        the case names before the first dot) in plot_dir. Needs matplotlib
+    '''
+
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print('matplotlib is not installed, no plots were made')
+        return
+
+    dict_groups = {}
+    for name, dict_result in dict_results.items():
+        if dict_result['sizes']:
+            dict_groups.setdefault(name.split('.')[0].split('[')[0],
+                                   []).append(name)
+
+    for group, names in dict_groups.items():
+        figure, axes = plt.subplots(figsize=(8, 6))
+        for name in names:
+            axes.loglog(dict_results[name]['sizes'],
+                        dict_results[name]['seconds'], marker='o',
+                        label=name[len(group):].lstrip('.') or name)
+        axes.set_xlabel('n')
+        axes.set_ylabel('seconds')
+        axes.set_title(group)
+        axes.legend(fontsize='small')
+        figure.savefig(os_path.join(plot_dir, re.sub(r'\W+', '_', group) +
+                                    '.png'), dpi=100)
+        plt.close(figure)
+
+
+def format_size(n):
+    exponent = round(log(n, 10))
+    return '1e' + str(exponent) if 10**exponent == n else str(n)
+
+
+def parse_size(text):
+    return int(float(text))
+
+
+def main(args=None):
+    parser = ArgumentParser(description='Time the public operations of the '
+                            'data structures and algorithms for growing '
+                            'input sizes')
+    parser.add_argument('patterns', nargs='*',
+                        help='Only run the cases whose name matches one of '
+                             'these regular expressions')
+    parser.add_argument('--list', action='store_true',
+                        help='List the cases and exit')
+    parser.add_argument('--sizes', type=lambda text: [
+                        parse_size(size) for size in text.split(',')],
+                        default=list(DEFAULT_SIZES),
+                        help='Comma separated sizes, eg. 1e2,1e3,1e4')
+    parser.add_argument('--max-size', type=parse_size, default=None)
+    parser.add_argument('--budget', type=float, default=1.0,
+                        help='Seconds a size may take (per repeat, setup '
+                             'included) for the case to be run at it')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per size, the best time is kept')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--tolerance', type=float, default=0.4,
+                        help='Exponent excess flagged as a regression')
+    parser.add_argument('--slowdown', type=float, default=2.0,
+                        help='Time ratio to the baseline flagged as a '
+                             'regression')
+    parser.add_argument('--json', help='Write the results to this file')
+    parser.add_argument('--plot', help='Directory to save the plots in')
+    parser.add_argument('--baseline', help='Results of a previous run')
+    args = parser.parse_args(args)
+
+    list_cases = [case for case in list_all_cases()
+                  if not args.patterns or
+                  any(re.search(pattern, case.name)
+                      for pattern in args.patterns)]
+
+    if args.list:
+        for case in list_cases:
+            print(case.name + ': ' + case.expected)
+        return 0
+
+    sizes = sorted(n for n in args.sizes
+                   if args.max_size is None or n <= args.max_size)
+
+    dict_results = {}
+    with TemporaryDirectory() as work_dir:
+        for case in list_cases:
+            dict_result = run_case(case, sizes, args.seed, args.repeat,
+                                   args.budget, work_dir, args.tolerance)
+            dict_results[case.name] = dict_result
+
+            line = case.name + ':'
+            for n, per_op in zip(dict_result['sizes'],
+                                 dict_result['seconds_per_op']):
+                line += ' ' + format_size(n) + ' ' + \
+                    str(round(per_op*1e6, 3)) + 'us'
+            if dict_result['exponent'] is not None:
+                line += ' | n^' + str(round(dict_result['exponent'], 2)) + \
+                    ' (' + case.expected + ')'
+            if dict_result['error'] is not None:
+                line += ' | ' + dict_result['error']
+            print(line, flush=True)
+
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            dict_baseline = json.load(file)['results']
+        compare_to_baseline(dict_results, dict_baseline, args.tolerance,
+                            args.slowdown)
+
+    if args.json is not None:
+        with open(args.json, 'w') as file:
+            json.dump({'python': platform.python_version(),
+                       'platform': platform.platform(),
+                       'seed': args.seed, 'repeat': args.repeat,
+                       'budget': args.budget, 'results': dict_results},
+                      file, indent=1)
+
+    if args.plot is not None:
+        plot_results(dict_results, args.plot)
+
+    list_regressions = [(name, regression)
+                        for name, dict_result in dict_results.items()
+                        for regression in dict_result['regressions']]
+    list_errors = [(name, dict_result['error'])
+                   for name, dict_result in dict_results.items()
+                   if dict_result['error'] is not None]
+
+    print()
+    print(str(len(dict_results)) + ' cases, ' + str(len(list_regressions)) +
+          ' regressions, ' + str(len(list_errors)) + ' errors')
+    for name, regression in list_regressions:
+        print('REGRESSION ' + name + ': ' + regression)
+    for name, error in list_errors:
+        print('ERROR ' + name + ': ' + error)
+
+    return 1 if list_regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())